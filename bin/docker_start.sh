@@ -13,6 +13,9 @@ uwsgi_port=${UWSGI_PORT:-8000}
 uwsgi_processes=${UWSGI_PROCESSES:-4}
 uwsgi_threads=${UWSGI_THREADS:-1}
 
+# wsgi (uwsgi) or asgi (uvicorn)
+server_interface=${SERVER_INTERFACE:-wsgi}
+
 mountpoint=${SUBPATH:-/}
 
 until pg_isready; do
@@ -26,12 +29,11 @@ done
 >&2 echo "Apply database migrations"
 python src/manage.py migrate
 
-# Load fixtures distributed in the image
+# Load fixtures distributed in the image, unchanged fixtures are skipped
 echo "Loading required fixtures"
-python src/manage.py loaddata \
+python src/manage.py load_value_list_fixtures \
     information_categories \
-    themes
-python src/manage.py load_organisations \
+    themes \
     organisations
 
 # Load any JSON fixtures present in the configured fixtures dir
@@ -58,6 +60,20 @@ if [ -n "${ODRC_SUPERUSER_USERNAME}" ]; then
 fi
 
 # Start server
+if [ "$server_interface" = "asgi" ]; then
+    >&2 echo "Starting ASGI server"
+    # file transfers are awaited rather than occupying a worker, static files must be
+    # served by the reverse proxy
+    export ASYNC_FILE_TRANSFERS=${ASYNC_FILE_TRANSFERS:-True}
+    exec python -m uvicorn woo_publications.asgi:application \
+        --app-dir src \
+        --host 0.0.0.0 \
+        --port $uwsgi_port \
+        --workers $uwsgi_processes \
+        --root-path "${SUBPATH:-}" \
+        --proxy-headers
+fi
+
 >&2 echo "Starting server"
 exec uwsgi \
     --http :$uwsgi_port \
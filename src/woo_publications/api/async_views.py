@@ -0,0 +1,99 @@
+"""
+Serve long-running file transfers from async views.
+
+DRF views are synchronous. Served by an ASGI server, a synchronous view occupies a
+thread for as long as it takes to produce the response - for a file transfer, that's
+the duration of the transfer. The views created with :func:`async_transfer_view` run
+the DRF view (authentication, permissions, validation...) in a thread as usual, but
+the DRF view defers the transfer itself, which is awaited in the event loop.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse, HttpResponseBase
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+from rest_framework.viewsets import ViewSetMixin
+
+__all__ = ["AsyncTransferMixin", "PendingTransfer", "async_transfer_view"]
+
+type Transfer = Callable[[], Awaitable[HttpResponseBase]]
+
+
+class PendingTransfer(HttpResponse):
+    """
+    Placeholder for the response of a transfer that is performed asynchronously.
+
+    Returned by a DRF view to hand the transfer to the async view, which awaits it.
+    """
+
+    def __init__(self, view: APIView, transfer: Transfer):
+        super().__init__()
+        self.view = view
+        self.transfer = transfer
+
+    def finalize(self, outcome: HttpResponseBase | Exception) -> HttpResponseBase:
+        """
+        Finalize the response (or exception) of the transfer like the DRF view would.
+        """
+        view = self.view
+        response = (
+            view.handle_exception(outcome)
+            if isinstance(outcome, Exception)
+            else outcome
+        )
+        return view.finalize_response(view.request, response, *view.args, **view.kwargs)
+
+
+class AsyncTransferMixin:
+    transfer_async: bool = False
+    """
+    Whether the transfers are deferred to the async view, set by
+    :func:`async_transfer_view`.
+    """
+
+    def defer_transfer(self, transfer: Transfer) -> PendingTransfer:
+        assert self.transfer_async, "Transfers are only deferred to async views."
+        assert isinstance(self, APIView)
+        return PendingTransfer(self, transfer)
+
+
+def async_transfer_view(
+    viewset: type[ViewSetMixin], actions: dict[str, str], *, basename: str
+) -> Callable[..., Awaitable[HttpResponseBase]]:
+    """
+    Build an async view for the viewset actions that transfer (file) contents.
+
+    The actions must support deferring the transfer with
+    :meth:`AsyncTransferMixin.defer_transfer`.
+
+    :param viewset: the viewset with the (extra) actions.
+    :param actions: the mapping of HTTP methods to the actions, like
+      :meth:`ViewSetMixin.as_view`.
+    :param basename: the basename of the viewset in the router.
+    """
+    assert issubclass(viewset, AsyncTransferMixin)
+    # the configuration of the actions, like the router passes it
+    initkwargs: dict[str, Any] = {"basename": basename}
+    for action_name in actions.values():
+        action = getattr(viewset, action_name)
+        initkwargs.update(action.kwargs, detail=action.detail)
+    view = viewset.as_view(actions, transfer_async=True, **initkwargs)
+
+    async def transfer_view(
+        request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        response = await sync_to_async(view)(request, *args, **kwargs)
+        if not isinstance(response, PendingTransfer):
+            return response
+        try:
+            outcome = await response.transfer()
+        except Exception as exc:
+            outcome = exc
+        return await sync_to_async(response.finalize)(outcome)
+
+    # like DRF views, authentication is handled by the DRF view rather than sessions
+    transfer_view.csrf_exempt = True  # pyright: ignore[reportFunctionMemberAccess]
+    return transfer_view
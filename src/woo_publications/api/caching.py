@@ -0,0 +1,176 @@
+"""
+Cache the responses of read-only API endpoints for (nearly) static data.
+
+The serialized data of the list and detail responses is kept in the Django (Redis)
+cache, keyed by the requested URL, its query parameters and the negotiated media type.
+Each group of endpoints has a generation in the cache, which is part of the key of its
+cached responses. Changing the data sets a new generation, which makes the previously
+cached responses unreachable - they expire eventually.
+
+The responses have a strong ``ETag`` derived from the cache key, clients can
+revalidate them with ``If-None-Match``. Without a generation, e.g. because Redis is
+unavailable, the responses are neither cached nor tagged.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import models, transaction
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+__all__ = ["CachedResponseMixin", "get_generation", "invalidate"]
+
+_GENERATION_CACHE_KEY = "woo_publications:api-responses:{namespace}:generation"
+_RESPONSE_CACHE_KEY = "woo_publications:api-responses:{namespace}:{digest}"
+
+
+def get_generation(namespace: str) -> str | None:
+    """
+    Get the current generation of the cached responses in the namespace.
+    """
+    key = _GENERATION_CACHE_KEY.format(namespace=namespace)
+    if (generation := cache.get(key)) is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def _set_new_generation(namespace: str) -> None:
+    key = _GENERATION_CACHE_KEY.format(namespace=namespace)
+    cache.set(key, uuid4().hex, timeout=None)
+
+
+def invalidate(namespace: str) -> None:
+    """
+    Discard the cached responses in the namespace.
+
+    The new generation is set again once the transaction is committed, so that the
+    responses cached (with the old data) in the meantime are discarded too.
+    """
+    _set_new_generation(namespace)
+    transaction.on_commit(lambda: _set_new_generation(namespace))
+
+
+@dataclass
+class _CachedResponse:
+    data: Any
+    etag: str
+    object_ref: tuple[int, Any] | None
+    """
+    The content type ID and primary key of the retrieved object, which detail
+    responses are audited with.
+    """
+
+    def get_object(self) -> models.Model | None:
+        """
+        Get a minimal instance of the retrieved object, only its primary key is set.
+        """
+        if self.object_ref is None:
+            return None
+        content_type_id, pk = self.object_ref
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        assert model is not None
+        return model(pk=pk)
+
+
+class CachedResponseMixin:
+    """
+    Cache the data of the list and retrieve responses of a viewset.
+
+    Invalidate the cached responses with :func:`invalidate` and the
+    :attr:`cache_namespace` of the viewset when the data changes. Permissions are
+    checked before the cache is consulted.
+    """
+
+    cache_namespace: str
+    request: Request
+    action: str | None
+    kwargs: dict[str, Any]
+
+    def list(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        get_response = super().list  # pyright: ignore[reportAttributeAccessIssue]
+        return self._get_cached_response(
+            request, partial(get_response, request, *args, **kwargs)
+        )
+
+    def retrieve(self, request: Request, *args, **kwargs) -> HttpResponseBase:
+        get_response = super().retrieve  # pyright: ignore[reportAttributeAccessIssue]
+        return self._get_cached_response(
+            request, partial(get_response, request, *args, **kwargs)
+        )
+
+    def get_object(self):
+        # the object of a cached detail response, or the object loaded by the
+        # retrieve - it's looked up only once per request
+        if (instance := getattr(self, "_cached_response_object", None)) is None:
+            instance = (
+                super().get_object()
+            )  # pyright: ignore[reportAttributeAccessIssue]
+            self._cached_response_object = instance
+        return instance
+
+    def _get_cache_key(self, request: Request, generation: str) -> str:
+        components = {
+            "generation": generation,
+            "action": self.action,
+            "kwargs": sorted((key, str(value)) for key, value in self.kwargs.items()),
+            # the pagination links are absolute URLs
+            "url": request.build_absolute_uri(request.path),
+            "query": sorted(request.query_params.lists()),
+            "media_type": request.accepted_media_type,
+        }
+        serialized = json.dumps(components, sort_keys=True)
+        digest = hashlib.md5(serialized.encode(), usedforsecurity=False).hexdigest()
+        return _RESPONSE_CACHE_KEY.format(namespace=self.cache_namespace, digest=digest)
+
+    def _get_cached_response(
+        self, request: Request, get_response: Callable[[], Response]
+    ) -> HttpResponseBase:
+        if (generation := get_generation(self.cache_namespace)) is None:
+            return get_response()
+
+        key = self._get_cache_key(request, generation)
+        cached: _CachedResponse | None = cache.get(key)
+        if cached is None:
+            response = get_response()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            object_ref = None
+            if self.action == "retrieve":
+                instance = self.get_object()
+                object_ref = (
+                    ContentType.objects.get_for_model(instance).pk,
+                    instance.pk,
+                )
+            cached = _CachedResponse(
+                data=response.data,
+                etag=quote_etag(key.rsplit(":", 1)[-1]),
+                object_ref=object_ref,
+            )
+            cache.set(key, cached, timeout=settings.API_RESPONSE_CACHE_TIMEOUT)
+        else:
+            self._cached_response_object = cached.get_object()
+
+        # 304 Not Modified
+        if conditional_response := get_conditional_response(
+            request,  # pyright: ignore[reportArgumentType]
+            etag=cached.etag,
+        ):
+            conditional_response.headers["ETag"] = cached.etag
+            return conditional_response
+
+        return Response(cached.data, headers={"ETag": cached.etag})
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from djangorestframework_camel_case.middleware import CamelCaseMiddleWare
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize_re, underscore_to_camel
+
+__all__ = ["camelize_parameters"]
+
+
+def _has_camel_case_middleware() -> bool:
+    return any(
+        isinstance(middleware, type) and issubclass(middleware, CamelCaseMiddleWare)
+        for middleware in map(import_string, settings.MIDDLEWARE)
+    )
+
+
+def camelize_parameters(result, generator, request, public):
+    """
+    Camelize the names of the query parameters if the camel case middleware, or a
+    subclass of it, is installed.
+
+    Complements
+    :func:`drf_spectacular.contrib.djangorestframework_camel_case.camelize_serializer_fields`,
+    which only detects the original middleware. Names are camelized the same way,
+    so camelizing them again doesn't change them.
+    """
+    if not _has_camel_case_middleware():
+        return result
+
+    ignore_keys = api_settings.JSON_UNDERSCOREIZE.get("ignore_keys") or ()
+    for url_schema in result["paths"].values():
+        for method_schema in url_schema.values():
+            for parameter in method_schema.get("parameters", []):
+                if (name := parameter["name"]) in ignore_keys:
+                    continue
+                parameter["name"] = camelize_re.sub(underscore_to_camel, name)
+    return result
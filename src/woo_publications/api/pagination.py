@@ -1,6 +1,148 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class DynamicPageSizePagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class OptionalCursorPagination(DynamicPageSizePagination):
+    """
+    Page number pagination with an opt-in keyset (cursor) mode.
+
+    Clients switch to the cursor mode by passing the ``cursor`` query parameter - an
+    empty value requests the first page, after which the ``next`` links must be
+    followed. Records are ordered (descending) on :attr:`cursor_ordering` and the
+    primary key as tie-breaker. Each page is fetched with a range condition on those
+    columns instead of an ``OFFSET``, and the total count is not calculated, so
+    fetching a page takes the same time no matter how deep the client has paged.
+
+    Make sure a database index exists on ``(cursor_ordering, pk)``.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Opt in to cursor based pagination. Pass an empty value for the first page "
+        "and follow the `next` links for the subsequent pages. In this mode, the "
+        "total `count` is not included in the response and the results are always "
+        "sorted from new to old - the `sorteer` parameter is ignored."
+    )
+    invalid_cursor_message = _("Invalid cursor.")
+
+    cursor_ordering: str = ""
+    """
+    The model field to order the records on, in descending order.
+    """
+
+    cursor: tuple[str, int] | None = None
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> list | None:
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        assert self.cursor_ordering, "The 'cursor_ordering' attribute must be set."
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        position = self.decode_cursor(request)
+        queryset = queryset.order_by(f"-{self.cursor_ordering}", "-pk")
+        if position is not None:
+            queryset = queryset.filter(self._get_keyset_condition(queryset, position))
+
+        # fetch one extra record to find out if there is a next page
+        results = list(queryset[: page_size + 1])
+        has_next = len(results) > page_size
+        results = results[:page_size]
+        self.cursor = self._get_position(results[-1]) if has_next else None
+        return results
+
+    def get_paginated_response(self, data) -> Response:
+        if self.cursor_query_param not in self.request.query_params:
+            return super().get_paginated_response(data)
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # the count is omitted in cursor mode
+        response_schema["required"] = ["results"]
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
+
+    def get_next_link(self) -> str | None:
+        if self.cursor_query_param not in self.request.query_params:
+            return super().get_next_link()
+        if self.cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.cursor)
+        )
+
+    def get_previous_link(self) -> str | None:
+        if self.cursor_query_param not in self.request.query_params:
+            return super().get_previous_link()
+        # keyset pagination only walks forward, restart from the first page instead
+        return None
+
+    def encode_cursor(self, position: tuple[str, int]) -> str:
+        return urlsafe_b64encode(json.dumps(position).encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request: Request) -> tuple[str, int] | None:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+        try:
+            value, pk = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+        if not isinstance(value, str) or not isinstance(pk, int):
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+
+    def _get_position(self, instance: Model) -> tuple[str, int]:
+        value = getattr(instance, self.cursor_ordering)
+        assert isinstance(instance.pk, int)
+        return value.isoformat(), instance.pk
+
+    def _get_keyset_condition(self, queryset: QuerySet, position: tuple[str, int]) -> Q:
+        field = queryset.model._meta.get_field(self.cursor_ordering)
+        raw_value, pk = position
+        try:
+            value = field.to_python(raw_value)
+        except ValidationError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        # equivalent to the row comparison (field, pk) < (value, pk), with the
+        # redundant first condition allowing an index range scan
+        name = self.cursor_ordering
+        return Q(**{f"{name}__lte": value}) & (
+            Q(**{f"{name}__lt": value}) | Q(**{name: value, "pk__lt": pk})
+        )
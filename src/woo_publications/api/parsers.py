@@ -0,0 +1,122 @@
+from collections.abc import Iterator
+
+from django.conf import settings
+from django.http import QueryDict
+from django.http.multipartparser import (
+    FIELD,
+    FILE,
+    ChunkIter,
+    LazyStream,
+    MultiPartParserError,
+    Parser,
+    exhaust,
+)
+from django.utils.datastructures import MultiValueDict
+from django.utils.encoding import force_str
+from django.utils.http import parse_header_parameters
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, DataAndFiles
+
+__all__ = ["StreamedFile", "StreamingMultiPartParser"]
+
+# read the request body in chunks of 64 kB
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StreamedFile:
+    """
+    A file in a multipart request body that is read while it's received.
+
+    The content can only be consumed once, with :meth:`chunks` or :meth:`read`. The
+    size is unknown until the content has been consumed.
+    """
+
+    size: int | None = None
+
+    def __init__(self, stream: LazyStream, name: str, content_type: str):
+        self._stream = stream
+        self.name = name
+        self.content_type = content_type
+
+    def __repr__(self):
+        return f"<StreamedFile: {self.name} ({self.content_type})>"
+
+    def chunks(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        # the chunk size is determined by the parser
+        yield from self._stream
+
+    def read(self, size: int | None = None) -> bytes:
+        return self._stream.read(size)
+
+    def close(self) -> None:
+        pass
+
+
+class StreamingMultiPartParser(BaseParser):
+    """
+    Parse multipart form data without buffering the file contents.
+
+    The form fields are parsed until the first file is encountered, which is
+    exposed as :class:`StreamedFile`. Its content is read from the request body when
+    it's consumed, rather than being written to memory or disk first, so the file
+    must be the last part of the form data. Subsequent parts are ignored.
+    """
+
+    media_type = "multipart/form-data"
+
+    def parse(self, stream, media_type=None, parser_context=None) -> DataAndFiles:
+        if stream is None:  # empty body
+            return DataAndFiles(QueryDict(), MultiValueDict())
+
+        _, params = parse_header_parameters(media_type or "")
+        boundary = params.get("boundary", "")
+        if not boundary:
+            raise ParseError("Multipart form parse error - missing boundary.")
+
+        data = QueryDict(mutable=True)
+        files = MultiValueDict()
+        body = LazyStream(ChunkIter(stream, STREAM_CHUNK_SIZE))
+        try:
+            for item_type, meta_data, field_stream in Parser(
+                body, boundary.encode("ascii")
+            ):
+                try:
+                    disposition = meta_data["content-disposition"][1]
+                    field_name = force_str(disposition["name"], errors="replace")
+                except (KeyError, IndexError, AttributeError):
+                    continue
+                if "content-transfer-encoding" in meta_data:
+                    raise ParseError(
+                        "Multipart form parse error - transfer encodings are not "
+                        "supported."
+                    )
+
+                if item_type == FIELD:
+                    data.appendlist(field_name.strip(), self._read_field(field_stream))
+                elif item_type == FILE and (file_name := disposition.get("filename")):
+                    content_type, _ = meta_data.get("content-type", ("", {}))
+                    files[field_name.strip()] = StreamedFile(
+                        field_stream,
+                        name=force_str(file_name, errors="replace"),
+                        content_type=content_type.strip(),
+                    )
+                    break
+                else:
+                    exhaust(field_stream)
+        except (MultiPartParserError, UnicodeEncodeError) as exc:
+            raise ParseError(f"Multipart form parse error - {exc}") from exc
+
+        data._mutable = False
+        return DataAndFiles(data, files)
+
+    @staticmethod
+    def _read_field(field_stream: LazyStream) -> str:
+        max_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        value = field_stream.read(None if max_size is None else max_size + 1)
+        if max_size is not None and len(value) > max_size:
+            raise ParseError(
+                "Multipart form parse error - field exceeds "
+                "settings.DATA_UPLOAD_MAX_MEMORY_SIZE."
+            )
+        return value.decode("utf-8", "replace")
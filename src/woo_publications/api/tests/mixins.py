@@ -1,5 +1,9 @@
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -280,6 +284,61 @@ class APITestCaseMixin:
             )
 
 
+class ConstantQueryCountMixin:
+    """
+    Check that the number of queries of a list endpoint doesn't depend on the number
+    of records in the response.
+    """
+
+    client: APIClient
+
+    def assertListQueryCountIsConstant(
+        self,
+        url: str,
+        create_records: Callable[[int], Any],
+        sizes: Sequence[int] = (1, 10, 100),
+    ) -> None:
+        """
+        Grow the result list to each of ``sizes`` and compare the query counts.
+
+        The page size is set to the number of records, so every record in the
+        database is serialized.
+
+        :param url: the list endpoint to call.
+        :param create_records: callback to create the given number of extra records
+          that show up in the list response.
+        :param sizes: the (increasing) number of records to check the endpoint with.
+        """
+        num_queries: dict[int, int] = {}
+        num_records = 0
+        for size in sizes:
+            create_records(size - num_records)
+            if not num_records:
+                # warm up the caches (e.g. for configuration lookups), so that only
+                # the queries depending on the result list are compared
+                self.client.get(url, headers=AUDIT_HEADERS)
+            num_records = size
+
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    url, {"page_size": size}, headers=AUDIT_HEADERS
+                )
+
+            self.assertEqual(  # pyright: ignore[reportAttributeAccessIssue]
+                response.status_code, status.HTTP_200_OK
+            )
+            self.assertEqual(  # pyright: ignore[reportAttributeAccessIssue]
+                len(response.json()["results"]), size
+            )
+            num_queries[size] = len(context.captured_queries)
+
+        self.assertEqual(  # pyright: ignore[reportAttributeAccessIssue]
+            len(set(num_queries.values())),
+            1,
+            f"Number of queries per number of records: {num_queries}",
+        )
+
+
 class TokenAuthMixin:
     client: APIClient
 
@@ -0,0 +1,84 @@
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+
+from rest_framework.exceptions import ParseError
+
+from ..parsers import STREAM_CHUNK_SIZE, StreamedFile, StreamingMultiPartParser
+
+
+class CountingStream(BytesIO):
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class StreamingMultiPartParserTests(SimpleTestCase):
+    def _parse(self, stream, media_type=MULTIPART_CONTENT):
+        return StreamingMultiPartParser().parse(stream, media_type=media_type)
+
+    def test_fields_and_file(self):
+        body = encode_multipart(
+            BOUNDARY,
+            {
+                "lock": "abc123",
+                "inhoud": SimpleUploadedFile(
+                    "dummy.txt", b"aAaAa", content_type="text/plain"
+                ),
+            },
+        )
+
+        result = self._parse(BytesIO(body))
+
+        self.assertEqual(result.data["lock"], "abc123")
+        file = result.files["inhoud"]
+        assert isinstance(file, StreamedFile)
+        self.assertEqual(file.name, "dummy.txt")
+        self.assertEqual(file.content_type, "text/plain")
+        self.assertIsNone(file.size)
+        self.assertEqual(b"".join(file.chunks()), b"aAaAa")
+
+    def test_file_content_is_read_when_consumed(self):
+        content = b"A" * (20 * STREAM_CHUNK_SIZE)
+        body = encode_multipart(
+            BOUNDARY, {"inhoud": SimpleUploadedFile("large.bin", content)}
+        )
+        stream = CountingStream(body)
+
+        result = self._parse(stream)
+
+        self.assertLess(stream.bytes_read, 2 * STREAM_CHUNK_SIZE)
+
+        with self.subTest("chunks are bounded"):
+            chunk_sizes = [len(chunk) for chunk in result.files["inhoud"].chunks()]
+
+            self.assertEqual(sum(chunk_sizes), len(content))
+            self.assertLessEqual(max(chunk_sizes), STREAM_CHUNK_SIZE)
+
+    def test_file_without_name_is_ignored(self):
+        body = (
+            f"--{BOUNDARY}\r\n"
+            'Content-Disposition: form-data; name="inhoud"; filename=""\r\n'
+            "\r\n"
+            "aAaAa\r\n"
+            f"--{BOUNDARY}--\r\n"
+        ).encode()
+
+        result = self._parse(BytesIO(body))
+
+        self.assertNotIn("inhoud", result.files)
+
+    def test_empty_body(self):
+        result = self._parse(None)
+
+        self.assertFalse(result.data)
+        self.assertFalse(result.files)
+
+    def test_missing_boundary(self):
+        with self.assertRaises(ParseError):
+            self._parse(BytesIO(b"foo"), media_type="multipart/form-data")
@@ -1,3 +1,6 @@
+from django.conf import settings
+from django.test import override_settings
+
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
@@ -12,3 +15,21 @@ class APIschemaGenerationTests(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_query_parameters_camelized_with_async_capable_middleware(self):
+        middleware = [
+            settings.ASYNC_CAPABLE_MIDDLEWARE.get(name, name)
+            for name in settings.MIDDLEWARE
+        ]
+        url = reverse("api:api-schema-json")
+
+        with override_settings(MIDDLEWARE=middleware):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        parameters = response.json()["paths"]["/api/v1/publicaties"]["get"][
+            "parameters"
+        ]
+        names = {parameter["name"] for parameter in parameters}
+        self.assertIn("pageSize", names)
+        self.assertNotIn("page_size", names)
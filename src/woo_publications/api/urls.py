@@ -1,9 +1,11 @@
+from django.conf import settings
 from django.urls import include, path
 from django.views.generic import RedirectView
 
 from drf_spectacular.views import SpectacularJSONAPIView, SpectacularRedocView
 from rest_framework import routers
 
+from woo_publications.api.async_views import async_transfer_view
 from woo_publications.metadata.api.viewsets import (
     InformationCategoryViewSet,
     OrganisationViewSet,
@@ -46,3 +48,21 @@ urlpatterns = [
     ),
     path("v1/", include(router.urls)),
 ]
+
+if settings.ASYNC_FILE_TRANSFERS:
+    # take precedence over the (synchronous) viewset actions of the router
+    urlpatterns = [
+        path(
+            "v1/documenten/<uuid:uuid>/download",
+            async_transfer_view(
+                DocumentViewSet, {"get": "download"}, basename="document"
+            ),
+        ),
+        path(
+            "v1/documenten/<uuid:uuid>/bestandsdelen/<uuid:part_uuid>",
+            async_transfer_view(
+                DocumentViewSet, {"put": "file_part"}, basename="document"
+            ),
+        ),
+        *urlpatterns,
+    ]
@@ -0,0 +1,16 @@
+"""
+ASGI config for woo_publications project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+"""
+
+from django.core.asgi import get_asgi_application
+
+from woo_publications.setup import setup_env
+
+setup_env()
+
+application = get_asgi_application()
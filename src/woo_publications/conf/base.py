@@ -36,11 +36,10 @@ INSTALLED_APPS.remove("notifications_api_common")
 
 MIDDLEWARE = MIDDLEWARE + [
     "hijack.middleware.HijackUserMiddleware",
-    # NOTE: affects *all* requests, not just API calls. We can't subclass (yet) either
-    # to modify the behaviour, since drf-spectacular has a bug in its `issubclass`
-    # check, which is unreleased at the time of writing:
-    # https://github.com/tfranzel/drf-spectacular/commit/71c7a04ee8921c01babb11fbe2938397a372dac7
+    # NOTE: affects *all* requests, not just API calls. Replaced by an async-capable
+    # subclass under ASGI, see ASYNC_FILE_TRANSFERS.
     "djangorestframework_camel_case.middleware.CamelCaseMiddleWare",
+    "woo_publications.logging.middleware.AuditLogBufferMiddleware",
 ]
 
 # Remove unused/irrelevant middleware added by OAF
@@ -80,6 +79,65 @@ INSPANNINGSVERPLICHTING_IDENTIFIER = (
     "https://identifier.overheid.nl/tooi/def/thes/kern/c_816e508d"
 )
 
+# The maximum number of concurrent requests to the Documents API when registering
+# documents in bulk.
+DOCUMENTS_API_MAX_CONCURRENT_REQUESTS = config(
+    "DOCUMENTS_API_MAX_CONCURRENT_REQUESTS", default=4
+)
+
+# The maximum number of connections to keep alive per Documents API service. Should
+# be at least DOCUMENTS_API_MAX_CONCURRENT_REQUESTS.
+DOCUMENTS_API_POOL_MAXSIZE = config("DOCUMENTS_API_POOL_MAXSIZE", default=10)
+
+# The number of seconds a Documents API client (and its authentication token) is
+# reused before a new one is built.
+DOCUMENTS_API_CLIENT_MAX_AGE = config("DOCUMENTS_API_CLIENT_MAX_AGE", default=300)
+
+# The bounds (in bytes) of the chunks read from the Documents API when streaming the
+# file contents of a document. The chunk size scales with the size of the file.
+DOWNLOAD_MIN_CHUNK_SIZE = config("DOWNLOAD_MIN_CHUNK_SIZE", default=8_192)
+DOWNLOAD_MAX_CHUNK_SIZE = config("DOWNLOAD_MAX_CHUNK_SIZE", default=1_048_576)
+
+# Serve the document downloads and file part uploads from async views, so that they
+# don't occupy a worker for the duration of the transfer. Requires an ASGI server.
+ASYNC_FILE_TRANSFERS = config("ASYNC_FILE_TRANSFERS", default=False)
+
+# The async-capable equivalents of the synchronous-only middleware, which don't occupy
+# a thread for the duration of the async views. Only installed under ASGI, under WSGI
+# the original middleware is used.
+ASYNC_CAPABLE_MIDDLEWARE = {
+    "sessionprofile.middleware.SessionProfileMiddleware": (
+        "woo_publications.utils.middleware.SessionProfileMiddleware"
+    ),
+    "maykin_2fa.middleware.OTPMiddleware": (
+        "woo_publications.utils.middleware.OTPMiddleware"
+    ),
+    "djangorestframework_camel_case.middleware.CamelCaseMiddleWare": (
+        "woo_publications.utils.middleware.CamelCaseMiddleware"
+    ),
+}
+if ASYNC_FILE_TRANSFERS:
+    MIDDLEWARE = [ASYNC_CAPABLE_MIDDLEWARE.get(name, name) for name in MIDDLEWARE]
+
+# The number of seconds changes are held back from the change feeds. The modification
+# timestamps are set before the transaction is committed, a change is only reported
+# once it's (most likely) committed so consumers don't skip it.
+CHANGE_FEED_SAFETY_LAG = config("CHANGE_FEED_SAFETY_LAG", default=5)
+
+# The maximum total size (in bytes) of the downloaded document contents cached on disk,
+# in PRIVATE_MEDIA_ROOT. Cached files are served by the web server through
+# django-sendfile2. Disabled with 0.
+DOCUMENT_CONTENT_CACHE_MAX_SIZE = config("DOCUMENT_CONTENT_CACHE_MAX_SIZE", default=0)
+
+# The number of seconds the responses of the information category, organisation and
+# theme endpoints are cached. Cached responses are discarded when the data changes.
+API_RESPONSE_CACHE_TIMEOUT = config("API_RESPONSE_CACHE_TIMEOUT", default=60 * 60)
+
+# How the audit log records are written: "synchronous" inserts every record right away,
+# "buffered" collects the records of a request and inserts them with a single query
+# once the request is handled and its changes are committed.
+AUDIT_LOG_SINK = config("AUDIT_LOG_SINK", default="synchronous")
+
 ##############################
 #                            #
 # 3RD PARTY LIBRARY SETTINGS #
@@ -227,6 +285,7 @@ purposes:
     "POSTPROCESSING_HOOKS": [
         "drf_spectacular.hooks.postprocess_schema_enums",
         "drf_spectacular.contrib.djangorestframework_camel_case.camelize_serializer_fields",
+        "woo_publications.api.drf_spectacular.hooks.camelize_parameters",
     ],
     "SERVE_INCLUDE_SCHEMA": False,
     "CAMELIZE_NAMES": True,
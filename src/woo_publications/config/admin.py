@@ -2,9 +2,18 @@ from django.contrib import admin
 
 from solo.admin import SingletonModelAdmin
 
-from .models import GlobalConfiguration
+from woo_publications.logging.service import AdminAuditLogMixin
+
+from .models import GlobalConfiguration, ServiceTimeouts
 
 
 @admin.register(GlobalConfiguration)
 class GlobalConfigurationAdmin(SingletonModelAdmin):
     pass
+
+
+@admin.register(ServiceTimeouts)
+class ServiceTimeoutsAdmin(AdminAuditLogMixin, admin.ModelAdmin):
+    list_display = ("service", "connect_timeout", "read_timeout")
+    list_select_related = ("service",)
+    autocomplete_fields = ("service",)
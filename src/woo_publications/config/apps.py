@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    name = "woo_publications.config"
+
+    def ready(self):
+        from . import signals  # noqa
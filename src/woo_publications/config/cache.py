@@ -0,0 +1,144 @@
+"""
+Process-level cache of the global configuration and the Documents API services.
+
+Creating and downloading documents needs the global configuration and the Documents
+API service, including its certificates and timeouts. They rarely change, so they're
+kept in memory rather than queried for every request.
+
+The cached objects are tagged with the configuration version, which is stored in the
+(shared) Django cache. Changing the configuration, a service or its related objects
+sets a new version, which discards the cached objects of every process on their next
+access. If the version can't be determined, e.g. because Redis is unavailable, the
+objects are loaded from the database instead.
+
+The cached instances are shared - treat them as read-only.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from zgw_consumers.models import Service
+
+from .models import GlobalConfiguration
+
+__all__ = [
+    "configuration_cache",
+    "get_global_configuration",
+    "get_service",
+]
+
+VERSION_CACHE_KEY = "woo_publications:config:version"
+
+
+@dataclass
+class ConfigurationCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class ConfigurationCache:
+    """
+    Process-level registry of the configuration objects, tagged with the version of
+    the configuration they were loaded for.
+    """
+
+    def __init__(self):
+        self._version: str | None = None
+        self._objects: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.stats = ConfigurationCacheStats()
+
+    def _get_version(self) -> str | None:
+        if (version := cache.get(VERSION_CACHE_KEY)) is None:
+            cache.add(VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+            version = cache.get(VERSION_CACHE_KEY)
+        return version
+
+    def get[T](self, key: Hashable, load: Callable[[], T]) -> T:
+        """
+        Get the cached object, loading (and caching) it if it's not cached yet.
+        """
+        version = self._get_version()
+        with self._lock:
+            if version is not None and version == self._version:
+                if key in self._objects:
+                    self.stats.hits += 1
+                    return self._objects[key]
+            self.stats.misses += 1
+
+        value = load()
+        if version is None:
+            return value
+
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._objects.clear()
+            self._objects[key] = value
+        return value
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached objects in all processes.
+
+        The new version is set again once the transaction is committed, so that
+        processes that reloaded the (uncommitted) old objects in the meantime
+        discard them too.
+        """
+        self._set_new_version()
+        transaction.on_commit(self._set_new_version)
+
+    def _set_new_version(self) -> None:
+        cache.set(VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Discard the cached objects of this process.
+        """
+        with self._lock:
+            self._version = None
+            self._objects.clear()
+
+
+configuration_cache = ConfigurationCache()
+
+
+def _load_service(pk: int) -> Service | None:
+    return (
+        Service.objects.select_related(
+            "client_certificate", "server_certificate", "timeouts"
+        )
+        .filter(pk=pk)
+        .first()
+    )
+
+
+def get_service(pk: int) -> Service | None:
+    """
+    Get the service, including its certificates and timeouts.
+    """
+    return configuration_cache.get(("service", pk), lambda: _load_service(pk))
+
+
+def _load_global_configuration() -> GlobalConfiguration:
+    config = GlobalConfiguration.get_solo()
+    service_id: int | None = (
+        config.documents_api_service_id  # pyright: ignore[reportAttributeAccessIssue]
+    )
+    if service_id is not None:
+        config.documents_api_service = get_service(service_id)
+    return config
+
+
+def get_global_configuration() -> GlobalConfiguration:
+    """
+    Get the global configuration, including the Documents API service.
+    """
+    return configuration_cache.get("global_configuration", _load_global_configuration)
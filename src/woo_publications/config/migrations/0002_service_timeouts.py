@@ -0,0 +1,60 @@
+# Generated by Django 4.2.17 on 2026-10-18 11:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zgw_consumers", "0022_set_default_service_slug"),
+        ("config", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ServiceTimeouts",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "connect_timeout",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        help_text="The number of seconds to wait for a connection to the service. Defaults to the timeout of the service.",
+                        null=True,
+                        verbose_name="connect timeout",
+                    ),
+                ),
+                (
+                    "read_timeout",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        help_text="The number of seconds to wait for the service to send data, e.g. while streaming file contents. Defaults to the timeout of the service.",
+                        null=True,
+                        verbose_name="read timeout",
+                    ),
+                ),
+                (
+                    "service",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="timeouts",
+                        to="zgw_consumers.service",
+                        verbose_name="service",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "service timeouts",
+                "verbose_name_plural": "service timeouts",
+            },
+        ),
+    ]
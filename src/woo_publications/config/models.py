@@ -43,3 +43,55 @@ class GlobalConfiguration(SingletonModel):
 
     def __str__(self) -> str:
         return force_str(self._meta.verbose_name)
+
+
+class ServiceTimeouts(models.Model):
+    """
+    Separate connect and read timeouts for the requests to a service.
+
+    The timeout of the service itself is used for both when no separate timeouts
+    are configured. Establishing a connection should be quick, while reading
+    (large) file contents may legitimately take longer between two packets.
+    """
+
+    service = models.OneToOneField(
+        "zgw_consumers.Service",
+        on_delete=models.CASCADE,
+        related_name="timeouts",
+        verbose_name=_("service"),
+    )
+    connect_timeout = models.PositiveSmallIntegerField(
+        _("connect timeout"),
+        help_text=_(
+            "The number of seconds to wait for a connection to the service. Defaults "
+            "to the timeout of the service."
+        ),
+        null=True,
+        blank=True,
+    )
+    read_timeout = models.PositiveSmallIntegerField(
+        _("read timeout"),
+        help_text=_(
+            "The number of seconds to wait for the service to send data, e.g. while "
+            "streaming file contents. Defaults to the timeout of the service."
+        ),
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("service timeouts")
+        verbose_name_plural = _("service timeouts")
+
+    def __str__(self) -> str:
+        return force_str(self.service)
+
+    def as_requests_timeout(self) -> tuple[int, int]:
+        """
+        Get the ``(connect, read)`` timeout tuple for the requests library.
+        """
+        default = self.service.timeout
+        return (
+            default if self.connect_timeout is None else self.connect_timeout,
+            default if self.read_timeout is None else self.read_timeout,
+        )
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from simple_certmanager.models import Certificate
+from zgw_consumers.models import Service
+
+from .cache import configuration_cache
+from .models import GlobalConfiguration, ServiceTimeouts
+
+
+@receiver([post_save, post_delete], sender=GlobalConfiguration)
+@receiver([post_save, post_delete], sender=Service)
+@receiver([post_save, post_delete], sender=ServiceTimeouts)
+@receiver([post_save, post_delete], sender=Certificate)
+def invalidate_configuration_cache(sender, **kwargs) -> None:
+    configuration_cache.invalidate()
@@ -8,8 +8,10 @@ from django_webtest import WebTest
 from maykin_2fa.test import disable_admin_mfa
 
 from woo_publications.accounts.tests.factories import UserFactory
+from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
 
-from ..models import GlobalConfiguration
+from ..cache import configuration_cache
+from ..models import GlobalConfiguration, ServiceTimeouts
 
 
 @disable_admin_mfa()
@@ -22,6 +24,7 @@ class SmokeTests(WebTest):
     def setUp(self):
         super().setUp()
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
 
     def test_initial_config_creation_does_not_crash(self):
         assert not GlobalConfiguration.objects.exists(), "Expected no config to exist"
@@ -33,3 +36,14 @@ class SmokeTests(WebTest):
             GlobalConfiguration.objects.exists(),
             "Expected the configuration instance to be created",
         )
+
+    def test_service_timeouts_changelist(self):
+        ServiceTimeouts.objects.create(
+            service=ServiceFactory.create(label="Documents API"), read_timeout=120
+        )
+        url = reverse("admin:config_servicetimeouts_changelist")
+
+        response = self.app.get(url, user=self.user)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Documents API")
@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from zgw_consumers.constants import APITypes
+
+from woo_publications.contrib.documents_api.client import client_pool, get_client
+from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
+
+from ..cache import (
+    VERSION_CACHE_KEY,
+    configuration_cache,
+    get_global_configuration,
+    get_service,
+)
+from ..models import GlobalConfiguration, ServiceTimeouts
+
+
+class ConfigurationCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.service = ServiceFactory.create(api_type=APITypes.drc, timeout=15)
+        config = GlobalConfiguration.get_solo()
+        config.documents_api_service = cls.service
+        config.organisation_rsin = "000000000"
+        config.save()
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
+        self.addCleanup(client_pool.clear)
+        self.addCleanup(cache.clear)
+
+    def test_global_configuration_is_cached(self):
+        get_global_configuration()
+
+        with self.assertNumQueries(0):
+            config = get_global_configuration()
+
+        self.assertEqual(config.organisation_rsin, "000000000")
+        self.assertEqual(config.documents_api_service, self.service)
+
+    def test_client_of_cached_service_is_built_without_queries(self):
+        ServiceTimeouts.objects.create(service=self.service, read_timeout=120)
+        service = get_service(self.service.pk)
+        assert service is not None
+
+        with self.assertNumQueries(0):
+            client = get_client(service)
+
+        self.assertEqual(client.timeout, (15, 120))
+
+    def test_unknown_service(self):
+        self.assertIsNone(get_service(0))
+
+    def test_saving_configuration_invalidates_cache(self):
+        get_global_configuration()
+        config = GlobalConfiguration.get_solo()
+
+        config.organisation_rsin = "100000009"
+        config.save()
+
+        self.assertEqual(get_global_configuration().organisation_rsin, "100000009")
+
+    def test_saving_service_invalidates_cache(self):
+        get_global_configuration()
+
+        self.service.timeout = 30
+        self.service.save()
+
+        config = get_global_configuration()
+        assert config.documents_api_service is not None
+        self.assertEqual(config.documents_api_service.timeout, 30)
+
+    def test_invalidated_by_other_process(self):
+        get_global_configuration()
+        # another process changed the configuration
+        GlobalConfiguration.objects.update(organisation_rsin="100000009")
+        GlobalConfiguration.clear_cache()
+        cache.set(VERSION_CACHE_KEY, "new-version")
+
+        with self.assertNumQueries(2):
+            config = get_global_configuration()
+
+        self.assertEqual(config.organisation_rsin, "100000009")
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_not_cached_without_version(self):
+        get_service(self.service.pk)
+        hits = configuration_cache.stats.hits
+
+        with self.assertNumQueries(1):
+            get_service(self.service.pk)
+
+        self.assertEqual(configuration_cache.stats.hits, hits)
@@ -0,0 +1,189 @@
+"""
+Transfer file contents to and from the Documents API with an async HTTP client.
+
+Downloading or uploading large files takes as long as the slowest party in the
+transfer. Served by an ASGI server, these transfers are awaited rather than holding
+a worker (thread) for their duration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import threading
+import weakref
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from django.conf import settings
+from django.core.files import File
+
+import certifi
+import httpx
+import requests
+from zgw_consumers.models import Service
+
+from woo_publications.api.parsers import STREAM_CHUNK_SIZE, StreamedFile
+
+from .client import DocumentenClient, MultipartFormData, get_client
+
+__all__ = ["AsyncDocumentenClient", "get_async_client"]
+
+# the body is sent by httpx, the body headers of the prepared (sync) request don't
+# apply - only those explicitly passed
+_BODY_HEADERS = frozenset({"content-length", "transfer-encoding"})
+
+
+def _build_ssl_context(client: DocumentenClient) -> ssl.SSLContext | bool:
+    # mirror the (mTLS) configuration of the requests session
+    if client.verify is False:
+        return False
+    context = ssl.create_default_context(
+        cafile=client.verify if isinstance(client.verify, str) else certifi.where()
+    )
+    match client.cert:
+        case (str() as certfile, str() as keyfile):
+            context.load_cert_chain(certfile, keyfile)
+        case str() as certfile:
+            context.load_cert_chain(certfile)
+    return context
+
+
+def _build_timeout(client: DocumentenClient) -> httpx.Timeout:
+    timeout = client.timeout
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+
+
+async def _iter_body(body: MultipartFormData) -> AsyncIterator[bytes]:
+    while chunk := body.read(STREAM_CHUNK_SIZE):
+        yield chunk
+
+
+class AsyncDocumentenClient:
+    """
+    Perform the file transfers of a Documents API asynchronously.
+
+    The requests are prepared by the (sync) client of the service, which takes care
+    of the base URL, NLX rewrites and authentication, and are then sent by an httpx
+    client with the same TLS configuration and timeouts. The httpx client is bound to
+    the event loop it's first used in, and replaced when it's used in another loop.
+    """
+
+    def __init__(self, client: DocumentenClient):
+        self.client = client
+        self._http: httpx.AsyncClient | None = None
+        self._loop: weakref.ref[asyncio.AbstractEventLoop] | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._loop is None or self._loop() is not loop:
+            self._http = httpx.AsyncClient(
+                verify=_build_ssl_context(self.client),
+                timeout=_build_timeout(self.client),
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.DOCUMENTS_API_POOL_MAXSIZE
+                ),
+            )
+            self._loop = weakref.ref(loop)
+        return self._http
+
+    async def send(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        content: AsyncIterator[bytes] | None = None,
+    ) -> httpx.Response:
+        """
+        Send the request, without reading the response body yet.
+
+        The caller must close the response with :meth:`httpx.Response.aclose`.
+        """
+        prepared = self.client.prepare_request(
+            requests.Request(method, self.client.to_absolute_url(path), headers=headers)
+        )
+        prepared_headers = {
+            name: value
+            for name, value in prepared.headers.items()
+            if name.lower() not in _BODY_HEADERS
+        }
+        prepared_headers.update(headers or {})
+        http_client = self._get_http_client()
+        request = http_client.build_request(
+            method,
+            prepared.url or "",
+            headers=prepared_headers,
+            content=content,
+        )
+        return await http_client.send(request, stream=True)
+
+    async def download(
+        self, *, document_uuid: UUID, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """
+        Request the file content of the document, without reading it yet.
+        """
+        return await self.send(
+            "GET",
+            f"enkelvoudiginformatieobjecten/{document_uuid}/download",
+            headers=headers,
+        )
+
+    async def proxy_file_part_upload(
+        self,
+        file: File | StreamedFile,
+        *,
+        file_part_uuid: UUID,
+        lock: str,
+    ) -> None:
+        """
+        Proxy the file part upload to the Documents API.
+
+        The async equivalent of :meth:`DocumentenClient.proxy_file_part_upload`.
+
+        :raises httpx.HTTPStatusError: if the Documents API rejects the file part.
+        """
+        body = MultipartFormData(
+            fields={"lock": lock},
+            file_field="inhoud",
+            file=file,
+        )
+        headers = {"Content-Type": body.content_type}
+        if (length := getattr(body, "len", None)) is not None:
+            headers["Content-Length"] = str(length)
+        response = await self.send(
+            "PUT",
+            f"bestandsdelen/{file_part_uuid}",
+            headers=headers,
+            content=_iter_body(body),
+        )
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        response.raise_for_status()
+
+
+_async_clients: weakref.WeakKeyDictionary[DocumentenClient, AsyncDocumentenClient] = (
+    weakref.WeakKeyDictionary()
+)
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client(service: Service) -> AsyncDocumentenClient:
+    """
+    Get the async client for the Documents API of the service.
+
+    The async client is tied to the (pooled) sync client of the service - it's
+    replaced along with it. Call this from synchronous code, building the client
+    may require database queries.
+    """
+    client = get_client(service)
+    if not client.pooled:
+        return AsyncDocumentenClient(client)
+    with _async_clients_lock:
+        if (async_client := _async_clients.get(client)) is None:
+            async_client = _async_clients[client] = AsyncDocumentenClient(client)
+    return async_client
@@ -1,23 +1,188 @@
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date
-from uuid import UUID
+from itertools import chain
+from uuid import UUID, uuid4
 
+from django.conf import settings
 from django.core.files import File
 
 from furl import furl
+from requests.adapters import HTTPAdapter
+from urllib3.fields import format_multipart_header_param
 from zgw_consumers.client import build_client
 from zgw_consumers.models import Service
 from zgw_consumers.nlx import NLXClient
 
+from woo_publications.api.parsers import StreamedFile
+
 from .typing import EIOCreateBody, EIOCreateResponseBody, EIORetrieveBody
 
-__all__ = ["get_client"]
+__all__ = ["get_client", "client_pool"]
+
+# The service fields that determine the configuration of a client.
+_CLIENT_CONFIG_FIELDS = (
+    "api_root",
+    "client_id",
+    "secret",
+    "auth_type",
+    "header_key",
+    "header_value",
+    "nlx",
+    "user_id",
+    "user_representation",
+    "client_certificate_id",
+    "server_certificate_id",
+)
 
 
 def get_client(service: Service) -> DocumentenClient:
-    return build_client(service, client_factory=DocumentenClient)
+    """
+    Get a client for the Documents API of the service.
+
+    Clients of saved services are reused from the :data:`client_pool`, which keeps the
+    HTTP connections alive between requests. Using the client as context manager is
+    still supported, but does not close the connections of a pooled client.
+    """
+    if service.pk is None:
+        return _build_client(service)
+    return client_pool.get(service)
+
+
+def _build_client(service: Service) -> DocumentenClient:
+    return build_client(
+        service, client_factory=DocumentenClient, timeout=get_timeout(service)
+    )
+
+
+def get_timeout(service: Service) -> int | tuple[int, int]:
+    """
+    Get the timeout for the requests to the service.
+
+    Separate connect and read timeouts are used if they're configured for the
+    service, otherwise the timeout of the service applies to both.
+    """
+    # reverse one-to-one relation, ``RelatedObjectDoesNotExist`` is an AttributeError
+    if (timeouts := getattr(service, "timeouts", None)) is None:
+        return service.timeout
+    return timeouts.as_requests_timeout()
+
+
+def get_config_fingerprint(service: Service) -> str:
+    """
+    Hash the configuration of the service that is used to build a client.
+
+    The effective timeout is included, so changes to the separate connect and read
+    timeouts of the service replace the pooled clients too.
+    """
+    config = {field: getattr(service, field) for field in _CLIENT_CONFIG_FIELDS}
+    config["timeout"] = get_timeout(service)
+    serialized = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ClientPoolStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _PooledClient:
+    client: DocumentenClient
+    fingerprint: str
+    created: float
+
+
+class ClientPool:
+    """
+    Process-level registry of Documents API clients, one per service.
+
+    A client is reused as long as the configuration of its service is unchanged and
+    it's younger than ``settings.DOCUMENTS_API_CLIENT_MAX_AGE`` seconds - the ZGW
+    authentication token is generated when the client is built and expires
+    eventually. Each client keeps up to ``settings.DOCUMENTS_API_POOL_MAXSIZE``
+    connections alive, so concurrent requests (e.g. from multiple threads) to the
+    same API don't need to set up new TCP/TLS connections.
+    """
+
+    def __init__(self):
+        self._clients: dict[int, _PooledClient] = {}
+        self._lock = threading.Lock()
+        self.stats = ClientPoolStats()
+
+    def get(self, service: Service) -> DocumentenClient:
+        assert service.pk is not None, "Only clients of saved services can be pooled."
+        fingerprint = get_config_fingerprint(service)
+        now = time.monotonic()
+
+        with self._lock:
+            pooled = self._clients.get(service.pk)
+            if (
+                pooled is not None
+                and pooled.fingerprint == fingerprint
+                and now - pooled.created < settings.DOCUMENTS_API_CLIENT_MAX_AGE
+            ):
+                self.stats.hits += 1
+                return pooled.client
+
+            self.stats.misses += 1
+            if pooled is not None:
+                pooled.client.close()
+            client = self._build_client(service)
+            self._clients[service.pk] = _PooledClient(
+                client=client, fingerprint=fingerprint, created=now
+            )
+            return client
+
+    def invalidate(self, service_pk: int) -> None:
+        """
+        Discard the client of the service, closing its connections.
+        """
+        with self._lock:
+            pooled = self._clients.pop(service_pk, None)
+            if pooled is None:
+                return
+            self.stats.invalidations += 1
+        pooled.client.close()
+
+    def clear(self) -> None:
+        """
+        Discard all clients, closing their connections.
+        """
+        with self._lock:
+            pooled_clients = list(self._clients.values())
+            self._clients.clear()
+            self.stats.invalidations += len(pooled_clients)
+        for pooled in pooled_clients:
+            pooled.client.close()
+
+    @staticmethod
+    def _build_client(service: Service) -> DocumentenClient:
+        client = _build_client(service)
+        # the client outlives any ``with`` block - it's entered once, so the session
+        # is not closed after a request, only when the client is discarded
+        client.__enter__()
+        client.pooled = True
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=settings.DOCUMENTS_API_POOL_MAXSIZE,
+        )
+        client.mount("https://", adapter)
+        client.mount("http://", adapter)
+        return client
+
+
+client_pool = ClientPool()
 
 
 @dataclass
@@ -26,6 +191,13 @@ class FilePart:
     order: int
     size: int
     url: str = ""
+    completed: bool = False
+
+
+@dataclass
+class UploadStatus:
+    locked: bool
+    file_parts: list[FilePart]
 
 
 @dataclass
@@ -41,6 +213,76 @@ def _extract_uuid(url: str) -> UUID:
     return UUID(last_part)
 
 
+class MultipartFormData(io.RawIOBase):
+    """
+    Stream a ``multipart/form-data`` request body with form fields and a file.
+
+    The body is produced while it's read, so that only a single chunk of the file is
+    held in memory at a time. The length is known (and sent as ``Content-Length``)
+    when the size of the file is known.
+    """
+
+    def __init__(
+        self,
+        *,
+        fields: Mapping[str, str],
+        file_field: str,
+        file: File | StreamedFile,
+    ):
+        super().__init__()
+        self.boundary = uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+
+        preamble = b"".join(
+            self._part_header(
+                f"form-data; {format_multipart_header_param('name', name)}"
+            )
+            + value.encode()
+            + b"\r\n"
+            for name, value in fields.items()
+        )
+        # the name comes from the client - like requests, escape the quotes and line
+        # breaks so that it can't add headers or parts to the body
+        file_name = os.path.basename(file.name or "") or file_field
+        preamble += self._part_header(
+            f"form-data; {format_multipart_header_param('name', file_field)}; "
+            f"{format_multipart_header_param('filename', file_name)}",
+            content_type="application/octet-stream",
+        )
+        epilogue = f"\r\n--{self.boundary}--\r\n".encode()
+
+        self._parts = chain([preamble], file.chunks(), [epilogue])
+        self._buffer = memoryview(b"")
+        self._position = 0
+        if file.size is not None:
+            self.len = len(preamble) + file.size + len(epilogue)
+
+    def _part_header(self, disposition: str, content_type: str = "") -> bytes:
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return f"{header}\r\n".encode()
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        # requests determines the remaining length from the current position
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._parts))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        self._position += size
+        return size
+
+
 class DocumentenClient(NLXClient):
     """
     Implement interactions with a Documenten API.
@@ -48,6 +290,37 @@ class DocumentenClient(NLXClient):
     Requires Documenten API 1.1+ since we use the large file uploads mechanism.
     """
 
+    pooled: bool = False
+    """
+    Pooled clients are shared, leaving a ``with`` block does not close them.
+    """
+    timeout: int | tuple[int, int] | None
+    """
+    The (connect and read) timeout of the requests, replaces the single timeout of
+    the service set by zgw-consumers.
+    """
+
+    def __init__(
+        self, *args, timeout: int | tuple[int, int] | None = None, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.timeout = timeout
+
+    def request(self, method, url, *args, **kwargs):
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+    def __enter__(self):
+        if self.pooled:
+            return self
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        if self.pooled:
+            return None
+        return super().__exit__(*args)
+
     def create_document(
         self,
         *,
@@ -101,9 +374,16 @@ class DocumentenClient(NLXClient):
             file_parts=file_parts,
         )
 
+    def destroy_document(self, *, uuid: UUID) -> None:
+        """
+        Delete the document in the Documents API.
+        """
+        response = self.delete(f"enkelvoudiginformatieobjecten/{uuid}")
+        response.raise_for_status()
+
     def proxy_file_part_upload(
         self,
-        file: File,
+        file: File | StreamedFile,
         *,
         file_part_uuid: UUID,
         lock: str,
@@ -111,35 +391,51 @@ class DocumentenClient(NLXClient):
         """
         Proxy the file part upload we received to the underlying Documents API.
 
-        Unfortunately it doesn't seem possible to stream the incoming request directly
-        to the Documents API using requests, because we need to send some extra form
-        data (the lock ID), and streaming seems to be supported only for just the file
-        uploads without additional form data (see
-        https://requests.readthedocs.io/en/latest/user/advanced/#streaming-uploads).
-
-        Writing a custom file-like wrapper or generator that produces the raw HTTP
-        stream with multipart boundaries is not worth it. If we run into performance
-        issues, we can consider httpx, aiohttp or an entirely different solution to
-        optimize.
+        The multipart form data with the lock ID and the file content is generated
+        while it's sent, reading the content in chunks from ``file``. Together with a
+        :class:`~woo_publications.api.parsers.StreamedFile` from the incoming request,
+        the content is forwarded without buffering the file part in memory or on disk.
+        If the size of the file is not known upfront, the body is sent with chunked
+        transfer encoding.
         """
+        body = MultipartFormData(
+            fields={"lock": lock},
+            file_field="inhoud",
+            file=file,
+        )
         response = self.put(
             f"bestandsdelen/{file_part_uuid}",
-            data={"lock": lock},
-            files={"inhoud": file},
+            data=body,
+            headers={"Content-Type": body.content_type},
         )
         response.raise_for_status()
 
-    def check_uploads_complete(self, *, document_uuid: UUID) -> bool:
+    def get_upload_status(self, *, document_uuid: UUID) -> UploadStatus:
+        """
+        Retrieve the lock and file parts status of the document.
+        """
         document_detail_response = self.get(
             f"enkelvoudiginformatieobjecten/{document_uuid}"
         )
         document_detail_response.raise_for_status()
         document_detail: EIORetrieveBody = document_detail_response.json()
-        return all(
-            bestandsdeel["voltooid"]
-            for bestandsdeel in document_detail["bestandsdelen"]
+        return UploadStatus(
+            locked=document_detail["locked"],
+            file_parts=[
+                FilePart(
+                    uuid=_extract_uuid(part_data["url"]),
+                    order=part_data["volgnummer"],
+                    size=part_data["omvang"],
+                    completed=part_data["voltooid"],
+                )
+                for part_data in document_detail["bestandsdelen"]
+            ],
         )
 
+    def check_uploads_complete(self, *, document_uuid: UUID) -> bool:
+        upload_status = self.get_upload_status(document_uuid=document_uuid)
+        return all(part.completed for part in upload_status.file_parts)
+
     def unlock_document(self, *, uuid: UUID, lock: str) -> None:
         """
         Unlock the locked document in the Documents API.
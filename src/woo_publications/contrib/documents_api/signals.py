@@ -0,0 +1,29 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from simple_certmanager.models import Certificate
+from zgw_consumers.models import Service
+
+from woo_publications.config.models import ServiceTimeouts
+
+from .client import client_pool
+
+
+@receiver([post_save, post_delete], sender=Service)
+def invalidate_documents_api_client(sender, instance: Service, **kwargs) -> None:
+    client_pool.invalidate(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=ServiceTimeouts)
+def invalidate_documents_api_client_timeouts(
+    sender, instance: ServiceTimeouts, **kwargs
+) -> None:
+    client_pool.invalidate(
+        instance.service_id  # pyright: ignore[reportAttributeAccessIssue]
+    )
+
+
+@receiver([post_save, post_delete], sender=Certificate)
+def clear_documents_api_clients(sender, instance: Certificate, **kwargs) -> None:
+    # the certificate files may be replaced without changing the service
+    client_pool.clear()
@@ -0,0 +1,257 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+
+import httpx
+import requests_mock
+from asgiref.sync import async_to_sync
+from requests.adapters import HTTPAdapter
+from zgw_consumers.constants import APITypes
+
+from woo_publications.config.models import ServiceTimeouts
+
+from ..async_client import get_async_client
+from ..client import (
+    ClientPool,
+    client_pool,
+    get_client,
+    get_config_fingerprint,
+    get_timeout,
+)
+from .factories import ServiceFactory
+
+
+class ClientPoolTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = ClientPool()
+        self.addCleanup(self.pool.clear)
+
+    def test_client_is_reused(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+
+        client1 = self.pool.get(service)
+        client2 = self.pool.get(service)
+
+        self.assertIs(client1, client2)
+        self.assertEqual(self.pool.stats.hits, 1)
+        self.assertEqual(self.pool.stats.misses, 1)
+
+    def test_clients_per_service(self):
+        service1, service2 = ServiceFactory.create_batch(2, api_type=APITypes.drc)
+
+        client1 = self.pool.get(service1)
+        client2 = self.pool.get(service2)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(self.pool.stats.misses, 2)
+
+    def test_changed_configuration_builds_new_client(self):
+        service = ServiceFactory.create(
+            api_type=APITypes.drc, api_root="https://old.example.com/api/v1/"
+        )
+        client1 = self.pool.get(service)
+
+        service.api_root = "https://new.example.com/api/v1/"
+        with patch.object(client1, "close") as mock_close:
+            client2 = self.pool.get(service)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(client2.base_url, "https://new.example.com/api/v1/")
+        mock_close.assert_called_once_with()
+        self.assertEqual(self.pool.stats.misses, 2)
+
+    @override_settings(DOCUMENTS_API_CLIENT_MAX_AGE=0)
+    def test_expired_client_is_replaced(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+
+        client1 = self.pool.get(service)
+        client2 = self.pool.get(service)
+
+        self.assertIsNot(client1, client2)
+        self.assertEqual(self.pool.stats.hits, 0)
+
+    def test_invalidate(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+        client1 = self.pool.get(service)
+
+        self.pool.invalidate(service.pk)
+
+        self.assertIsNot(self.pool.get(service), client1)
+        self.assertEqual(self.pool.stats.invalidations, 1)
+
+    @override_settings(DOCUMENTS_API_POOL_MAXSIZE=7)
+    def test_connection_pool_size(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+
+        client = self.pool.get(service)
+
+        adapter = client.get_adapter("https://example.com")
+        assert isinstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_maxsize, 7)
+
+    def test_pooled_client_is_not_closed_by_context_manager(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+        client = self.pool.get(service)
+
+        with patch.object(client, "close") as mock_close:
+            with client:
+                pass
+
+        mock_close.assert_not_called()
+
+    def test_pooled_client_is_not_closed_after_request(self):
+        service = ServiceFactory.create(
+            api_type=APITypes.drc, api_root="https://documenten.example.com/api/v1/"
+        )
+        client = self.pool.get(service)
+
+        with (
+            requests_mock.Mocker() as m,
+            patch.object(client, "close") as mock_close,
+        ):
+            m.get("https://documenten.example.com/api/v1/enkelvoudiginformatieobjecten")
+            client.get("enkelvoudiginformatieobjecten")
+
+        mock_close.assert_not_called()
+
+
+class GetClientTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+
+    def test_unsaved_service_is_not_pooled(self):
+        service = ServiceFactory.build(api_type=APITypes.drc)
+
+        client1 = get_client(service)
+        client2 = get_client(service)
+
+        self.assertIsNot(client1, client2)
+        self.assertFalse(client1.pooled)
+
+    def test_saving_service_invalidates_client(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+        client1 = get_client(service)
+        self.assertIs(get_client(service), client1)
+
+        service.save()
+
+        self.assertIsNot(get_client(service), client1)
+
+    def test_service_timeout(self):
+        service = ServiceFactory.create(api_type=APITypes.drc, timeout=15)
+
+        client = get_client(service)
+
+        self.assertEqual(client.timeout, 15)
+
+    def test_separate_connect_and_read_timeouts(self):
+        service = ServiceFactory.create(api_type=APITypes.drc, timeout=15)
+        ServiceTimeouts.objects.create(
+            service=service, connect_timeout=3, read_timeout=120
+        )
+        service.refresh_from_db()
+
+        client = get_client(service)
+
+        self.assertEqual(client.timeout, (3, 120))
+
+    def test_timeouts_are_applied_to_requests(self):
+        service = ServiceFactory.create(
+            api_type=APITypes.drc,
+            api_root="https://documenten.example.com/api/v1/",
+            timeout=15,
+        )
+        ServiceTimeouts.objects.create(
+            service=service, connect_timeout=3, read_timeout=120
+        )
+        service.refresh_from_db()
+        client = get_client(service)
+
+        with requests_mock.Mocker() as m:
+            m.get(requests_mock.ANY)
+            client.get("enkelvoudiginformatieobjecten")
+            client.get("enkelvoudiginformatieobjecten", timeout=5)
+
+        self.assertEqual(
+            [request.timeout for request in m.request_history], [(3, 120), 5]
+        )
+
+    def test_async_client_timeouts(self):
+        service = ServiceFactory.create(api_type=APITypes.drc, timeout=15)
+        ServiceTimeouts.objects.create(
+            service=service, connect_timeout=3, read_timeout=120
+        )
+        service.refresh_from_db()
+        async_client = get_async_client(service)
+
+        async def _get_http_timeout() -> httpx.Timeout:
+            return async_client._get_http_client().timeout
+
+        self.assertEqual(
+            async_to_sync(_get_http_timeout)(),
+            httpx.Timeout(connect=3, read=120, write=120, pool=3),
+        )
+
+    def test_changing_timeouts_invalidates_client(self):
+        service = ServiceFactory.create(api_type=APITypes.drc)
+        client1 = get_client(service)
+
+        ServiceTimeouts.objects.create(service=service, read_timeout=120)
+
+        self.assertIsNot(get_client(service), client1)
+
+
+class GetConfigFingerprintTests(TestCase):
+    def test_timeouts_change_fingerprint(self):
+        service = ServiceFactory.build(timeout=15)
+        fingerprint = get_config_fingerprint(service)
+
+        with self.subTest("service timeout"):
+            service.timeout = 30
+
+            self.assertNotEqual(get_config_fingerprint(service), fingerprint)
+
+        with self.subTest("separate timeouts"):
+            service.timeout = 15
+            service.timeouts = (
+                ServiceTimeouts(  # pyright: ignore[reportAttributeAccessIssue]
+                    service=service, connect_timeout=3, read_timeout=120
+                )
+            )
+            separate_timeouts_fingerprint = get_config_fingerprint(service)
+
+            self.assertNotEqual(separate_timeouts_fingerprint, fingerprint)
+
+            service.timeouts.read_timeout = 60
+
+            self.assertNotEqual(
+                get_config_fingerprint(service), separate_timeouts_fingerprint
+            )
+
+
+class GetTimeoutTests(TestCase):
+    def test_timeouts(self):
+        cases = (
+            ({}, (3, 120)),
+            ({"connect_timeout": None}, (15, 120)),
+            ({"read_timeout": None}, (3, 15)),
+            ({"connect_timeout": None, "read_timeout": None}, (15, 15)),
+        )
+        for fields, expected in cases:
+            with self.subTest(fields=fields):
+                service = ServiceFactory.build(timeout=15)
+                service.timeouts = (
+                    ServiceTimeouts(  # pyright: ignore[reportAttributeAccessIssue]
+                        service=service,
+                        **{"connect_timeout": 3, "read_timeout": 120, **fields},
+                    )
+                )
+
+                self.assertEqual(get_timeout(service), expected)
+
+    def test_without_timeouts(self):
+        service = ServiceFactory.build(timeout=15)
+
+        self.assertEqual(get_timeout(service), 15)
@@ -0,0 +1,126 @@
+from io import BytesIO
+from uuid import uuid4
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http.multipartparser import MultiPartParser
+from django.test import SimpleTestCase
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+
+import requests_mock
+from zgw_consumers.constants import APITypes
+
+from woo_publications.api.parsers import StreamingMultiPartParser
+
+from ..client import MultipartFormData, get_client
+from .factories import ServiceFactory
+
+API_ROOT = "https://documenten.example.com/api/v1/"
+
+
+def _parse_form_data(body: bytes, content_type: str):
+    parser = MultiPartParser(
+        {"CONTENT_TYPE": content_type, "CONTENT_LENGTH": len(body)},
+        BytesIO(body),
+        upload_handlers=[],
+    )
+    return parser.parse()
+
+
+def _get_streamed_file(content: bytes):
+    body = encode_multipart(
+        BOUNDARY, {"inhoud": SimpleUploadedFile("part.bin", content)}
+    )
+    result = StreamingMultiPartParser().parse(
+        BytesIO(body), media_type=MULTIPART_CONTENT
+    )
+    return result.files["inhoud"]
+
+
+class MultipartFormDataTests(SimpleTestCase):
+    def test_body_with_known_size(self):
+        file = SimpleUploadedFile("part.bin", b"aAaAa")
+
+        body = MultipartFormData(
+            fields={"lock": "abc123"}, file_field="inhoud", file=file
+        )
+
+        content = body.read()
+        self.assertEqual(body.len, len(content))
+        self.assertTrue(body.content_type.startswith("multipart/form-data; boundary="))
+        post, _ = _parse_form_data(content, body.content_type)
+        self.assertEqual(post["lock"], "abc123")
+        self.assertIn(b'name="inhoud"; filename="part.bin"', content)
+        self.assertIn(b"\r\n\r\naAaAa\r\n", content)
+
+    def test_file_name_is_escaped(self):
+        file = SimpleUploadedFile('part.bin"\r\nX-Injected: yes\r\n\r\n', b"aAaAa")
+
+        body = MultipartFormData(
+            fields={"lock": "abc123"}, file_field="inhoud", file=file
+        )
+
+        content = body.read()
+        self.assertIn(
+            b'name="inhoud"; filename="part.bin%22%0D%0AX-Injected: yes%0D%0A%0D%0A"'
+            b"\r\nContent-Type: application/octet-stream\r\n\r\naAaAa",
+            content,
+        )
+        # no extra fields
+        post, _ = _parse_form_data(content, body.content_type)
+        self.assertEqual(list(post), ["lock"])
+
+    def test_body_with_unknown_size(self):
+        file = _get_streamed_file(b"B" * 200_000)
+
+        body = MultipartFormData(
+            fields={"lock": "abc123"}, file_field="inhoud", file=file
+        )
+
+        self.assertFalse(hasattr(body, "len"))
+        content = b""
+        while chunk := body.read(8192):
+            self.assertLessEqual(len(chunk), 8192)
+            content += chunk
+        post, _ = _parse_form_data(content, body.content_type)
+        self.assertEqual(post["lock"], "abc123")
+        self.assertIn(b"B" * 200_000 + b"\r\n--", content)
+
+
+@requests_mock.Mocker()
+class ProxyFilePartUploadTests(SimpleTestCase):
+    def test_upload_uploaded_file(self, m):
+        m.put(requests_mock.ANY, status_code=200, json={})
+        service = ServiceFactory.build(api_root=API_ROOT, api_type=APITypes.drc)
+        part_uuid = uuid4()
+
+        with get_client(service) as client:
+            client.proxy_file_part_upload(
+                SimpleUploadedFile("part.bin", b"aAaAa"),
+                file_part_uuid=part_uuid,
+                lock="abc123",
+            )
+
+        request = m.last_request
+        self.assertEqual(request.url, f"{API_ROOT}bestandsdelen/{part_uuid}")
+        self.assertIn("Content-Length", request.headers)
+        self.assertNotIn("Transfer-Encoding", request.headers)
+        body = request.body.read()
+        self.assertEqual(int(request.headers["Content-Length"]), len(body))
+        post, _ = _parse_form_data(body, request.headers["Content-Type"])
+        self.assertEqual(post["lock"], "abc123")
+
+    def test_upload_streamed_file(self, m):
+        m.put(requests_mock.ANY, status_code=200, json={})
+        service = ServiceFactory.build(api_root=API_ROOT, api_type=APITypes.drc)
+
+        with get_client(service) as client:
+            client.proxy_file_part_upload(
+                _get_streamed_file(b"aAaAa"),
+                file_part_uuid=uuid4(),
+                lock="abc123",
+            )
+
+        request = m.last_request
+        self.assertEqual(request.headers["Transfer-Encoding"], "chunked")
+        self.assertNotIn("Content-Length", request.headers)
+        self.assertIn(b"\r\n\r\naAaAa\r\n", request.body.read())
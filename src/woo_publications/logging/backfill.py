@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+
+from .constants import Events
+from .mixins import ModelOwnerMixin
+from .models import TimelineLogProxy
+
+__all__ = ["get_owner_models", "backfill_owners"]
+
+
+def get_owner_models() -> list[type[ModelOwnerMixin]]:
+    return [
+        model
+        for model in apps.get_models()
+        if issubclass(model, ModelOwnerMixin) and not model._meta.proxy
+    ]
+
+
+def backfill_owners(
+    model: type[ModelOwnerMixin],
+    *,
+    chunk_size: int = 1000,
+    start_after: int = 0,
+) -> Iterator[tuple[int, int]]:
+    """
+    Populate the owner fields from the 'create' audit log events.
+
+    Records are processed in primary key order, in chunks of ``chunk_size`` that are
+    each committed in their own transaction. After every chunk, the last processed
+    primary key and the number of updated records are yielded - pass the primary key
+    as ``start_after`` to resume an interrupted run. Records that already have an
+    owner recorded are skipped, so running the backfill again is safe.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    manager = model._default_manager
+    last_pk = start_after
+
+    while True:
+        pks: list[int] = list(
+            manager.filter(pk__gt=last_pk, owner_identifier="")
+            .order_by("pk")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not pks:
+            return
+
+        create_logs = (
+            TimelineLogProxy.objects.filter(
+                content_type=content_type,
+                object_id__in=[str(pk) for pk in pks],
+                extra_data__event=Events.create,
+            )
+            .order_by("object_id", "pk")
+            .distinct("object_id")
+            .values_list("object_id", "extra_data__acting_user")
+        )
+
+        to_update = []
+        for object_id, acting_user in create_logs:
+            if not isinstance(acting_user, dict) or not acting_user.get("identifier"):
+                continue
+            to_update.append(
+                model(
+                    pk=int(object_id),
+                    owner_identifier=str(acting_user["identifier"]),
+                    owner_display_name=acting_user.get("display_name", ""),
+                )
+            )
+
+        with transaction.atomic():
+            manager.bulk_update(
+                to_update,
+                fields=("owner_identifier", "owner_display_name"),
+            )
+
+        last_pk = pks[-1]
+        yield last_pk, len(to_update)
@@ -0,0 +1,93 @@
+"""
+Measure the duration of writing the audit log records of a request, per sink.
+
+The events are recorded like the API endpoints record them, outside of a transaction.
+The records written by the benchmark are deleted afterwards.
+"""
+
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from uuid import uuid4
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .logevent import audit_api_read
+from .models import TimelineLogProxy
+from .sinks import buffered_audit_log
+
+__all__ = ["AuditLogBenchmarkResult", "AuditLogMeasurement", "benchmark_audit_log"]
+
+
+@dataclass
+class AuditLogMeasurement:
+    record_time: float
+    """
+    The elapsed time in seconds of recording the events.
+    """
+    total_time: float
+    """
+    The elapsed time in seconds of recording the events and writing the buffered
+    records.
+    """
+    queries: int
+
+
+@dataclass
+class AuditLogBenchmarkResult:
+    events: int
+    synchronous: AuditLogMeasurement
+    buffered: AuditLogMeasurement
+
+
+def _measure(
+    events: int,
+    scope: Callable[[], AbstractContextManager],
+    remarks: str,
+) -> AuditLogMeasurement:
+    # any object will do, the content types exist in every database
+    content_object = ContentType.objects.get_for_model(TimelineLogProxy)
+    # the audit log records look up (and cache) the content type of the object
+    ContentType.objects.get_for_model(content_object)
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        with scope():
+            for _ in range(events):
+                audit_api_read(
+                    content_object=content_object,
+                    user_id="benchmark",
+                    user_display="Benchmark",
+                    remarks=remarks,
+                )
+            record_time = time.perf_counter() - start
+        total_time = time.perf_counter() - start
+    return AuditLogMeasurement(
+        record_time=record_time,
+        total_time=total_time,
+        queries=len(context.captured_queries),
+    )
+
+
+def benchmark_audit_log(*, events: int = 100) -> AuditLogBenchmarkResult:
+    """
+    Record read events with the synchronous and the buffered sink.
+
+    Run this outside of a transaction, the buffered records are only written when
+    the transaction is committed.
+
+    :param events: the number of events recorded with each sink, like an API request
+      that records this many events.
+    """
+    # identifies the records of this run, to clean them up
+    remarks = f"benchmark {uuid4()}"
+    try:
+        return AuditLogBenchmarkResult(
+            events=events,
+            synchronous=_measure(events, nullcontext, remarks),
+            buffered=_measure(events, buffered_audit_log, remarks),
+        )
+    finally:
+        TimelineLogProxy.objects.filter(extra_data__remarks=remarks).delete()
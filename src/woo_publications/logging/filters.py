@@ -1,11 +1,9 @@
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 from django_filters import filters
 from django_filters.constants import EMPTY_VALUES
 
-from .constants import Events
-from .models import TimelineLogProxy
+from .mixins import get_create_logs
 
 __all__ = [
     "OwnerFilter",
@@ -21,13 +19,10 @@ class OwnerFilter(filters.CharFilter):
         if self.distinct:
             qs = qs.distinct()
 
-        model = self.model
-        publication_ct = ContentType.objects.get_for_model(model)
-
-        object_pks = TimelineLogProxy.objects.filter(
-            content_type=publication_ct,
-            extra_data__event=Events.create,
-            extra_data__acting_user__identifier=value,
-        ).values_list("object_id", flat=True)
-
-        return self.get_method(qs)(pk__in=[pk for pk in object_pks])
+        # The owner is recorded on models using the ModelOwnerMixin. Records that
+        # don't have their owner backfilled yet are matched through the audit logs.
+        create_logs = get_create_logs(qs.model).filter(acting_user_identifier=value)
+        return self.get_method(qs)(
+            models.Q(owner_identifier=value)
+            | models.Q(models.Exists(create_logs), owner_identifier="")
+        )
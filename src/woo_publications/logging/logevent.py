@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import assert_never
 
 from django.db import models
@@ -8,8 +9,11 @@ from woo_publications.accounts.models import User
 from woo_publications.typing import JSONObject
 
 from .constants import Events
+from .mixins import ModelOwnerMixin
 from .models import TimelineLogProxy
-from .typing import MetadataDict
+from .serializing import serialize_instance
+from .sinks import get_sink
+from .typing import ActingUser, MetadataDict
 
 __all__ = [
     # admin
@@ -19,6 +23,7 @@ __all__ = [
     "audit_admin_delete",
     # api
     "audit_api_create",
+    "audit_api_create_bulk",
     "audit_api_read",
     "audit_api_update",
     "audit_api_delete",
@@ -65,7 +70,7 @@ def _audit_event(
         },
     }
 
-    TimelineLogProxy.objects.create(
+    log = TimelineLogProxy(
         content_object=content_object,
         extra_data={
             **metadata,
@@ -73,6 +78,10 @@ def _audit_event(
         },
         user=django_user,
     )
+    get_sink().write([log])
+
+    if event == Events.create and isinstance(content_object, ModelOwnerMixin):
+        content_object.record_owner(metadata["acting_user"])
 
 
 # Admin tooling:
@@ -154,6 +163,48 @@ def audit_api_create(
     )
 
 
+def audit_api_create_bulk(
+    *,
+    content_objects: Sequence[models.Model],
+    user_id: str,
+    user_display: str,
+    remarks: str,
+) -> None:
+    """
+    Record the creation of multiple objects by the same user in bulk.
+
+    This is equivalent to calling :func:`audit_api_create` for each object, with the
+    object data taken from the object itself, but the log records are inserted with
+    a single query.
+    """
+    if not (user_id and user_display):
+        raise ValueError("Provide non-empty 'user_id' and 'user_display' parameters.")
+    if not content_objects:
+        return
+
+    acting_user: ActingUser = {"identifier": user_id, "display_name": user_display}
+    logs = []
+    for content_object in content_objects:
+        log = TimelineLogProxy(
+            content_object=content_object,
+            extra_data={
+                "event": Events.create,
+                "acting_user": acting_user,
+                "object_data": serialize_instance(content_object),
+                "remarks": remarks,
+            },
+        )
+        logs.append(log)
+    get_sink().write(logs)
+
+    owned_by_type: dict[type[ModelOwnerMixin], list[ModelOwnerMixin]] = {}
+    for content_object in content_objects:
+        if isinstance(content_object, ModelOwnerMixin):
+            owned_by_type.setdefault(type(content_object), []).append(content_object)
+    for model, instances in owned_by_type.items():
+        model.record_owner_bulk(instances, acting_user)
+
+
 def audit_api_read(
     *,
     content_object: models.Model,
@@ -0,0 +1,76 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...backfill import backfill_owners, get_owner_models
+from ...mixins import ModelOwnerMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "Populate the owner fields of records from the 'create' events in the audit "
+        "logs. The records are processed in chunks, and an interrupted run can be "
+        "resumed with the --start-after option."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="store",
+            help=(
+                "Only process the given model, e.g. 'publications.publication'. By "
+                "default, all models tracking an owner are processed."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            action="store",
+            type=int,
+            default=1000,
+            help="The number of records to process per transaction.",
+        )
+        parser.add_argument(
+            "--start-after",
+            action="store",
+            type=int,
+            default=0,
+            help=(
+                "Only process records with a primary key greater than this value. "
+                "Requires the --model option."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        chunk_size: int = options["chunk_size"]
+        start_after: int = options["start_after"]
+        if chunk_size < 1:
+            raise CommandError("The chunk size must be a positive number.")
+
+        if model_label := options["model"]:
+            try:
+                model = apps.get_model(model_label)
+            except (LookupError, ValueError) as err:
+                raise CommandError(f"Unknown model '{model_label}'.") from err
+            if not issubclass(model, ModelOwnerMixin):
+                raise CommandError(f"The model '{model_label}' does not track owners.")
+            models = [model]
+        else:
+            if start_after:
+                raise CommandError("The --start-after option requires --model.")
+            models = get_owner_models()
+
+        for model in models:
+            label = model._meta.label_lower
+            total = 0
+            for last_pk, num_updated in backfill_owners(
+                model,
+                chunk_size=chunk_size,
+                start_after=start_after,
+            ):
+                total += num_updated
+                self.stdout.write(
+                    f"{label}: processed up to pk {last_pk}, "
+                    f"{num_updated} owner(s) recorded."
+                )
+            self.stdout.write(
+                self.style.SUCCESS(f"{label}: done, {total} owner(s) recorded.")
+            )
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks import benchmark_audit_log
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the duration and number of queries of writing the audit log records "
+        "of a request, with the synchronous and the buffered sink. The records are "
+        "deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--events",
+            action="store",
+            type=int,
+            default=100,
+            help="The number of events recorded with each sink.",
+        )
+
+    def handle(self, *args, **options):
+        events: int = options["events"]
+        if events < 1:
+            raise CommandError("The number of events must be a positive number.")
+
+        result = benchmark_audit_log(events=events)
+        for label, measurement in (
+            ("synchronous", result.synchronous),
+            ("buffered", result.buffered),
+        ):
+            self.stdout.write(
+                f"{label:>11}: {measurement.record_time * 1000:8.2f} ms recording, "
+                f"{measurement.total_time * 1000:8.2f} ms total, "
+                f"{measurement.queries:>4} queries"
+            )
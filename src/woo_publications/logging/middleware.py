@@ -0,0 +1,57 @@
+"""
+Buffer the audit log records of the requests, see :mod:`woo_publications.logging.sinks`.
+"""
+
+from typing import cast
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from woo_publications.utils.middleware import AsyncGetResponse, GetResponse
+
+from .sinks import abuffered_audit_log, buffered_audit_log
+
+__all__ = ["AuditLogBufferMiddleware"]
+
+
+class AuditLogBufferMiddleware:
+    """
+    Buffer the audit log records of a request if the ``AUDIT_LOG_SINK`` setting is
+    ``"buffered"``.
+
+    With the ``"synchronous"`` sink, the middleware is not used at all.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse | AsyncGetResponse):
+        match settings.AUDIT_LOG_SINK:
+            case "synchronous":
+                raise MiddlewareNotUsed
+            case "buffered":
+                pass
+            case sink:
+                raise ImproperlyConfigured(
+                    f"Unknown AUDIT_LOG_SINK '{sink}', use 'synchronous' or 'buffered'."
+                )
+
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.acall(request)
+        with buffered_audit_log():
+            return self.get_response(request)
+
+    async def acall(self, request: HttpRequest) -> HttpResponseBase:
+        get_response = cast(AsyncGetResponse, self.get_response)
+        async with abuffered_audit_log():
+            return await get_response(request)
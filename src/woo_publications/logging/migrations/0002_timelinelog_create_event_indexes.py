@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# The expressions must match the SQL generated for the ``KT(...)`` lookups in
+# :func:`woo_publications.logging.mixins.get_create_logs`, otherwise Postgres will not
+# consider the index.
+CREATE_INDEX_SQL = """
+CREATE INDEX CONCURRENTLY IF NOT EXISTS "logging_timelinelog_create_event_owner_idx"
+ON "timeline_logger_timelinelog" (
+    "content_type_id",
+    ("extra_data" ->> 'event'),
+    ("extra_data" #>> '{acting_user,identifier}')
+);
+"""
+
+DROP_INDEX_SQL = """
+DROP INDEX CONCURRENTLY IF EXISTS "logging_timelinelog_create_event_owner_idx";
+"""
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, but it does not block
+    # writes to the (potentially large) audit log table.
+    atomic = False
+
+    dependencies = [
+        ("logging", "0001_initial"),
+        ("timeline_logger", "0006_auto_20220413_0749"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_INDEX_SQL,
+            reverse_sql=DROP_INDEX_SQL,
+        ),
+    ]
@@ -1,21 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
+from django.utils.translation import gettext_lazy as _
+
 from .constants import Events
 from .models import TimelineLogProxy
 from .typing import ActingUser
 
 __all__ = [
     "ModelOwnerMixin",
+    "annotate_owner",
+    "get_create_logs",
 ]
 
+OWNER_ANNOTATION = "_owner"
+
+
+def get_create_logs(model: type[models.Model]) -> models.QuerySet[TimelineLogProxy]:
+    """
+    Get the 'create' audit log events of the records in the outer query.
+
+    Use this as correlated subquery on a queryset of ``model``. The primary key of the
+    outer record is cast to text in the database to match the ``object_id`` column,
+    and the JSON lookups are expressed so that they match the expression indexes on
+    the audit log table.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    return TimelineLogProxy.objects.annotate(
+        event=KT("extra_data__event"),
+        acting_user_identifier=KT("extra_data__acting_user__identifier"),
+    ).filter(
+        content_type=content_type,
+        object_id=Cast(models.OuterRef("pk"), output_field=models.TextField()),
+        event=Events.create,
+    )
+
+
+def annotate_owner[M: models.Model](queryset: models.QuerySet[M]) -> models.QuerySet[M]:
+    """
+    Annotate the owner of each record, derived from the 'create' audit log event.
+
+    The owner is resolved in the same query that fetches the records, so the number of
+    queries does not depend on the number of records. :meth:`ModelOwnerMixin.get_owner`
+    uses the annotated value when it's present.
 
-class ModelOwnerMixin:
+    The audit logs are only consulted for records that don't have their owner
+    recorded yet - see the ``backfill_owners`` management command.
     """
-    Adds get_owner func to retrieve the TimeLineLog initial create object to retrieve the owner of the model.
+    create_logs = get_create_logs(queryset.model).order_by("pk")
+    return queryset.annotate(
+        **{
+            OWNER_ANNOTATION: models.Case(
+                models.When(
+                    owner_identifier="",
+                    then=models.Subquery(
+                        create_logs.values("extra_data__acting_user")[:1]
+                    ),
+                ),
+                output_field=models.JSONField(),
+            )
+        }
+    )
+
+
+class ModelOwnerMixin(models.Model):
+    """
+    Track the owner of the model, which is the user that created the record.
+
+    The owner is recorded when the 'create' audit log event is written. For records
+    created before the owner was tracked on the model itself, the initial
+    TimeLineLog create object is used to retrieve the owner of the model.
     """
 
+    owner_identifier = models.CharField(
+        _("owner identifier"),
+        max_length=255,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_(
+            "The system identifier of the user that created the record, as recorded "
+            "in the audit trails."
+        ),
+    )
+    owner_display_name = models.CharField(
+        _("owner display name"),
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "The display name of the user that created the record, as recorded in the "
+            "audit trails."
+        ),
+    )
+
+    class Meta:  # pyright: ignore
+        abstract = True
+
     def get_owner(self) -> ActingUser | None:
         """
-        Extract the owner from the audit trails.
+        Extract the owner from the recorded owner fields or the audit trails.
+
+        If the instance was fetched through :func:`annotate_owner`, no additional
+        query is performed.
         """
+        if self.owner_identifier:
+            return {
+                "identifier": self.owner_identifier,
+                "display_name": self.owner_display_name,
+            }
+
+        if OWNER_ANNOTATION in self.__dict__:
+            acting_user: ActingUser | None = self.__dict__[OWNER_ANNOTATION]
+            if acting_user is None:
+                return None
+            return {
+                "identifier": acting_user.get("identifier", "unknown"),
+                "display_name": acting_user.get("display_name", "unknown"),
+            }
+
         qs = TimelineLogProxy.objects.for_object(  # pyright: ignore[reportAttributeAccessIssue]
             self
         )
@@ -25,3 +133,36 @@ class ModelOwnerMixin:
             return None
         assert isinstance(log, TimelineLogProxy)
         return log.acting_user[0]
+
+    def record_owner(self, acting_user: ActingUser) -> None:
+        """
+        Store the owner on the record.
+
+        This is a targeted update so that no other (possibly stale) field values are
+        written and the modification timestamps are left alone.
+        """
+        self.owner_identifier = str(acting_user["identifier"])
+        self.owner_display_name = acting_user["display_name"]
+        type(self)._default_manager.filter(pk=self.pk).update(
+            owner_identifier=self.owner_identifier,
+            owner_display_name=self.owner_display_name,
+        )
+
+    @classmethod
+    def record_owner_bulk(
+        cls, instances: Sequence[ModelOwnerMixin], acting_user: ActingUser
+    ) -> None:
+        """
+        Store the same owner on multiple records with a single query.
+
+        See :meth:`record_owner`.
+        """
+        for instance in instances:
+            instance.owner_identifier = str(acting_user["identifier"])
+            instance.owner_display_name = acting_user["display_name"]
+        cls._default_manager.filter(
+            pk__in=[instance.pk for instance in instances]
+        ).update(
+            owner_identifier=str(acting_user["identifier"]),
+            owner_display_name=acting_user["display_name"],
+        )
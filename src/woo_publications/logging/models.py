@@ -28,6 +28,15 @@ class TimelineLogProxy(TimelineLog):
         verbose_name_plural = _("(audit) log entries")
 
     def save(self, *args, **kwargs):
+        self.prepare_for_save()
+        super().save(*args, **kwargs)
+
+    def prepare_for_save(self) -> None:
+        """
+        Validate and complete the record before it's written to the database.
+
+        :meth:`save` calls this - make sure to call it when creating records in bulk.
+        """
         # there's a setting for this, but then makemigrations produces a new migration
         # in the third party package which is less than ideal...
         if self.template == "timeline_logger/default.txt":
@@ -44,8 +53,6 @@ class TimelineLogProxy(TimelineLog):
         self._validate_user_details()
         self._cache_object_repr()
 
-        super().save(*args, **kwargs)
-
     def _cache_object_repr(self) -> None:
         # cache the object representation so we can avoid querying the content_object
         # in the admin list page, which does wonders for performance
@@ -14,12 +14,13 @@ from .logevent import (
     audit_admin_read,
     audit_admin_update,
     audit_api_create,
+    audit_api_create_bulk,
     audit_api_delete,
     audit_api_download,
     audit_api_read,
     audit_api_update,
 )
-from .mixins import ModelOwnerMixin
+from .mixins import ModelOwnerMixin, annotate_owner
 
 __all__ = [
     # Admin
@@ -41,6 +42,7 @@ __all__ = [
     "audit_admin_delete",
     # * api
     "audit_api_create",
+    "audit_api_create_bulk",
     "audit_api_read",
     "audit_api_update",
     "audit_api_delete",
@@ -49,4 +51,5 @@ __all__ = [
     "OwnerFilter",
     # Model
     "ModelOwnerMixin",
+    "annotate_owner",
 ]
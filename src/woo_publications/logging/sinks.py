@@ -0,0 +1,146 @@
+"""
+Write the audit log records, immediately or batched.
+
+By default every audit event is inserted as soon as it's recorded. Inside
+:func:`buffered_audit_log` - e.g. for the duration of a request, see
+:class:`~woo_publications.logging.middleware.AuditLogBufferMiddleware` and the
+``AUDIT_LOG_SINK`` setting - the records are collected instead, and inserted with a
+single query when the scope is left and the surrounding transaction is committed.
+
+Each record is only added to the buffer when the transaction (or savepoint) it was
+recorded in is committed, through :func:`django.db.transaction.on_commit`, so the
+records of rolled back changes are discarded just like they would be when written
+immediately. Outside of a transaction, the records are added to the buffer right away.
+"""
+
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Protocol
+
+from django.db import router, transaction
+
+from asgiref.sync import sync_to_async
+
+from .models import TimelineLogProxy
+
+__all__ = [
+    "AuditSink",
+    "BufferedSink",
+    "SynchronousSink",
+    "abuffered_audit_log",
+    "buffered_audit_log",
+    "get_sink",
+]
+
+
+class AuditSink(Protocol):
+    def write(self, logs: Sequence[TimelineLogProxy]) -> None:
+        """
+        Store the (unsaved) audit log records.
+        """
+        ...
+
+
+class SynchronousSink:
+    """
+    Insert the audit log records immediately.
+    """
+
+    def write(self, logs: Sequence[TimelineLogProxy]) -> None:
+        if len(logs) == 1:
+            logs[0].save()
+            return
+        for log in logs:
+            log.prepare_for_save()
+        TimelineLogProxy.objects.bulk_create(logs)
+
+
+class BufferedSink:
+    """
+    Collect the audit log records of committed changes, until they're flushed.
+    """
+
+    def __init__(self):
+        self.using = router.db_for_write(TimelineLogProxy)
+        self.pending: list[TimelineLogProxy] = []
+
+    def write(self, logs: Sequence[TimelineLogProxy]) -> None:
+        # validate the records and take the snapshot of the object representation
+        # now, while the object is in the state the event describes
+        for log in logs:
+            log.prepare_for_save()
+        transaction.on_commit(lambda: self.pending.extend(logs), using=self.using)
+
+    def flush(self) -> None:
+        """
+        Insert the collected records with a single query.
+        """
+        logs, self.pending = self.pending, []
+        if logs:
+            TimelineLogProxy.objects.using(self.using).bulk_create(logs)
+
+    def close(self) -> None:
+        """
+        Flush the buffer once the current transaction, if any, is committed.
+        """
+        # registered after the callbacks that fill the buffer, so it runs after them
+        transaction.on_commit(self.flush, using=self.using)
+
+
+_synchronous_sink = SynchronousSink()
+
+_current_sink: ContextVar[BufferedSink | None] = ContextVar(
+    "audit_log_sink", default=None
+)
+
+
+def get_sink() -> AuditSink:
+    """
+    Get the sink of the current scope, which is synchronous by default.
+    """
+    return _current_sink.get() or _synchronous_sink
+
+
+@contextmanager
+def _activate_buffer() -> Iterator[tuple[BufferedSink, bool]]:
+    if (sink := _current_sink.get()) is not None:
+        yield sink, False
+        return
+
+    sink = BufferedSink()
+    token = _current_sink.set(sink)
+    try:
+        yield sink, True
+    finally:
+        _current_sink.reset(token)
+
+
+@contextmanager
+def buffered_audit_log() -> Iterator[BufferedSink]:
+    """
+    Buffer the audit log records written in this scope.
+
+    The records are inserted in bulk when the scope is left, or, if this happens inside
+    a transaction, when that transaction is committed. Nested scopes share the buffer
+    of the outermost scope.
+    """
+    with _activate_buffer() as (sink, outermost):
+        try:
+            yield sink
+        finally:
+            if outermost:
+                sink.close()
+
+
+@asynccontextmanager
+async def abuffered_audit_log() -> AsyncIterator[BufferedSink]:
+    """
+    Async equivalent of :func:`buffered_audit_log`.
+    """
+    with _activate_buffer() as (sink, outermost):
+        try:
+            yield sink
+        finally:
+            if outermost:
+                await sync_to_async(sink.close)()
@@ -0,0 +1,161 @@
+from importlib import import_module
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.test import TestCase
+
+from woo_publications.publications.models import Document, Publication
+from woo_publications.publications.tests.factories import (
+    DocumentFactory,
+    PublicationFactory,
+)
+
+from ..constants import Events
+from ..models import TimelineLogProxy
+
+
+def _create_log(content_object, event: Events, identifier: str, display_name: str):
+    # bypass the audit log helpers, which record the owner directly
+    TimelineLogProxy.objects.create(
+        content_object=content_object,
+        extra_data={
+            "event": event,
+            "acting_user": {"identifier": identifier, "display_name": display_name},
+        },
+    )
+
+
+class BackfillOwnersCommandTests(TestCase):
+    def test_backfill_all_models(self):
+        publication, publication2 = PublicationFactory.create_batch(2)
+        document = DocumentFactory.create(publicatie=publication)
+        _create_log(publication, Events.create, "123", "Henk")
+        _create_log(publication, Events.update, "456", "Ingrid")
+        _create_log(document, Events.create, "456", "Ingrid")
+
+        stdout = StringIO()
+        call_command("backfill_owners", stdout=stdout)
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.owner_identifier, "123")
+        self.assertEqual(publication.owner_display_name, "Henk")
+        publication2.refresh_from_db()
+        self.assertEqual(publication2.owner_identifier, "")
+        document.refresh_from_db()
+        self.assertEqual(document.owner_identifier, "456")
+        self.assertEqual(document.owner_display_name, "Ingrid")
+        output = stdout.getvalue()
+        self.assertIn("publications.publication: done, 1 owner(s) recorded.", output)
+        self.assertIn("publications.document: done, 1 owner(s) recorded.", output)
+
+    def test_backfill_does_not_touch_modification_timestamp(self):
+        publication = PublicationFactory.create()
+        _create_log(publication, Events.create, "123", "Henk")
+
+        call_command("backfill_owners", stdout=StringIO())
+
+        updated_publication = Publication.objects.get()
+        self.assertEqual(updated_publication.owner_identifier, "123")
+        self.assertEqual(
+            updated_publication.laatst_gewijzigd_datum,
+            publication.laatst_gewijzigd_datum,
+        )
+
+    def test_backfill_in_chunks(self):
+        publications = PublicationFactory.create_batch(5)
+        for index, publication in enumerate(publications):
+            _create_log(publication, Events.create, str(index), f"User {index}")
+
+        # 3 chunks of (select pks, select logs, savepoint, update, release) and one
+        # final select for pks
+        with self.assertNumQueries(16):
+            call_command(
+                "backfill_owners",
+                model="publications.publication",
+                chunk_size=2,
+                stdout=StringIO(),
+            )
+
+        for index, publication in enumerate(publications):
+            publication.refresh_from_db()
+            self.assertEqual(publication.owner_identifier, str(index))
+
+    def test_resume_backfill(self):
+        document, document2 = DocumentFactory.create_batch(2)
+        _create_log(document, Events.create, "123", "Henk")
+        _create_log(document2, Events.create, "456", "Ingrid")
+
+        call_command(
+            "backfill_owners",
+            model="publications.document",
+            start_after=document.pk,
+            stdout=StringIO(),
+        )
+
+        self.assertQuerySetEqual(
+            Document.objects.order_by("pk").values_list("owner_identifier", flat=True),
+            ["", "456"],
+        )
+
+    def test_recorded_owners_are_not_overwritten(self):
+        publication = PublicationFactory.create(
+            owner_identifier="123", owner_display_name="Henk"
+        )
+        _create_log(publication, Events.create, "456", "Ingrid")
+
+        call_command("backfill_owners", stdout=StringIO())
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.owner_identifier, "123")
+        self.assertEqual(publication.owner_display_name, "Henk")
+
+    def test_invalid_options(self):
+        with self.subTest("unknown model"):
+            with self.assertRaisesMessage(CommandError, "Unknown model 'foo.bar'."):
+                call_command("backfill_owners", model="foo.bar", stdout=StringIO())
+
+        with self.subTest("model without owner"):
+            with self.assertRaisesMessage(
+                CommandError, "The model 'metadata.theme' does not track owners."
+            ):
+                call_command(
+                    "backfill_owners", model="metadata.theme", stdout=StringIO()
+                )
+
+        with self.subTest("resume without model"):
+            with self.assertRaisesMessage(
+                CommandError, "The --start-after option requires --model."
+            ):
+                call_command("backfill_owners", start_after=10, stdout=StringIO())
+
+        with self.subTest("invalid chunk size"):
+            with self.assertRaisesMessage(
+                CommandError, "The chunk size must be a positive number."
+            ):
+                call_command("backfill_owners", chunk_size=0, stdout=StringIO())
+
+
+class BackfillOwnersMigrationTests(TestCase):
+    def test_backfill_with_historical_models(self):
+        publication = PublicationFactory.create()
+        document = DocumentFactory.create(publicatie=publication)
+        _create_log(publication, Events.create, "123", "Henk")
+        _create_log(document, Events.create, "456", "Ingrid")
+        migration = import_module(
+            "woo_publications.publications.migrations.0017_backfill_owners"
+        )
+        state = MigrationLoader(connection).project_state(
+            ("publications", "0017_backfill_owners")
+        )
+
+        migration.backfill_publication_and_document_owners(state.apps, None)
+
+        publication.refresh_from_db()
+        self.assertEqual(publication.owner_identifier, "123")
+        self.assertEqual(publication.owner_display_name, "Henk")
+        document.refresh_from_db()
+        self.assertEqual(document.owner_identifier, "456")
+        self.assertEqual(document.owner_display_name, "Ingrid")
@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase
+
+from ..benchmarks import benchmark_audit_log
+from ..models import TimelineLogProxy
+
+
+# the buffered records are written when the transaction is committed
+class AuditLogBenchmarkTests(TransactionTestCase):
+    def test_benchmark_audit_log(self):
+        result = benchmark_audit_log(events=20)
+
+        self.assertEqual(result.events, 20)
+        self.assertEqual(result.synchronous.queries, 20)
+        # the insert, in a transaction
+        self.assertLessEqual(result.buffered.queries, 3)
+        self.assertGreater(result.synchronous.total_time, 0)
+        self.assertGreaterEqual(result.buffered.total_time, result.buffered.record_time)
+        # cleaned up
+        self.assertFalse(TimelineLogProxy.objects.exists())
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command("benchmark_audit_log", events=5, stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("synchronous", lines[0])
+        self.assertIn("5 queries", lines[0])
+        self.assertIn("buffered", lines[1])
+
+    def test_command_invalid_events(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_audit_log", events=0, stdout=StringIO())
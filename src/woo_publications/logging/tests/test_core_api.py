@@ -1,6 +1,7 @@
 from django.test import TestCase
 
 from woo_publications.accounts.tests.factories import UserFactory
+from woo_publications.publications.tests.factories import PublicationFactory
 
 from ..constants import Events
 from ..logevent import _audit_event
@@ -46,3 +47,41 @@ class LogEventTests(TestCase):
                 user_id="",
                 user_display="bar",
             )
+
+    def test_create_event_records_owner(self):
+        user = UserFactory.create(username="admin", first_name="", last_name="")
+        publication = PublicationFactory.create()
+
+        with self.subTest("other events do not record the owner"):
+            _audit_event(
+                content_object=publication,
+                event=Events.read,
+                user_id="123",
+                user_display="Henk",
+            )
+
+            publication.refresh_from_db()
+            self.assertEqual(publication.owner_identifier, "")
+
+        with self.subTest("API user"):
+            _audit_event(
+                content_object=publication,
+                event=Events.create,
+                user_id="123",
+                user_display="Henk",
+            )
+
+            publication.refresh_from_db()
+            self.assertEqual(publication.owner_identifier, "123")
+            self.assertEqual(publication.owner_display_name, "Henk")
+
+        with self.subTest("Django user"):
+            _audit_event(
+                content_object=publication,
+                event=Events.create,
+                django_user=user,
+            )
+
+            publication.refresh_from_db()
+            self.assertEqual(publication.owner_identifier, str(user.pk))
+            self.assertEqual(publication.owner_display_name, "admin")
@@ -0,0 +1,209 @@
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from asgiref.sync import async_to_sync, sync_to_async
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.accounts.tests.factories import UserFactory
+from woo_publications.api.tests.mixins import AUDIT_HEADERS, TokenAuthMixin
+from woo_publications.publications.tests.factories import PublicationFactory
+
+from ..constants import Events
+from ..logevent import audit_api_create_bulk, audit_api_read
+from ..middleware import AuditLogBufferMiddleware
+from ..models import TimelineLogProxy
+from ..sinks import BufferedSink, SynchronousSink, buffered_audit_log, get_sink
+
+
+def _record_read(content_object, remarks: str = "remark") -> None:
+    audit_api_read(
+        content_object=content_object,
+        user_id="123",
+        user_display="Henk",
+        remarks=remarks,
+    )
+
+
+class SinkTests(TestCase):
+    def test_synchronous_by_default(self):
+        user = UserFactory.create()
+
+        self.assertIsInstance(get_sink(), SynchronousSink)
+        with self.captureOnCommitCallbacks() as callbacks:
+            _record_read(user)
+
+        self.assertEqual(callbacks, [])
+        log = TimelineLogProxy.objects.get()
+        self.assertEqual(log.content_object, user)
+        self.assertEqual(log.extra_data["_cached_object_repr"], str(user))
+
+    def test_buffered_records_are_inserted_in_bulk(self):
+        user = UserFactory.create(username="henk")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with buffered_audit_log() as sink:
+                self.assertIs(get_sink(), sink)
+                for remarks in ("first", "second", "third"):
+                    _record_read(user, remarks=remarks)
+
+        self.assertFalse(TimelineLogProxy.objects.exists())
+        with self.assertNumQueries(1):
+            for callback in callbacks:
+                callback()
+        self.assertIsInstance(get_sink(), SynchronousSink)
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual(
+            [log.extra_data["remarks"] for log in logs], ["first", "second", "third"]
+        )
+        self.assertEqual(logs[0].extra_data["_cached_object_repr"], "henk")
+        self.assertEqual(logs[0].event, Events.read)
+
+    def test_buffered_records_of_rolled_back_changes_are_discarded(self):
+        user = UserFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_log():
+                _record_read(user, remarks="kept")
+                try:
+                    with transaction.atomic():
+                        _record_read(user, remarks="discarded")
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+
+        log = TimelineLogProxy.objects.get()
+        self.assertEqual(log.extra_data["remarks"], "kept")
+
+    def test_nested_scopes_share_the_buffer(self):
+        user = UserFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_log() as outer:
+                with buffered_audit_log() as inner:
+                    self.assertIs(inner, outer)
+                    _record_read(user)
+
+                # the inner scope doesn't flush
+                self.assertEqual(len(outer.pending), 0)
+                _record_read(user)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+    def test_buffered_bulk_create(self):
+        publications = PublicationFactory.create_batch(2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_log():
+                audit_api_create_bulk(
+                    content_objects=publications,
+                    user_id="123",
+                    user_display="Henk",
+                    remarks="remark",
+                )
+                self.assertFalse(TimelineLogProxy.objects.exists())
+
+            # the owner is recorded right away
+            publications[0].refresh_from_db()
+            self.assertEqual(publications[0].owner_identifier, "123")
+
+        self.assertEqual(
+            TimelineLogProxy.objects.filter(extra_data__event=Events.create).count(), 2
+        )
+
+    def test_invalid_records_are_rejected_when_written(self):
+        user = UserFactory.create()
+
+        with (
+            buffered_audit_log() as sink,
+            self.assertRaisesMessage(ValueError, "'extra_data' may not be empty."),
+        ):
+            sink.write([TimelineLogProxy(content_object=user, extra_data=None)])
+
+
+class AuditLogBufferMiddlewareTests(TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory.create()
+
+    def _view(self, request):
+        self.sink = get_sink()
+        _record_read(self.user)
+        _record_read(self.user)
+        return HttpResponse()
+
+    @override_settings(AUDIT_LOG_SINK="synchronous")
+    def test_synchronous(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            AuditLogBufferMiddleware(self._view)
+
+    @override_settings(AUDIT_LOG_SINK="buffered")
+    def test_buffered(self):
+        middleware = AuditLogBufferMiddleware(self._view)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            middleware(RequestFactory().get("/"))
+
+            self.assertIsInstance(self.sink, BufferedSink)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+    @override_settings(AUDIT_LOG_SINK="buffered")
+    def test_buffered_async(self):
+        async def view(request):
+            return await sync_to_async(self._view)(request)
+
+        middleware = AuditLogBufferMiddleware(view)
+
+        # the database is accessed from this thread, like the (sync) view
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(middleware)(RequestFactory().get("/"))
+
+            self.assertIsInstance(self.sink, BufferedSink)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+    @override_settings(AUDIT_LOG_SINK="bogus")
+    def test_unknown_sink(self):
+        with self.assertRaisesMessage(
+            ImproperlyConfigured,
+            "Unknown AUDIT_LOG_SINK 'bogus', use 'synchronous' or 'buffered'.",
+        ):
+            AuditLogBufferMiddleware(self._view)
+
+    @override_settings(AUDIT_LOG_SINK="synchronous")
+    def test_api_request_synchronous(self):
+        publication = PublicationFactory.create()
+        url = reverse("api:publication-detail", kwargs={"uuid": str(publication.uuid)})
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.get(url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    @override_settings(AUDIT_LOG_SINK="buffered")
+    def test_api_request(self):
+        publication = PublicationFactory.create(officiele_titel="title one")
+        url = reverse("api:publication-detail", kwargs={"uuid": str(publication.uuid)})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        log = TimelineLogProxy.objects.get()
+        self.assertEqual(
+            log.extra_data,
+            {
+                "event": Events.read,
+                "remarks": "remark",
+                "acting_user": {"identifier": "id", "display_name": "username"},
+                "_cached_object_repr": "title one",
+            },
+        )
@@ -71,7 +71,7 @@ class OrganisationSerializer(serializers.ModelSerializer):
 
 class ThemeSerializer(serializers.ModelSerializer):
     sub_themes = serializers.ListField(
-        source="get_children",
+        source="get_sub_themes",
         child=RecursiveField(),
         help_text=_("The nested themes attached to this current theme."),
     )
@@ -4,13 +4,20 @@ from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import mixins, viewsets
 
+from woo_publications.api.caching import CachedResponseMixin
 from woo_publications.logging.service import (
     AuditTrailCreateMixin,
     AuditTrailRetrieveMixin,
     AuditTrailUpdateMixin,
 )
 
+from ..constants import (
+    INFORMATION_CATEGORY_CACHE_NAMESPACE,
+    ORGANISATION_CACHE_NAMESPACE,
+    THEME_CACHE_NAMESPACE,
+)
 from ..models import InformationCategory, Organisation, Theme
+from ..theme_tree import get_theme_tree
 from .filters import InformationCategoryFilterSet, OrganisationFilterSet
 from .serializers import (
     InformationCategorySerializer,
@@ -33,8 +40,9 @@ from .serializers import (
     ),
 )
 class InformationCategoryViewSet(
-    AuditTrailRetrieveMixin, viewsets.ReadOnlyModelViewSet
+    AuditTrailRetrieveMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet
 ):
+    cache_namespace = INFORMATION_CATEGORY_CACHE_NAMESPACE
     queryset = InformationCategory.objects.all()
     serializer_class = InformationCategorySerializer
     filterset_class = InformationCategoryFilterSet
@@ -70,6 +78,7 @@ class OrganisationViewSet(
     AuditTrailCreateMixin,
     AuditTrailRetrieveMixin,
     AuditTrailUpdateMixin,
+    CachedResponseMixin,
     # DRF model Viewset mixins
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -78,6 +87,7 @@ class OrganisationViewSet(
     # Viewset
     viewsets.GenericViewSet,
 ):
+    cache_namespace = ORGANISATION_CACHE_NAMESPACE
     queryset = Organisation.objects.order_by("pk")
     serializer_class = OrganisationSerializer
     filterset_class = OrganisationFilterSet
@@ -105,17 +115,18 @@ class OrganisationViewSet(
         description=_("Retrieve a specific theme."),
     ),
 )
-class ThemeViewSet(AuditTrailRetrieveMixin, viewsets.ReadOnlyModelViewSet):
+class ThemeViewSet(
+    AuditTrailRetrieveMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet
+):
+    cache_namespace = THEME_CACHE_NAMESPACE
     queryset = Theme.objects.all().order_by("path")
     serializer_class = ThemeSerializer
     lookup_field = "uuid"
     lookup_value_converter = "uuid"
 
     def filter_queryset(self, queryset):
-        qs = super().filter_queryset(queryset)
-        # for list operations, restrict to the root nodes and let the serializer
-        # look up the children.
-        # See #63 for the ticket to optimize this!
+        # for list operations, serve the root nodes with the sub themes linked, built
+        # from a single query
         if self.action == "list":
-            qs = qs.filter(depth=1)
-        return qs
+            return get_theme_tree()
+        return super().filter_queryset(queryset)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class MetadataConfig(AppConfig):
     name = "woo_publications.metadata"
+
+    def ready(self):
+        from . import signals  # noqa
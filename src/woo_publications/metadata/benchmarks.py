@@ -0,0 +1,117 @@
+"""
+Measure the performance of the value list synchronization.
+
+The benchmarks run against a synthetic value list, inside a transaction that is rolled
+back afterwards, so they can be run against a database with real data.
+"""
+
+import time
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from .theme_sync import sync_themes
+from .value_list_sync import SyncResult
+
+__all__ = [
+    "ThemeSyncBenchmarkResult",
+    "ThemeSyncMeasurement",
+    "benchmark_theme_sync",
+    "synthetic_taxonomy",
+]
+
+_CONCEPT = "http://www.w3.org/2004/02/skos/core#Concept"
+_PREF_LABEL = "http://www.w3.org/2004/02/skos/core#prefLabel"
+_BROADER = "http://www.w3.org/2004/02/skos/core#broader"
+
+
+@dataclass
+class ThemeSyncMeasurement:
+    result: SyncResult
+    wall_time: float
+    """
+    The elapsed time in seconds.
+    """
+    queries: int
+
+
+@dataclass
+class ThemeSyncBenchmarkResult:
+    size: int
+    initial: ThemeSyncMeasurement
+    """
+    Synchronizing the value list into an empty tree.
+    """
+    unchanged: ThemeSyncMeasurement
+    """
+    Synchronizing the same value list again.
+    """
+    moved: ThemeSyncMeasurement
+    """
+    Synchronizing the value list after sub trees were moved to other parents.
+    """
+
+
+def _get_identifier(index: int) -> str:
+    return f"https://example.com/themes/{index}"
+
+
+def synthetic_taxonomy(size: int, breadth: int, moved: int = 0) -> list[dict]:
+    """
+    Build the value list of a tree of ``size`` themes.
+
+    There are ``breadth`` root themes and every theme has ``breadth`` sub themes,
+    until the size is reached.
+
+    :param moved: the number of sub trees, below the root themes, that are moved to
+      the next root theme.
+    """
+    data = []
+    for index in range(size):
+        parent = index // breadth - 1 if index >= breadth else None
+        # the themes directly below the roots are numbered from breadth on
+        if parent is not None and index - breadth < moved:
+            parent = (parent + 1) % breadth
+        concept: dict = {
+            "@id": _get_identifier(index),
+            "@type": [_CONCEPT],
+            _PREF_LABEL: [{"@value": f"theme {index:06d}"}],
+        }
+        if parent is not None:
+            concept[_BROADER] = [{"@id": _get_identifier(parent)}]
+        data.append(concept)
+    return data
+
+
+def _measure(data: list[dict]) -> ThemeSyncMeasurement:
+    with CaptureQueriesContext(connection) as context:
+        start = time.perf_counter()
+        result = sync_themes(data)
+        wall_time = time.perf_counter() - start
+    return ThemeSyncMeasurement(
+        result=result, wall_time=wall_time, queries=len(context.captured_queries)
+    )
+
+
+def benchmark_theme_sync(
+    *, size: int = 10_000, breadth: int = 10, moved: int = 10
+) -> ThemeSyncBenchmarkResult:
+    """
+    Synchronize a synthetic tree of themes, like the theme value list sync.
+
+    The changes are rolled back afterwards.
+
+    :param size: the number of themes.
+    :param breadth: the number of root themes and of sub themes of every theme.
+    :param moved: the number of sub trees which are moved in the last measurement.
+    """
+    with transaction.atomic():
+        result = ThemeSyncBenchmarkResult(
+            size=size,
+            initial=_measure(synthetic_taxonomy(size, breadth)),
+            unchanged=_measure(synthetic_taxonomy(size, breadth)),
+            moved=_measure(synthetic_taxonomy(size, breadth, moved=moved)),
+        )
+        transaction.set_rollback(True)
+    return result
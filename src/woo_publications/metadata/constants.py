@@ -12,3 +12,9 @@ class OrganisationOrigins(TextChoices):
     so_list = "solijst", _("Collaborative organisations list")
     oorg_list = "oorglijst", _("Alternative government organisations")
     custom_entry = "zelf_toegevoegd", _("Custom entry")
+
+
+# the namespaces of the cached API responses, see woo_publications.api.caching
+INFORMATION_CATEGORY_CACHE_NAMESPACE = "information-categories"
+ORGANISATION_CACHE_NAMESPACE = "organisations"
+THEME_CACHE_NAMESPACE = "themes"
@@ -0,0 +1,175 @@
+"""
+Load the fixtures of the value lists quickly, e.g. every time a container starts.
+
+``loaddata`` looks up and saves every object by its natural key. Instead, a fixture
+file is skipped if its checksum matches the checksum of the last loaded version, and
+otherwise its objects are upserted in bulk by identifier
+(``INSERT ... ON CONFLICT (identifier) DO UPDATE``). Only the fields in the fixture are
+updated, which leaves e.g. the active state of the organisations alone.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from django.apps import apps
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Cast, Concat
+
+from treebeard.mp_tree import MP_Node
+
+from woo_publications.api import caching
+
+from .constants import (
+    INFORMATION_CATEGORY_CACHE_NAMESPACE,
+    ORGANISATION_CACHE_NAMESPACE,
+    THEME_CACHE_NAMESPACE,
+)
+from .keep_organisations_active import keep_organisations_active
+from .models import InformationCategory, LoadedFixture, Organisation, Theme
+from .value_list_sync import BATCH_SIZE
+
+__all__ = [
+    "FixtureError",
+    "LoadedFixtureResult",
+    "find_fixture",
+    "load_fixture",
+    "load_fixtures",
+]
+
+CACHE_NAMESPACES: dict[type[models.Model], str] = {
+    InformationCategory: INFORMATION_CATEGORY_CACHE_NAMESPACE,
+    Organisation: ORGANISATION_CACHE_NAMESPACE,
+    Theme: THEME_CACHE_NAMESPACE,
+}
+"""
+The models that can be loaded, with the namespace of their cached API responses.
+"""
+
+
+class FixtureError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(message)
+
+
+@dataclass
+class LoadedFixtureResult:
+    name: str
+    loaded: int | None
+    """
+    The number of loaded objects, ``None`` if the fixture was unchanged.
+    """
+
+
+def find_fixture(label: str) -> Path:
+    """
+    Find the fixture file by path, or by name in the fixture directories.
+    """
+    path = Path(label)
+    directories = [Path(), *map(Path, settings.FIXTURE_DIRS)]
+    directories.append(settings.DJANGO_PROJECT_DIR / "fixtures")
+    for directory in directories:
+        for candidate in (directory / path, directory / f"{label}.json"):
+            if candidate.is_file():
+                return candidate.resolve()
+    raise FixtureError(f"No fixture named '{label}' found.")
+
+
+@dataclass
+class _ModelObjects:
+    fields: set[str]
+    """
+    The attribute names of the fields in the fixture.
+    """
+    instances: list[models.Model]
+
+
+def _get_objects(content: bytes, name: str) -> dict[type[models.Model], _ModelObjects]:
+    try:
+        objects = json.loads(content)
+    except ValueError as err:
+        raise FixtureError(f"The fixture '{name}' is not valid JSON.") from err
+
+    model_objects: dict[type[models.Model], _ModelObjects] = {}
+    for obj in objects:
+        model = apps.get_model(obj["model"])
+        if model not in CACHE_NAMESPACES:
+            raise FixtureError(
+                f"The fixture '{name}' contains unsupported {obj['model']} objects."
+            )
+        values = {}
+        for field_name, value in obj["fields"].items():
+            field = cast(models.Field, model._meta.get_field(field_name))
+            values[field.attname] = field.to_python(value)
+
+        if model not in model_objects:
+            model_objects[model] = _ModelObjects(fields=set(), instances=[])
+        model_objects[model].fields.update(values)
+        model_objects[model].instances.append(model(**values))
+    return model_objects
+
+
+def _upsert(model: type[models.Model], objects: _ModelObjects) -> None:
+    if issubclass(model, MP_Node):
+        # the paths are unique, move the existing themes out of the way first
+        identifiers = [
+            getattr(instance, "identifier") for instance in objects.instances
+        ]
+        model._default_manager.filter(identifier__in=identifiers).update(
+            path=Concat(models.Value("-"), Cast("pk", output_field=models.CharField()))
+        )
+    # a plain queryset, the ordered model queryset would overwrite the order
+    models.QuerySet(model).bulk_create(
+        objects.instances,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["identifier"],
+        update_fields=sorted(objects.fields - {"identifier"}),
+    )
+
+
+def load_fixture(path: Path, *, force: bool = False) -> LoadedFixtureResult:
+    """
+    Load the fixture file, unless it wasn't changed since it was last loaded.
+    """
+    name = str(path)
+    content = path.read_bytes()
+    checksum = hashlib.sha256(content).hexdigest()
+    if (
+        not force
+        and LoadedFixture.objects.filter(name=name, checksum=checksum).exists()
+    ):
+        return LoadedFixtureResult(name=name, loaded=None)
+
+    model_objects = _get_objects(content, name)
+    try:
+        with transaction.atomic():
+            for model, objects in model_objects.items():
+                _upsert(model, objects)
+                caching.invalidate(CACHE_NAMESPACES[model])
+            LoadedFixture.objects.update_or_create(
+                name=name, defaults={"checksum": checksum}
+            )
+    except IntegrityError as err:
+        raise FixtureError(f"Could not load the fixture '{name}': {err}") from err
+
+    return LoadedFixtureResult(
+        name=name,
+        loaded=sum(len(objects.instances) for objects in model_objects.values()),
+    )
+
+
+def load_fixtures(
+    paths: Iterable[Path], *, force: bool = False
+) -> list[LoadedFixtureResult]:
+    """
+    Load the fixture files in one transaction, keeping the active organisations
+    active.
+    """
+    with keep_organisations_active():
+        return [load_fixture(path, force=force) for path in paths]
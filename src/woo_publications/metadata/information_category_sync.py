@@ -1,12 +1,18 @@
+from collections.abc import Mapping
+from concurrent.futures import Future
 from pathlib import Path
 
 from django.core import serializers
+from django.db import transaction
 
-import requests
 from glom import PathAccessError, T, glom
 
-from .constants import InformationCategoryOrigins
+from woo_publications.api import caching
+
+from .constants import INFORMATION_CATEGORY_CACHE_NAMESPACE, InformationCategoryOrigins
 from .models import InformationCategory
+from .value_list_client import ValueList, ValueListFetchError, fetch_value_lists
+from .value_list_sync import SyncResult, sync_value_list
 
 WAARDENLIJST_URL = "https://repository.officiele-overheidspublicaties.nl/waardelijsten/scw_woo_informatiecategorieen/3/json/scw_woo_informatiecategorieen_3.json"
 
@@ -26,40 +32,61 @@ class InformatieCategoryWaardenlijstError(Exception):
         super().__init__(message)
 
 
-def update_information_category(file_path: Path):
-    try:
-        response = requests.get(WAARDENLIJST_URL)
-    except requests.RequestException as err:
-        raise InformatieCategoryWaardenlijstError(
-            "Could not retrieve the value list data."
-        ) from err
+def update_information_category(
+    file_path: Path,
+    *,
+    force: bool = False,
+    value_lists: Mapping[str, Future[ValueList]] | None = None,
+) -> SyncResult | None:
+    """
+    Synchronize the information categories with the value list and dump them as a
+    fixture.
+
+    :param force: synchronize the value list, even if it wasn't modified.
+    :param value_lists: the value lists which are already being fetched.
+    :returns: the number of synchronized information categories, or ``None`` if the
+      value list wasn't modified.
+    """
+    if value_lists is None:
+        value_lists = fetch_value_lists([WAARDENLIJST_URL], force=force)
 
     try:
-        response.raise_for_status()
-    except requests.RequestException as err:
+        value_list = value_lists[WAARDENLIJST_URL].result()
+    except ValueListFetchError as err:
+        if err.status_code is None:
+            raise InformatieCategoryWaardenlijstError(
+                "Could not retrieve the value list data."
+            ) from err
         raise InformatieCategoryWaardenlijstError(
-            f"Got an unexpected response status code when retrieving the value list data: {response.status_code}."
+            f"Got an unexpected response status code when retrieving the value list data: {err.status_code}."
         ) from err
 
-    data = response.json()
-    if not data:
-        raise InformatieCategoryWaardenlijstError(
-            "Received empty data from value list."
-        )
-
-    for waardenlijst in data:
-        # filter out all ids that aren't waardenlijsten
-        if (
-            not waardenlijst["@type"][0]
-            == "http://www.w3.org/2004/02/skos/core#Concept"
-        ):
-            continue
-
-        fields = glom(waardenlijst, SPEC, skip_exc=PathAccessError)
-        InformationCategory.objects.update_or_create(
-            identifier=waardenlijst["@id"],
-            defaults={**fields, "oorsprong": InformationCategoryOrigins.value_list},
-        )
+    result = None
+    if value_list.modified:
+        data = value_list.json()
+        if not data:
+            raise InformatieCategoryWaardenlijstError(
+                "Received empty data from value list."
+            )
+
+        entries: dict[str, dict] = {}
+        for waardenlijst in data:
+            # filter out all ids that aren't waardenlijsten
+            if (
+                not waardenlijst["@type"][0]
+                == "http://www.w3.org/2004/02/skos/core#Concept"
+            ):
+                continue
+
+            fields = glom(waardenlijst, SPEC, skip_exc=PathAccessError)
+            entries[waardenlijst["@id"]] = {
+                **fields,
+                "oorsprong": InformationCategoryOrigins.value_list,
+            }
+
+        result = sync_value_list(InformationCategory, entries)
+        caching.invalidate(INFORMATION_CATEGORY_CACHE_NAMESPACE)
+        transaction.on_commit(value_list.mark_synchronized)
 
     value_list_information_categories = InformationCategory.objects.filter(
         oorsprong=InformationCategoryOrigins.value_list
@@ -74,3 +101,5 @@ def update_information_category(file_path: Path):
 
     with open(file_path, "w") as outfile:
         outfile.write(fixture_data)
+
+    return result
@@ -3,18 +3,23 @@ from uuid import UUID
 
 from django.db import transaction
 
+from woo_publications.api import caching
+
+from .constants import ORGANISATION_CACHE_NAMESPACE
 from .models import Organisation
 
 
 @contextmanager
-@transaction.atomic
 def keep_organisations_active():
-    active_organisations_uuids: list[UUID] = list(
-        Organisation.objects.filter(is_actief=True).values_list("uuid", flat=True)
-    )
-    try:
-        yield
-    finally:
-        Organisation.objects.filter(uuid__in=active_organisations_uuids).update(
-            is_actief=True
+    # the atomic decorator would only wrap the creation of the generator
+    with transaction.atomic():
+        active_organisations_uuids: list[UUID] = list(
+            Organisation.objects.filter(is_actief=True).values_list("uuid", flat=True)
         )
+        try:
+            yield
+        finally:
+            Organisation.objects.filter(uuid__in=active_organisations_uuids).update(
+                is_actief=True
+            )
+            caching.invalidate(ORGANISATION_CACHE_NAMESPACE)
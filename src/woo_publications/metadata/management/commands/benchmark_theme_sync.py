@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks import benchmark_theme_sync
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the duration and number of queries of synchronizing a synthetic "
+        "tree of themes. The changes to the database are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            action="store",
+            type=int,
+            default=10_000,
+            help="The number of themes.",
+        )
+        parser.add_argument(
+            "--breadth",
+            action="store",
+            type=int,
+            default=10,
+            help="The number of root themes and of sub themes of every theme.",
+        )
+        parser.add_argument(
+            "--moved",
+            action="store",
+            type=int,
+            default=10,
+            help="The number of sub trees that are moved to another parent.",
+        )
+
+    def handle(self, *args, **options):
+        size: int = options["size"]
+        breadth: int = options["breadth"]
+        moved: int = options["moved"]
+        if size < 1 or breadth < 1:
+            raise CommandError("The size and breadth must be positive numbers.")
+        if not 0 <= moved <= min(breadth * breadth, max(size - breadth, 0)):
+            raise CommandError(
+                "The number of moved sub trees must be between 0 and the number of "
+                "themes directly below the root themes."
+            )
+
+        result = benchmark_theme_sync(size=size, breadth=breadth, moved=moved)
+        for label, measurement in (
+            ("initial", result.initial),
+            ("unchanged", result.unchanged),
+            ("moved", result.moved),
+        ):
+            self.stdout.write(
+                f"{label:>9}: {measurement.wall_time:7.3f} s, "
+                f"{measurement.queries:>4} queries ({measurement.result})"
+            )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...fixture_loader import FixtureError, find_fixture, load_fixtures
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the fixtures of the information categories, themes and organisations "
+        "in bulk, skipping the fixtures that weren't changed since they were last "
+        "loaded. Active organisations remain active."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="fixture",
+            nargs="+",
+            help="The names of or paths to the fixture files.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Load the fixtures, even if they weren't changed.",
+        )
+
+    def handle(self, *fixture_labels, **options):
+        try:
+            paths = [find_fixture(label) for label in fixture_labels]
+            results = load_fixtures(paths, force=options["force"])
+        except FixtureError as err:
+            raise CommandError(err.message) from err
+
+        for result in results:
+            if result.loaded is None:
+                self.stdout.write(f"Skipped unchanged fixture {result.name}.")
+            else:
+                self.stdout.write(
+                    f"Loaded {result.loaded} object(s) from fixture {result.name}."
+                )
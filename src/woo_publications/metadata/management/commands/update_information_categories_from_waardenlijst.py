@@ -23,6 +23,14 @@ class Command(BaseCommand):
                 / "information_categories.json",
             ),
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Synchronize the value list, even if it wasn't modified since the "
+                "last synchronization."
+            ),
+        )
 
     def handle(self, *args, **options):
         file_path = options["file_path"]
@@ -30,6 +38,11 @@ class Command(BaseCommand):
             file_path = Path(file_path)
 
         try:
-            update_information_category(file_path)
+            result = update_information_category(file_path, force=options["force"])
         except InformatieCategoryWaardenlijstError as err:
             raise CommandError(err.message) from err
+
+        if result is None:
+            self.stdout.write("The value list wasn't modified.")
+        else:
+            self.stdout.write(f"Synchronized the value list: {result}.")
@@ -18,6 +18,14 @@ class Command(BaseCommand):
                 settings.DJANGO_PROJECT_DIR / "fixtures" / "organisations.json",
             ),
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Synchronize the value lists, even if they weren't modified since the "
+                "last synchronization."
+            ),
+        )
 
     def handle(self, *args, **options):
         file_path = options["file_path"]
@@ -25,6 +33,11 @@ class Command(BaseCommand):
             file_path = Path(file_path)
 
         try:
-            update_organisation(file_path)
+            result = update_organisation(file_path, force=options["force"])
         except OrganisatieWaardenlijstError as err:
             raise CommandError(err.message) from err
+
+        if result is None:
+            self.stdout.write("The value lists weren't modified.")
+        else:
+            self.stdout.write(f"Synchronized the value lists: {result}.")
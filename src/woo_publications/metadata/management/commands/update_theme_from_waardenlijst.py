@@ -18,6 +18,14 @@ class Command(BaseCommand):
                 settings.DJANGO_PROJECT_DIR / "fixtures" / "themes.json",
             ),
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Synchronize the value list, even if it wasn't modified since the "
+                "last synchronization."
+            ),
+        )
 
     def handle(self, *args, **options):
         file_path = options["file_path"]
@@ -25,6 +33,11 @@ class Command(BaseCommand):
             file_path = Path(file_path)
 
         try:
-            update_theme(file_path)
+            result = update_theme(file_path, force=options["force"])
         except ThemeWaardenlijstError as err:
             raise CommandError(err.message) from err
+
+        if result is None:
+            self.stdout.write("The value list wasn't modified.")
+        else:
+            self.stdout.write(f"Synchronized the value list: {result}.")
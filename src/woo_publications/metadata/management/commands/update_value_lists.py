@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ... import information_category_sync, organisation_sync, theme_sync
+from ...value_list_client import fetch_value_lists
+
+
+class Command(BaseCommand):
+    help = (
+        "Retrieve the information categories, themes and organisations from the "
+        "value lists published on overheid.nl concurrently and dump them as fixtures."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fixtures-dir",
+            action="store",
+            help="The directory where the fixture files will be created.",
+            default=Path(settings.DJANGO_PROJECT_DIR / "fixtures"),
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help=(
+                "Synchronize the value lists, even if they weren't modified since the "
+                "last synchronization."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        fixtures_dir = options["fixtures_dir"]
+        if not isinstance(fixtures_dir, Path):
+            fixtures_dir = Path(fixtures_dir)
+
+        value_lists = fetch_value_lists(
+            [
+                information_category_sync.WAARDENLIJST_URL,
+                theme_sync.WAARDENLIJST_URL,
+                *organisation_sync.WAARDENLIJST_URLS,
+            ],
+            force=options["force"],
+        )
+
+        try:
+            information_categories = (
+                information_category_sync.update_information_category(
+                    fixtures_dir / "information_categories.json",
+                    value_lists=value_lists,
+                )
+            )
+            themes = theme_sync.update_theme(
+                fixtures_dir / "themes.json", value_lists=value_lists
+            )
+            organisations = organisation_sync.update_organisation(
+                fixtures_dir / "organisations.json", value_lists=value_lists
+            )
+        except (
+            information_category_sync.InformatieCategoryWaardenlijstError,
+            theme_sync.ThemeWaardenlijstError,
+            organisation_sync.OrganisatieWaardenlijstError,
+        ) as err:
+            raise CommandError(err.message) from err
+
+        for label, result in (
+            ("Information categories", information_categories),
+            ("Themes", themes),
+            ("Organisations", organisations),
+        ):
+            self.stdout.write(
+                f"{label}: {'not modified' if result is None else result}."
+            )
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.17 on 2026-10-18 12:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metadata", "0007_alter_organisation_is_actief"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LoadedFixture",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(max_length=255, unique=True, verbose_name="name"),
+                ),
+                ("checksum", models.CharField(max_length=64, verbose_name="checksum")),
+                (
+                    "loaded_at",
+                    models.DateTimeField(auto_now=True, verbose_name="loaded at"),
+                ),
+            ],
+            options={
+                "verbose_name": "loaded fixture",
+                "verbose_name_plural": "loaded fixtures",
+            },
+        ),
+    ]
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import uuid
+from collections.abc import Sequence
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -91,6 +94,11 @@ class Theme(MP_Node):
 
     objects = ThemeManager()
 
+    sub_themes: list[Theme]
+    """
+    The sub themes, linked by :func:`woo_publications.metadata.theme_tree.build_tree`.
+    """
+
     class Meta:  # pyright: ignore
         verbose_name = _("theme")
         verbose_name_plural = _("themes")
@@ -101,6 +109,14 @@ class Theme(MP_Node):
     def natural_key(self):
         return (self.identifier,)
 
+    def get_sub_themes(self) -> Sequence[Theme]:
+        """
+        Get the sub themes, without a query if they're linked already.
+        """
+        if (sub_themes := getattr(self, "sub_themes", None)) is not None:
+            return sub_themes
+        return self.get_children()
+
 
 class Organisation(models.Model):
     uuid = models.UUIDField(_("UUID"), unique=True, default=uuid.uuid4)
@@ -146,3 +162,20 @@ class Organisation(models.Model):
 
     def natural_key(self):
         return (self.identifier,)
+
+
+class LoadedFixture(models.Model):
+    """
+    The checksum of the last loaded version of a fixture file.
+    """
+
+    name = models.CharField(_("name"), max_length=255, unique=True)
+    checksum = models.CharField(_("checksum"), max_length=64)
+    loaded_at = models.DateTimeField(_("loaded at"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("loaded fixture")
+        verbose_name_plural = _("loaded fixtures")
+
+    def __str__(self):
+        return self.name
@@ -1,12 +1,24 @@
+from collections.abc import Mapping
+from concurrent.futures import Future
 from pathlib import Path
 
 from django.core import serializers
+from django.db import transaction
 
-import requests
 from glom import PathAccessError, T, glom
 
-from woo_publications.metadata.constants import OrganisationOrigins
+from woo_publications.api import caching
+from woo_publications.metadata.constants import (
+    ORGANISATION_CACHE_NAMESPACE,
+    OrganisationOrigins,
+)
 from woo_publications.metadata.models import Organisation
+from woo_publications.metadata.value_list_client import (
+    ValueList,
+    ValueListFetchError,
+    fetch_value_lists,
+)
+from woo_publications.metadata.value_list_sync import SyncResult, sync_value_list
 
 MUNICIPALITY_WAARDENLIJST_URL = (
     "https://repository.officiele-overheidspublicaties.nl/waardelijsten/"
@@ -59,24 +71,44 @@ class OrganisatieWaardenlijstError(Exception):
         super().__init__(message)
 
 
-def update_organisation(file_path: Path):
+def update_organisation(
+    file_path: Path,
+    *,
+    force: bool = False,
+    value_lists: Mapping[str, Future[ValueList]] | None = None,
+) -> SyncResult | None:
+    """
+    Synchronize the organisations with the value lists and dump them as a fixture.
+
+    :param force: synchronize the value lists, even if they weren't modified.
+    :param value_lists: the value lists which are already being fetched.
+    :returns: the number of synchronized organisations, or ``None`` if none of the
+      value lists was modified.
+    """
+    if value_lists is None:
+        value_lists = fetch_value_lists(WAARDENLIJST_URLS, force=force)
+
+    modified_value_lists: list[ValueList] = []
+    entries: dict[str, dict] = {}
     for waardenlijst_url, waardenlijst_type, oorsprong in TYPE_MAPPING:
         try:
-            response = requests.get(waardenlijst_url)
-        except requests.RequestException as err:
-            raise OrganisatieWaardenlijstError(
-                f"Could not retrieve the value list data from url `{waardenlijst_url}`."
-            ) from err
-
-        try:
-            response.raise_for_status()
-        except requests.RequestException as err:
+            value_list = value_lists[waardenlijst_url].result()
+        except ValueListFetchError as err:
+            if err.status_code is None:
+                raise OrganisatieWaardenlijstError(
+                    "Could not retrieve the value list data from url "
+                    f"`{waardenlijst_url}`."
+                ) from err
             raise OrganisatieWaardenlijstError(
                 "Got an unexpected response status code when retrieving the value "
-                f"list data from url `{waardenlijst_url}`: {response.status_code}."
+                f"list data from url `{waardenlijst_url}`: {err.status_code}."
             ) from err
 
-        data = response.json()
+        # the organisations of a type only occur in their own value list
+        if not value_list.modified:
+            continue
+
+        data = value_list.json()
         if not data:
             raise OrganisatieWaardenlijstError(
                 f"Received empty data from value list `{waardenlijst_url}`."
@@ -88,10 +120,17 @@ def update_organisation(file_path: Path):
                 continue
 
             fields = glom(waardenlijst, SPEC, skip_exc=PathAccessError)
-            Organisation.objects.update_or_create(
-                identifier=waardenlijst["@id"],
-                defaults={**fields, "oorsprong": oorsprong},
-            )
+            identifier = fields.pop("identifier")
+            entries[identifier] = {**fields, "oorsprong": oorsprong}
+
+        modified_value_lists.append(value_list)
+
+    result = None
+    if modified_value_lists:
+        result = sync_value_list(Organisation, entries)
+        caching.invalidate(ORGANISATION_CACHE_NAMESPACE)
+        for value_list in modified_value_lists:
+            transaction.on_commit(value_list.mark_synchronized)
 
     value_list_organisations = Organisation.objects.exclude(
         oorsprong=OrganisationOrigins.custom_entry
@@ -112,3 +151,5 @@ def update_organisation(file_path: Path):
 
     with open(file_path, "w") as outfile:
         outfile.write(fixture_data)
+
+    return result
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from woo_publications.api import caching
+
+from .constants import (
+    INFORMATION_CATEGORY_CACHE_NAMESPACE,
+    ORGANISATION_CACHE_NAMESPACE,
+    THEME_CACHE_NAMESPACE,
+)
+from .models import InformationCategory, Organisation, Theme
+
+
+@receiver([post_save, post_delete], sender=InformationCategory)
+def invalidate_information_category_responses(sender, **kwargs) -> None:
+    caching.invalidate(INFORMATION_CATEGORY_CACHE_NAMESPACE)
+
+
+@receiver([post_save, post_delete], sender=Organisation)
+def invalidate_organisation_responses(sender, **kwargs) -> None:
+    caching.invalidate(ORGANISATION_CACHE_NAMESPACE)
+
+
+@receiver([post_save, post_delete], sender=Theme)
+def invalidate_theme_responses(sender, **kwargs) -> None:
+    caching.invalidate(THEME_CACHE_NAMESPACE)
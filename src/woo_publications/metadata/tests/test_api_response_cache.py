@@ -0,0 +1,146 @@
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import AUDIT_HEADERS, TokenAuthMixin
+from woo_publications.logging.models import TimelineLogProxy
+
+from ..keep_organisations_active import keep_organisations_active
+from ..models import Organisation
+from .factories import InformationCategoryFactory, OrganisationFactory, ThemeFactory
+
+
+class ResponseCacheTests(TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    def _get_metadata_queries(self, url: str, **kwargs) -> list[str]:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, headers=AUDIT_HEADERS, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if "metadata_" in query["sql"]
+        ]
+
+    def test_list_served_from_cache(self):
+        InformationCategoryFactory.create_batch(2)
+        url = reverse("api:informationcategory-list")
+
+        self.assertNotEqual(self._get_metadata_queries(url), [])
+        self.assertEqual(self._get_metadata_queries(url), [])
+
+    def test_cache_keyed_by_query_parameters(self):
+        OrganisationFactory.create(naam="Active", is_actief=True)
+        OrganisationFactory.create(naam="Inactive", is_actief=False)
+        url = reverse("api:organisation-list")
+
+        response1 = self.client.get(url, headers=AUDIT_HEADERS)
+        response2 = self.client.get(url, {"isActief": "false"}, headers=AUDIT_HEADERS)
+
+        self.assertEqual(
+            [item["naam"] for item in response1.json()["results"]], ["Active"]
+        )
+        self.assertEqual(
+            [item["naam"] for item in response2.json()["results"]], ["Inactive"]
+        )
+        self.assertNotEqual(response1["ETag"], response2["ETag"])
+
+    def test_not_modified(self):
+        ThemeFactory.create()
+        url = reverse("api:theme-list")
+        etag = self.client.get(url, headers=AUDIT_HEADERS)["ETag"]
+
+        response = self.client.get(
+            url, headers={"If-None-Match": etag, **AUDIT_HEADERS}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_saving_invalidates_cached_responses(self):
+        information_category = InformationCategoryFactory.create(naam="Old")
+        url = reverse(
+            "api:informationcategory-detail",
+            kwargs={"uuid": information_category.uuid},
+        )
+        etag = self.client.get(url, headers=AUDIT_HEADERS)["ETag"]
+
+        information_category.naam = "New"
+        information_category.save()
+
+        response = self.client.get(
+            url, headers={"If-None-Match": etag, **AUDIT_HEADERS}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["naam"], "New")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cached_detail_response_is_audited(self):
+        organisation = OrganisationFactory.create()
+        url = reverse("api:organisation-detail", kwargs={"uuid": organisation.uuid})
+        self.client.get(url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(self._get_metadata_queries(url), [])
+
+        log_records = TimelineLogProxy.objects.for_object(  # pyright: ignore[reportAttributeAccessIssue]
+            organisation
+        )
+        self.assertEqual(log_records.count(), 2)
+
+    def test_detail_object_is_loaded_once(self):
+        organisation = OrganisationFactory.create()
+        url = reverse("api:organisation-detail", kwargs={"uuid": organisation.uuid})
+
+        queries = self._get_metadata_queries(url)
+
+        self.assertEqual(len(queries), 1)
+
+    def test_cached_detail_response_references_object(self):
+        organisation = OrganisationFactory.create()
+        url = reverse("api:organisation-detail", kwargs={"uuid": organisation.uuid})
+
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            self.client.get(url, headers=AUDIT_HEADERS)
+
+        cached = mock_set.call_args.args[1]
+        self.assertEqual(
+            cached.object_ref,
+            (ContentType.objects.get_for_model(Organisation).pk, organisation.pk),
+        )
+
+    def test_not_found_is_not_cached(self):
+        url = reverse(
+            "api:theme-detail", kwargs={"uuid": "00000000-0000-0000-0000-000000000000"}
+        )
+
+        response = self.client.get(url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", response)
+
+    def test_keeping_organisations_active_invalidates_cached_responses(self):
+        organisation = OrganisationFactory.create(is_actief=True)
+        url = reverse("api:organisation-list")
+
+        with keep_organisations_active():
+            # bulk updates don't send signals
+            Organisation.objects.update(is_actief=False)
+            response = self.client.get(url, headers=AUDIT_HEADERS)
+            self.assertEqual(response.json()["results"], [])
+
+        response = self.client.get(url, headers=AUDIT_HEADERS)
+        self.assertEqual(
+            [item["uuid"] for item in response.json()["results"]],
+            [str(organisation.uuid)],
+        )
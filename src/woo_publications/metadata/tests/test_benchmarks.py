@@ -0,0 +1,49 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ..benchmarks import benchmark_theme_sync, synthetic_taxonomy
+from ..models import Theme
+
+
+class ThemeSyncBenchmarkTests(TestCase):
+    def test_synthetic_taxonomy(self):
+        data = synthetic_taxonomy(12, breadth=3, moved=1)
+
+        self.assertEqual(len(data), 12)
+        broader = "http://www.w3.org/2004/02/skos/core#broader"
+        parents = [concept.get(broader, [{}])[0].get("@id") for concept in data]
+        self.assertEqual(parents[:3], [None, None, None])
+        # moved to the next root
+        self.assertEqual(parents[3], "https://example.com/themes/1")
+        self.assertEqual(parents[4], "https://example.com/themes/0")
+        self.assertEqual(parents[9], "https://example.com/themes/2")
+
+    def test_benchmark_theme_sync(self):
+        result = benchmark_theme_sync(size=200, breadth=5, moved=2)
+
+        self.assertEqual(result.size, 200)
+        self.assertEqual(result.initial.result.created, 200)
+        self.assertEqual(result.unchanged.result.updated, 0)
+        self.assertGreater(result.moved.result.updated, 0)
+        self.assertLess(result.moved.queries, 10)
+        self.assertGreater(result.initial.wall_time, 0)
+        # rolled back
+        self.assertFalse(Theme.objects.exists())
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command("benchmark_theme_sync", size=50, breadth=5, moved=1, stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("initial", lines[0])
+        self.assertIn("50 created", lines[0])
+
+    def test_command_invalid_moved(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "benchmark_theme_sync", size=50, breadth=5, moved=30, stdout=StringIO()
+            )
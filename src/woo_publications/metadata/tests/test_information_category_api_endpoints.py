@@ -1,12 +1,17 @@
 import uuid
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from woo_publications.accounts.tests.factories import UserFactory
-from woo_publications.api.tests.mixins import APIKeyUnAuthorizedMixin, TokenAuthMixin
+from woo_publications.api.tests.mixins import (
+    APIKeyUnAuthorizedMixin,
+    ConstantQueryCountMixin,
+    TokenAuthMixin,
+)
 
 from ..constants import InformationCategoryOrigins
 from .factories import InformationCategoryFactory
@@ -51,7 +56,12 @@ class InformationCategoryAPIAuthorizationAndPermissionTests(
         self.assertWrongApiKeyProhibitsGetEndpointAccess(detail_url)
 
 
-class InformationCategoryTests(TokenAuthMixin, APITestCase):
+class InformationCategoryTests(TokenAuthMixin, ConstantQueryCountMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        # the responses are cached, which isn't rolled back with the test data
+        self.addCleanup(cache.clear)
+
     def test_list_informatie_categorie(self):
         information_category = InformationCategoryFactory.create(
             identifier="https://www.example.com/waardenlijsten/1",
@@ -224,6 +234,12 @@ class InformationCategoryTests(TokenAuthMixin, APITestCase):
             data = response.json()
             self.assertEqual(data["count"], 0)
 
+    def test_list_informatie_categorie_constant_number_of_queries(self):
+        self.assertListQueryCountIsConstant(
+            reverse("api:informationcategory-list"),
+            lambda amount: InformationCategoryFactory.create_batch(amount),
+        )
+
     def test_detail_informatie_categorie(self):
         information_category = InformationCategoryFactory.create(
             identifier="https://www.example.com/waardenlijsten/1",
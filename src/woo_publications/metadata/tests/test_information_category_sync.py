@@ -25,10 +25,11 @@ class UpdateInformatieCategoryTestCase(VCRMixin, TestCase):
         with tempfile.NamedTemporaryFile(suffix=".json") as file:
             file_path = Path(file.name)
 
-            update_information_category(file_path)
+            result = update_information_category(file_path)
 
             with self.subTest("database populated"):
                 self.assertEqual(InformationCategory.objects.count(), 18)
+                self.assertEqual(result.created, 18)
 
             with self.subTest("user content does not cause conflicts"):
                 information_category = InformationCategory.objects.order_by("pk").last()
@@ -0,0 +1,144 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from ..constants import InformationCategoryOrigins
+from ..models import InformationCategory, LoadedFixture, Organisation, Theme
+from .factories import OrganisationFactory
+
+organisation_fixture = Path(
+    settings.DJANGO_PROJECT_DIR / "metadata" / "tests" / "organisations_fixture.json",
+)
+
+
+def _theme(identifier: str, naam: str, path: str, numchild: int = 0) -> dict:
+    return {
+        "model": "metadata.theme",
+        "fields": {
+            "path": path,
+            "depth": len(path) // Theme.steplen,
+            "numchild": numchild,
+            "uuid": str(uuid4()),
+            "identifier": identifier,
+            "naam": naam,
+        },
+    }
+
+
+class LoadValueListFixturesCommandTests(TestCase):
+    def _write_fixture(self, objects: list[dict]) -> Path:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "fixture.json"
+        path.write_text(json.dumps(objects))
+        return path
+
+    def _load(self, *labels: str | Path, **kwargs) -> list[str]:
+        stdout = StringIO()
+        call_command("load_value_list_fixtures", *labels, stdout=stdout, **kwargs)
+        return stdout.getvalue().splitlines()
+
+    def test_load_with_empty_db(self):
+        output = self._load(organisation_fixture)
+
+        self.assertEqual(
+            output, [f"Loaded 5 object(s) from fixture {organisation_fixture}."]
+        )
+        self.assertEqual(Organisation.objects.count(), 5)
+        self.assertFalse(Organisation.objects.filter(is_actief=True).exists())
+        self.assertTrue(LoadedFixture.objects.filter(name=organisation_fixture))
+
+    def test_load_by_name(self):
+        output = self._load("information_categories")
+
+        self.assertEqual(len(output), 1)
+        self.assertIn("information_categories.json", output[0])
+        category = InformationCategory.objects.get(
+            identifier="https://identifier.overheid.nl/tooi/def/thes/kern/c_139c6280"
+        )
+        self.assertEqual(category.order, 1010)
+        self.assertEqual(category.oorsprong, InformationCategoryOrigins.value_list)
+
+    def test_unchanged_fixture_is_skipped(self):
+        self._load(organisation_fixture)
+        Organisation.objects.update(naam="changed")
+
+        # the active organisations and the checksum (plus the savepoint queries)
+        with self.assertNumQueries(4):
+            output = self._load(organisation_fixture)
+
+        self.assertEqual(output, [f"Skipped unchanged fixture {organisation_fixture}."])
+        self.assertFalse(Organisation.objects.exclude(naam="changed").exists())
+
+        with self.subTest("forced"):
+            self._load(organisation_fixture, force=True)
+
+            self.assertFalse(Organisation.objects.filter(naam="changed").exists())
+
+    def test_existing_organisations_are_updated_and_remain_active(self):
+        organisation = OrganisationFactory.create(
+            uuid="d74932b6-63ae-488f-97d1-63b176f61ad4",
+            identifier="https://identifier.overheid.nl/tooi/id/so/so0006",
+            naam="old name",
+            is_actief=True,
+        )
+        other_organisation = OrganisationFactory.create(is_actief=True)
+
+        self._load(organisation_fixture)
+
+        self.assertEqual(Organisation.objects.count(), 6)
+        organisation.refresh_from_db()
+        self.assertEqual(organisation.naam, "Regio Gooi en Vechtstreek")
+        self.assertTrue(organisation.is_actief)
+        other_organisation.refresh_from_db()
+        self.assertTrue(other_organisation.is_actief)
+
+    def test_themes_are_moved(self):
+        self._load(
+            self._write_fixture(
+                [
+                    _theme("https://example.com/a", "A", "0001", numchild=1),
+                    _theme("https://example.com/b", "B", "00010001"),
+                    _theme("https://example.com/c", "C", "0002"),
+                ]
+            )
+        )
+
+        # B becomes a root theme and takes the path of C, which moves below A
+        self._load(
+            self._write_fixture(
+                [
+                    _theme("https://example.com/a", "A", "0001", numchild=1),
+                    _theme("https://example.com/c", "C", "00010001"),
+                    _theme("https://example.com/b", "B", "0002"),
+                ]
+            )
+        )
+
+        self.assertEqual(Theme.find_problems(), ([], [], [], [], []))
+        self.assertEqual(
+            list(Theme.objects.values_list("naam", "path")),
+            [("A", "0001"), ("C", "00010001"), ("B", "0002")],
+        )
+
+    def test_unsupported_model(self):
+        path = self._write_fixture([{"model": "auth.group", "fields": {"name": "x"}}])
+
+        with self.assertRaisesMessage(
+            CommandError,
+            f"The fixture '{path}' contains unsupported auth.group objects.",
+        ):
+            self._load(path)
+
+    def test_missing_fixture(self):
+        with self.assertRaisesMessage(
+            CommandError, "No fixture named 'not a file' found."
+        ):
+            self._load("not a file")
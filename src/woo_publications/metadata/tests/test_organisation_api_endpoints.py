@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from django.core.cache import cache
 from django.test import override_settings
 from django.urls import reverse
 
@@ -7,7 +8,11 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from woo_publications.accounts.tests.factories import UserFactory
-from woo_publications.api.tests.mixins import APIKeyUnAuthorizedMixin, TokenAuthMixin
+from woo_publications.api.tests.mixins import (
+    APIKeyUnAuthorizedMixin,
+    ConstantQueryCountMixin,
+    TokenAuthMixin,
+)
 
 from ..api.filters import OrganisationActive
 from ..constants import OrganisationOrigins
@@ -68,7 +73,11 @@ class ThemeAPIAuthorizationAndPermissionTests(APIKeyUnAuthorizedMixin, APITestCa
 
 
 @override_settings(LANGUAGE_CODE="en")
-class OrganisationApiTests(TokenAuthMixin, APITestCase):
+class OrganisationApiTests(TokenAuthMixin, ConstantQueryCountMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        # the responses are cached, which isn't rolled back with the test data
+        self.addCleanup(cache.clear)
 
     def test_list_organisations(self):
         organisation = OrganisationFactory.create(
@@ -303,6 +312,12 @@ class OrganisationApiTests(TokenAuthMixin, APITestCase):
 
             self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_list_organisations_constant_number_of_queries(self):
+        self.assertListQueryCountIsConstant(
+            reverse("api:organisation-list"),
+            lambda amount: OrganisationFactory.create_batch(amount, is_actief=True),
+        )
+
     def test_detail_organisation(self):
         organisation = OrganisationFactory.create(
             naam="object one",
@@ -27,10 +27,11 @@ class UpdateOrganisationTestCase(VCRMixin, TestCase):
         with tempfile.NamedTemporaryFile(suffix=".json") as file:
             file_path = Path(file.name)
 
-            update_organisation(file_path)
+            result = update_organisation(file_path)
 
             with self.subTest("database populated"):
                 self.assertEqual(Organisation.objects.count(), 1137)
+                self.assertEqual(result.created, 1137)
 
             with self.subTest("user content does not cause conflicts"):
                 organisation = Organisation.objects.order_by("pk").last()
@@ -55,10 +56,12 @@ class UpdateOrganisationTestCase(VCRMixin, TestCase):
         with tempfile.NamedTemporaryFile(suffix=".json") as file:
             file_path = Path(file.name)
 
-            update_organisation(file_path)
+            result = update_organisation(file_path)
 
             with self.subTest("database hasn't added extra items."):
                 self.assertEqual(Organisation.objects.count(), 1137)
+                self.assertEqual(result.created, 1136)
+                self.assertEqual(result.updated, 1)
 
             with self.subTest("organisation has updated back to original data"):
                 organisation.refresh_from_db()
@@ -1,5 +1,6 @@
 import uuid
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from rest_framework import status
@@ -49,6 +50,11 @@ class ThemeAPIAuthorizationAndPermissionTests(APIKeyUnAuthorizedMixin, APITestCa
 
 
 class ThemeTests(TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        # the responses are cached, which isn't rolled back with the test data
+        self.addCleanup(cache.clear)
+
     def test_list_theme(self):
         parent_theme = ThemeFactory.create(
             identifier="https://www.example.com/thema/1",
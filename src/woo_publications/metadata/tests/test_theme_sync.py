@@ -12,7 +12,8 @@ import requests_mock
 from woo_publications.utils.tests.vcr import VCRMixin
 
 from ..models import Theme
-from ..theme_sync import ThemeWaardenlijstError, update_theme
+from ..theme_sync import ThemeWaardenlijstError, sync_themes, update_theme
+from ..value_list_sync import SyncResult
 
 
 class UpdateThemeTestCase(VCRMixin, TestCase):
@@ -154,3 +155,151 @@ class UpdateThemeTestCase(VCRMixin, TestCase):
                 "Received empty data from value list.",
             ):
                 update_theme(file_path)
+
+
+def _concept(identifier: str, naam: str, parent: str | None = None) -> dict:
+    concept: dict = {
+        "@id": identifier,
+        "@type": ["http://www.w3.org/2004/02/skos/core#Concept"],
+        "http://www.w3.org/2004/02/skos/core#prefLabel": [{"@value": naam}],
+    }
+    if parent is not None:
+        concept["http://www.w3.org/2004/02/skos/core#broader"] = [{"@id": parent}]
+    return concept
+
+
+class SyncThemesTests(TestCase):
+    def assertTree(self, expected: list[tuple[str, int, int]]):
+        self.assertEqual(Theme.find_problems(), ([], [], [], [], []))
+        self.assertEqual(
+            list(
+                Theme.objects.order_by("path").values_list("naam", "depth", "numchild")
+            ),
+            expected,
+        )
+
+    def test_tree_is_built(self):
+        result = sync_themes(
+            [
+                _concept("https://example.com/c", "C", parent="https://example.com/a"),
+                _concept("https://example.com/b", "B"),
+                _concept("https://example.com/a", "A"),
+                _concept("https://example.com/d", "D", parent="https://example.com/c"),
+            ]
+        )
+
+        self.assertEqual(result, SyncResult(created=4))
+        self.assertTree([("A", 1, 1), ("C", 2, 1), ("D", 3, 0), ("B", 1, 0)])
+
+    def test_sub_tree_is_moved(self):
+        root_a = Theme.add_root(identifier="https://example.com/a", naam="A")
+        root_b = Theme.add_root(identifier="https://example.com/b", naam="B")
+        child = root_a.add_child(identifier="https://example.com/c", naam="C")
+        grandchild = child.add_child(identifier="https://example.com/d", naam="D")
+        root_b.add_child(identifier="https://example.com/e", naam="E")
+
+        result = sync_themes(
+            [
+                _concept("https://example.com/a", "A"),
+                _concept("https://example.com/b", "B"),
+                _concept("https://example.com/c", "C", parent="https://example.com/b"),
+                _concept("https://example.com/d", "D", parent="https://example.com/c"),
+                _concept("https://example.com/e", "E", parent="https://example.com/b"),
+            ]
+        )
+
+        self.assertTree(
+            [("A", 1, 0), ("B", 1, 2), ("C", 2, 1), ("D", 3, 0), ("E", 2, 0)]
+        )
+        grandchild.refresh_from_db()
+        self.assertEqual(grandchild.get_parent(), child)
+        self.assertEqual(grandchild.get_root(), root_b)
+        # E is sorted after C now
+        self.assertEqual(result, SyncResult(updated=5))
+
+    def test_root_becomes_child_and_child_becomes_root(self):
+        root = Theme.add_root(identifier="https://example.com/a", naam="A")
+        root.add_child(identifier="https://example.com/b", naam="B")
+        Theme.add_root(identifier="https://example.com/c", naam="C")
+
+        sync_themes(
+            [
+                _concept("https://example.com/a", "A", parent="https://example.com/c"),
+                _concept("https://example.com/b", "B"),
+                _concept("https://example.com/c", "C"),
+            ]
+        )
+
+        self.assertTree([("B", 1, 0), ("C", 1, 1), ("A", 2, 0)])
+
+    def test_siblings_are_sorted_by_name(self):
+        root = Theme.add_root(identifier="https://example.com/root", naam="Root")
+        root.add_child(identifier="https://example.com/b", naam="B")
+
+        sync_themes(
+            [
+                _concept(
+                    "https://example.com/a", "A", parent="https://example.com/root"
+                ),
+                _concept(
+                    "https://example.com/b", "B", parent="https://example.com/root"
+                ),
+                _concept("https://example.com/x", "Z"),
+            ]
+        )
+
+        self.assertTree([("Root", 1, 2), ("A", 2, 0), ("B", 2, 0), ("Z", 1, 0)])
+
+    def test_themes_not_in_value_list_keep_their_parent(self):
+        root = Theme.add_root(identifier="https://example.com/a", naam="A")
+        root.add_child(naam="Custom")
+
+        sync_themes(
+            [
+                _concept("https://example.com/0", "0"),
+                _concept("https://example.com/a", "A", parent="https://example.com/0"),
+            ]
+        )
+
+        self.assertTree([("0", 1, 1), ("A", 2, 1), ("Custom", 3, 0)])
+
+    def test_nothing_written_when_unchanged(self):
+        data = [
+            _concept("https://example.com/a", "A"),
+            _concept("https://example.com/b", "B", parent="https://example.com/a"),
+        ]
+        sync_themes(data)
+
+        # select (plus the savepoint queries)
+        with self.assertNumQueries(3):
+            result = sync_themes(data)
+
+        self.assertEqual(result, SyncResult(unchanged=2))
+
+    def test_unknown_parent(self):
+        with self.assertRaisesMessage(
+            ThemeWaardenlijstError,
+            "The parent `https://example.com/x` of the theme `https://example.com/a` "
+            "does not exist.",
+        ):
+            sync_themes(
+                [_concept("https://example.com/a", "A", parent="https://example.com/x")]
+            )
+
+        self.assertFalse(Theme.objects.exists())
+
+    def test_cycle(self):
+        with self.assertRaisesMessage(
+            ThemeWaardenlijstError,
+            "The theme `https://example.com/a` is part of a cycle.",
+        ):
+            sync_themes(
+                [
+                    _concept(
+                        "https://example.com/a", "A", parent="https://example.com/b"
+                    ),
+                    _concept(
+                        "https://example.com/b", "B", parent="https://example.com/a"
+                    ),
+                ]
+            )
@@ -0,0 +1,103 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import AUDIT_HEADERS, TokenAuthMixin
+
+from ..models import Theme
+from ..theme_tree import build_tree, get_theme_tree
+from .factories import ThemeFactory
+
+
+def _create_tree(depth: int, breadth: int, parent: Theme | None = None) -> None:
+    if not depth:
+        return
+    for index in range(breadth):
+        theme = ThemeFactory.create(naam=f"{depth}-{index}", parent=parent)
+        _create_tree(depth - 1, breadth, parent=theme)
+
+
+class ThemeTreeTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    def test_build_tree(self):
+        root = ThemeFactory.create(naam="A")
+        child1 = ThemeFactory.create(naam="B", parent=root)
+        grandchild = ThemeFactory.create(naam="C", parent=child1)
+        child2 = ThemeFactory.create(naam="D", parent=root)
+        other_root = ThemeFactory.create(naam="E")
+
+        roots = build_tree(Theme.objects.order_by("path"))
+
+        self.assertEqual(roots, [root, other_root])
+        self.assertEqual(roots[0].sub_themes, [child1, child2])
+        self.assertEqual(roots[0].sub_themes[0].sub_themes, [grandchild])
+        self.assertEqual(roots[1].sub_themes, [])
+
+    def test_build_subtree(self):
+        root = ThemeFactory.create(naam="A")
+        child = ThemeFactory.create(naam="B", parent=root)
+        grandchild = ThemeFactory.create(naam="C", parent=child)
+
+        roots = build_tree([child, grandchild])
+
+        self.assertEqual(roots, [child])
+        self.assertEqual(child.get_sub_themes(), [grandchild])
+
+    def test_tree_is_cached(self):
+        _create_tree(depth=3, breadth=2)
+        get_theme_tree()
+
+        with self.assertNumQueries(0):
+            roots = get_theme_tree()
+
+        self.assertEqual(len(roots), 2)
+
+    def test_tree_is_invalidated_when_themes_change(self):
+        root = ThemeFactory.create(naam="A")
+        get_theme_tree()
+
+        ThemeFactory.create(naam="B", parent=root)
+
+        (root,) = get_theme_tree()
+        self.assertEqual([theme.naam for theme in root.sub_themes], ["B"])
+
+
+class ThemeListQueriesTests(TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    def _get_theme_queries(self, **params) -> list[str]:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse("api:theme-list"), params, headers=AUDIT_HEADERS
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if "metadata_theme" in query["sql"]
+        ]
+
+    def test_single_query_regardless_of_depth(self):
+        for depth in (1, 3, 5):
+            with self.subTest(depth=depth):
+                Theme.objects.all().delete()
+                _create_tree(depth=depth, breadth=2)
+
+                self.assertEqual(len(self._get_theme_queries()), 1)
+
+    def test_no_queries_with_cached_tree(self):
+        _create_tree(depth=3, breadth=2)
+        self._get_theme_queries()
+
+        # a different page size isn't served from the response cache
+        self.assertEqual(self._get_theme_queries(pageSize=1), [])
@@ -1,3 +1,4 @@
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -19,10 +20,13 @@ class TestUpdateInformationCategoriesFromWaardenlijstCommand(VCRMixin, TestCase)
         ".update_information_categories_from_waardenlijst.update_information_category",
     )
     def test_default_fixture_path(self, mock_update: MagicMock):
-        call_command("update_information_categories_from_waardenlijst")
+        call_command(
+            "update_information_categories_from_waardenlijst", stdout=StringIO()
+        )
 
         mock_update.assert_called_once_with(
-            settings.DJANGO_PROJECT_DIR / "fixtures" / "information_categories.json"
+            settings.DJANGO_PROJECT_DIR / "fixtures" / "information_categories.json",
+            force=False,
         )
 
     @patch(
@@ -33,9 +37,10 @@ class TestUpdateInformationCategoriesFromWaardenlijstCommand(VCRMixin, TestCase)
         call_command(
             "update_information_categories_from_waardenlijst",
             file_path="/tmp/dummy.json",
+            stdout=StringIO(),
         )
 
-        mock_update.assert_called_once_with(Path("/tmp/dummy.json"))
+        mock_update.assert_called_once_with(Path("/tmp/dummy.json"), force=False)
 
     @requests_mock.Mocker()
     def test_raise_command_error(self, m):
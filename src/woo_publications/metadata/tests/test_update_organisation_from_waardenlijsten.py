@@ -1,3 +1,4 @@
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -20,10 +21,11 @@ class TestUpdateOrganisationFromWaardenlijstenCommand(VCRMixin, TestCase):
         ".update_organisation_from_waardenlijsten.update_organisation",
     )
     def test_default_fixture_path(self, mock_update: MagicMock):
-        call_command("update_organisation_from_waardenlijsten")
+        call_command("update_organisation_from_waardenlijsten", stdout=StringIO())
 
         mock_update.assert_called_once_with(
-            settings.DJANGO_PROJECT_DIR / "fixtures" / "organisations.json"
+            settings.DJANGO_PROJECT_DIR / "fixtures" / "organisations.json",
+            force=False,
         )
 
     @patch(
@@ -32,10 +34,12 @@ class TestUpdateOrganisationFromWaardenlijstenCommand(VCRMixin, TestCase):
     )
     def test_command_with_file_path_flag(self, mock_update: MagicMock):
         call_command(
-            "update_organisation_from_waardenlijsten", file_path="/tmp/dummy.json"
+            "update_organisation_from_waardenlijsten",
+            file_path="/tmp/dummy.json",
+            stdout=StringIO(),
         )
 
-        mock_update.assert_called_once_with(Path("/tmp/dummy.json"))
+        mock_update.assert_called_once_with(Path("/tmp/dummy.json"), force=False)
 
     @requests_mock.Mocker()
     def test_raise_command_error(self, m):
@@ -1,3 +1,4 @@
+from io import StringIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -19,10 +20,11 @@ class TestUpdateThemeFromWaardenlijstCommand(VCRMixin, TestCase):
         ".update_theme_from_waardenlijst.update_theme",
     )
     def test_default_fixture_path(self, mock_update: MagicMock):
-        call_command("update_theme_from_waardenlijst")
+        call_command("update_theme_from_waardenlijst", stdout=StringIO())
 
         mock_update.assert_called_once_with(
-            settings.DJANGO_PROJECT_DIR / "fixtures" / "themes.json"
+            settings.DJANGO_PROJECT_DIR / "fixtures" / "themes.json",
+            force=False,
         )
 
     @patch(
@@ -30,9 +32,13 @@ class TestUpdateThemeFromWaardenlijstCommand(VCRMixin, TestCase):
         ".update_theme_from_waardenlijst.update_theme",
     )
     def test_command_with_file_path_flag(self, mock_update: MagicMock):
-        call_command("update_theme_from_waardenlijst", file_path="/tmp/dummy.json")
+        call_command(
+            "update_theme_from_waardenlijst",
+            file_path="/tmp/dummy.json",
+            stdout=StringIO(),
+        )
 
-        mock_update.assert_called_once_with(Path("/tmp/dummy.json"))
+        mock_update.assert_called_once_with(Path("/tmp/dummy.json"), force=False)
 
     @requests_mock.Mocker()
     def test_raise_command_error(self, m):
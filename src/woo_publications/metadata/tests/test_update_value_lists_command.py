@@ -0,0 +1,109 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+import requests_mock
+
+from .. import information_category_sync, organisation_sync, theme_sync
+from ..models import InformationCategory, Organisation, Theme
+from .test_value_list_client import INFORMATION_CATEGORIES
+
+CONCEPT = "http://www.w3.org/2004/02/skos/core#Concept"
+THEMES = [
+    {
+        "@id": "https://identifier.overheid.nl/tooi/def/thes/top/c_1",
+        "@type": [CONCEPT],
+        "http://www.w3.org/2004/02/skos/core#prefLabel": [{"@value": "theme"}],
+    }
+]
+
+
+def _organisations(waardenlijst_type: str, identifier: str):
+    return [
+        {
+            "@id": identifier,
+            "@type": [waardenlijst_type],
+            "http://www.w3.org/2000/01/rdf-schema#label": [{"@value": identifier}],
+        }
+    ]
+
+
+@requests_mock.Mocker()
+class UpdateValueListsCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    def _register_value_lists(self, m):
+        m.get(information_category_sync.WAARDENLIJST_URL, json=INFORMATION_CATEGORIES)
+        m.get(theme_sync.WAARDENLIJST_URL, json=THEMES)
+        for index, (url, waardenlijst_type, _) in enumerate(
+            organisation_sync.TYPE_MAPPING
+        ):
+            m.get(
+                url,
+                json=_organisations(waardenlijst_type, f"https://example.com/{index}"),
+            )
+
+    def test_value_lists_are_synchronized(self, m):
+        self._register_value_lists(m)
+
+        with tempfile.TemporaryDirectory() as fixtures_dir:
+            stdout = StringIO()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command(
+                    "update_value_lists", fixtures_dir=fixtures_dir, stdout=stdout
+                )
+
+            self.assertEqual(
+                stdout.getvalue().splitlines(),
+                [
+                    "Information categories: 1 created, 0 updated, 0 unchanged.",
+                    "Themes: 1 created, 0 updated, 0 unchanged.",
+                    "Organisations: 3 created, 0 updated, 0 unchanged.",
+                ],
+            )
+            self.assertEqual(InformationCategory.objects.count(), 1)
+            self.assertEqual(Theme.objects.count(), 1)
+            self.assertEqual(Organisation.objects.count(), 3)
+            self.assertEqual(
+                sorted(path.name for path in Path(fixtures_dir).iterdir()),
+                ["information_categories.json", "organisations.json", "themes.json"],
+            )
+
+            with self.subTest("value lists not modified"):
+                stdout = StringIO()
+
+                call_command(
+                    "update_value_lists", fixtures_dir=fixtures_dir, stdout=stdout
+                )
+
+                self.assertEqual(
+                    stdout.getvalue().splitlines(),
+                    [
+                        "Information categories: not modified.",
+                        "Themes: not modified.",
+                        "Organisations: not modified.",
+                    ],
+                )
+
+    def test_error(self, m):
+        self._register_value_lists(m)
+        m.get(theme_sync.WAARDENLIJST_URL, status_code=500)
+
+        with (
+            tempfile.TemporaryDirectory() as fixtures_dir,
+            self.assertRaisesMessage(
+                CommandError,
+                "Got an unexpected response status code when retrieving the value "
+                "list data: 500.",
+            ),
+        ):
+            call_command(
+                "update_value_lists", fixtures_dir=fixtures_dir, stdout=StringIO()
+            )
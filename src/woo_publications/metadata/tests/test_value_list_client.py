@@ -0,0 +1,221 @@
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase
+
+import requests
+import requests_mock
+
+from ..information_category_sync import WAARDENLIJST_URL, update_information_category
+from ..models import InformationCategory
+from ..value_list_client import ValueListFetchError, fetch_value_lists
+
+URLS = [
+    "https://example.com/value-list-1.json",
+    "https://example.com/value-list-2.json",
+]
+
+INFORMATION_CATEGORIES = [
+    {
+        "@id": "https://identifier.overheid.nl/tooi/def/thes/kern/c_1",
+        "@type": ["http://www.w3.org/2004/02/skos/core#Concept"],
+        "http://www.w3.org/2004/02/skos/core#prefLabel": [{"@value": "category"}],
+        "https://identifier.overheid.nl/tooi/def/ont/prefLabelVoorGroepen": [
+            {"@value": "categories"}
+        ],
+        "http://www.w3.org/2004/02/skos/core#definition": [{"@value": "definition"}],
+        "http://www.w3.org/ns/shacl#order": [{"@value": 1}],
+    }
+]
+
+
+class ValueListServer(ThreadingHTTPServer):
+    """
+    Stand-in for the value list repository, which supports conditional requests.
+    """
+
+    def __init__(self, barrier: threading.Barrier | None = None):
+        super().__init__(("127.0.0.1", 0), ValueListRequestHandler)
+        self.barrier = barrier
+        self.etag = '"v1"'
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def get_url(self, path: str) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+
+class ValueListRequestHandler(BaseHTTPRequestHandler):
+    server: ValueListServer
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.server.barrier is not None:
+            self.server.barrier.wait()
+
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.server.etag)
+            self.end_headers()
+            return
+
+        body = json.dumps([{"@id": self.path, "version": self.server.etag}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.server.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FetchValueListsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    def _start_server(self, **kwargs) -> ValueListServer:
+        server = ValueListServer(**kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_value_lists_are_fetched_concurrently(self):
+        # every request is answered once all of them are in flight
+        server = self._start_server(barrier=threading.Barrier(3, timeout=5))
+        urls = [server.get_url(f"/value-list-{index}.json") for index in range(3)]
+
+        value_lists = fetch_value_lists(urls)
+
+        for index, url in enumerate(urls):
+            with self.subTest(url=url):
+                value_list = value_lists[url].result()
+                self.assertTrue(value_list.modified)
+                self.assertEqual(
+                    value_list.json()[0]["@id"], f"/value-list-{index}.json"
+                )
+
+    def test_conditional_request(self):
+        server = self._start_server()
+        url = server.get_url("/value-list.json")
+        fetch_value_lists([url])[url].result().mark_synchronized()
+
+        value_list = fetch_value_lists([url])[url].result()
+
+        self.assertFalse(value_list.modified)
+        self.assertEqual(value_list.response.status_code, 304)
+        (_, first_headers), (_, second_headers) = server.requests
+        self.assertNotIn("If-None-Match", first_headers)
+        self.assertEqual(second_headers["If-None-Match"], '"v1"')
+
+        with self.subTest("new version"):
+            server.etag = '"v2"'
+
+            value_list = fetch_value_lists([url])[url].result()
+
+            self.assertTrue(value_list.modified)
+
+    @requests_mock.Mocker()
+    def test_last_modified(self, m):
+        m.get(
+            URLS[0], json=[], headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        )
+        fetch_value_lists(URLS[:1])[URLS[0]].result().mark_synchronized()
+        m.get(URLS[0], status_code=304)
+
+        value_list = fetch_value_lists(URLS[:1])[URLS[0]].result()
+
+        self.assertFalse(value_list.modified)
+        self.assertEqual(
+            m.last_request.headers["If-Modified-Since"],
+            "Wed, 01 Jan 2025 00:00:00 GMT",
+        )
+
+    @requests_mock.Mocker()
+    def test_unchanged_content(self, m):
+        m.get(URLS[0], json=[{"@id": "1"}])
+        fetch_value_lists(URLS[:1])[URLS[0]].result().mark_synchronized()
+
+        value_list = fetch_value_lists(URLS[:1])[URLS[0]].result()
+
+        self.assertFalse(value_list.modified)
+        self.assertNotIn("If-None-Match", m.last_request.headers)
+
+    @requests_mock.Mocker()
+    def test_changed_content(self, m):
+        m.get(URLS[0], json=[{"@id": "1"}])
+        fetch_value_lists(URLS[:1])[URLS[0]].result().mark_synchronized()
+        m.get(URLS[0], json=[{"@id": "2"}])
+
+        value_list = fetch_value_lists(URLS[:1])[URLS[0]].result()
+
+        self.assertTrue(value_list.modified)
+
+    @requests_mock.Mocker()
+    def test_forced(self, m):
+        m.get(URLS[0], json=[], headers={"ETag": '"v1"'})
+        fetch_value_lists(URLS[:1])[URLS[0]].result().mark_synchronized()
+
+        value_list = fetch_value_lists(URLS[:1], force=True)[URLS[0]].result()
+
+        self.assertTrue(value_list.modified)
+        self.assertNotIn("If-None-Match", m.last_request.headers)
+
+    @requests_mock.Mocker()
+    def test_errors(self, m):
+        m.get(URLS[0], exc=requests.ConnectionError)
+        m.get(URLS[1], status_code=500)
+
+        value_lists = fetch_value_lists(URLS[:2])
+
+        with self.assertRaises(ValueListFetchError) as cm:
+            value_lists[URLS[0]].result()
+        self.assertEqual(cm.exception.url, URLS[0])
+        self.assertIsNone(cm.exception.status_code)
+
+        with self.assertRaises(ValueListFetchError) as cm:
+            value_lists[URLS[1]].result()
+        self.assertEqual(cm.exception.url, URLS[1])
+        self.assertEqual(cm.exception.status_code, 500)
+
+
+class UnmodifiedValueListSyncTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+    @requests_mock.Mocker()
+    def test_database_is_not_updated(self, m):
+        m.get(WAARDENLIJST_URL, json=INFORMATION_CATEGORIES, headers={"ETag": '"v1"'})
+        with tempfile.NamedTemporaryFile(suffix=".json") as file:
+            file_path = Path(file.name)
+            with self.captureOnCommitCallbacks(execute=True):
+                result = update_information_category(file_path)
+            assert result is not None
+            self.assertEqual(result.created, 1)
+            InformationCategory.objects.update(naam="changed locally")
+            m.get(WAARDENLIJST_URL, status_code=304)
+
+            with self.assertNumQueries(1):  # the fixture
+                result = update_information_category(file_path)
+
+            self.assertIsNone(result)
+            self.assertEqual(InformationCategory.objects.get().naam, "changed locally")
+            self.assertIn("changed locally", file_path.read_text())
+
+            with self.subTest("forced"):
+                m.get(WAARDENLIJST_URL, json=INFORMATION_CATEGORIES)
+
+                result = update_information_category(file_path, force=True)
+
+                assert result is not None
+                self.assertEqual(result.updated, 1)
+                self.assertEqual(InformationCategory.objects.get().naam, "category")
@@ -0,0 +1,114 @@
+from django.test import TestCase
+
+from ..constants import InformationCategoryOrigins, OrganisationOrigins
+from ..models import InformationCategory, Organisation
+from ..value_list_sync import SyncResult, sync_value_list
+from .factories import InformationCategoryFactory, OrganisationFactory
+
+
+class SyncValueListTests(TestCase):
+    def test_inserts_updates_and_unchanged(self):
+        unchanged = OrganisationFactory.create(
+            identifier="https://example.com/unchanged",
+            naam="Unchanged",
+            oorsprong=OrganisationOrigins.municipality_list,
+        )
+        changed = OrganisationFactory.create(
+            identifier="https://example.com/changed",
+            naam="Old name",
+            oorsprong=OrganisationOrigins.municipality_list,
+        )
+        custom = OrganisationFactory.create(naam="Custom")
+
+        result = sync_value_list(
+            Organisation,
+            {
+                "https://example.com/unchanged": {
+                    "naam": "Unchanged",
+                    "oorsprong": OrganisationOrigins.municipality_list,
+                },
+                "https://example.com/changed": {
+                    "naam": "New name",
+                    "oorsprong": OrganisationOrigins.municipality_list,
+                },
+                "https://example.com/new": {
+                    "naam": "New",
+                    "oorsprong": OrganisationOrigins.so_list,
+                },
+            },
+        )
+
+        self.assertEqual(result, SyncResult(created=1, updated=1, unchanged=1))
+        self.assertEqual(Organisation.objects.count(), 4)
+        changed.refresh_from_db()
+        self.assertEqual(changed.naam, "New name")
+        unchanged.refresh_from_db()
+        self.assertEqual(unchanged.naam, "Unchanged")
+        custom.refresh_from_db()
+        self.assertEqual(custom.naam, "Custom")
+        new = Organisation.objects.get(identifier="https://example.com/new")
+        self.assertEqual(new.naam, "New")
+        self.assertEqual(new.oorsprong, OrganisationOrigins.so_list)
+        self.assertIsNotNone(new.uuid)
+
+    def test_number_of_queries_independent_of_size(self):
+        entries = {
+            f"https://example.com/{index}": {"naam": f"Organisation {index}"}
+            for index in range(50)
+        }
+        OrganisationFactory.create(identifier="https://example.com/0", naam="Old")
+
+        # select, bulk update, bulk insert (plus the savepoint queries)
+        with self.assertNumQueries(5):
+            result = sync_value_list(Organisation, entries)
+
+        self.assertEqual(result, SyncResult(created=49, updated=1, unchanged=0))
+
+    def test_nothing_written_when_unchanged(self):
+        OrganisationFactory.create(identifier="https://example.com/0", naam="Name")
+
+        # select (plus the savepoint queries)
+        with self.assertNumQueries(3):
+            result = sync_value_list(
+                Organisation, {"https://example.com/0": {"naam": "Name"}}
+            )
+
+        self.assertEqual(str(result), "0 created, 0 updated, 1 unchanged")
+
+    def test_values_are_compared_as_python_values(self):
+        InformationCategoryFactory.create(
+            identifier="https://example.com/1", naam="Name", order=3
+        )
+
+        result = sync_value_list(
+            InformationCategory, {"https://example.com/1": {"order": "3"}}
+        )
+
+        self.assertEqual(result, SyncResult(unchanged=1))
+
+    def test_new_ordered_rows_are_appended(self):
+        InformationCategoryFactory.create(naam="Existing", order=4)
+
+        sync_value_list(
+            InformationCategory,
+            {
+                "https://example.com/1": {
+                    "naam": "First",
+                    "oorsprong": InformationCategoryOrigins.value_list,
+                },
+                "https://example.com/2": {
+                    "naam": "Second",
+                    "oorsprong": InformationCategoryOrigins.value_list,
+                },
+                "https://example.com/3": {
+                    "naam": "Third",
+                    "order": 1,
+                    "oorsprong": InformationCategoryOrigins.value_list,
+                },
+            },
+        )
+
+        self.assertEqual(
+            list(InformationCategory.objects.values_list("naam", "order")),
+            [("Third", 1), ("Existing", 4), ("First", 5), ("Second", 6)],
+        )
@@ -1,11 +1,22 @@
+from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import Future
 from pathlib import Path
 
 from django.core import serializers
+from django.db import transaction
 
-import requests
 from glom import Coalesce, PathAccessError, T, glom
 
+from woo_publications.api import caching
+from woo_publications.metadata.constants import THEME_CACHE_NAMESPACE
 from woo_publications.metadata.models import Theme
+from woo_publications.metadata.value_list_client import (
+    ValueList,
+    ValueListFetchError,
+    fetch_value_lists,
+)
+from woo_publications.metadata.value_list_sync import BATCH_SIZE, SyncResult
 
 WAARDENLIJST_URL = "https://repository.officiele-overheidspublicaties.nl/waardelijsten/scw_toplijst/1/json/scw_toplijst_1.json"
 
@@ -18,79 +29,174 @@ SPEC = {
 }
 
 
+# not part of the alphabet of the materialized paths
+_TEMPORARY_PATH_PREFIX = "-"
+
+
 class ThemeWaardenlijstError(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(message)
 
 
-def update_theme(file_path: Path):
-    try:
-        response = requests.get(WAARDENLIJST_URL)
-    except requests.RequestException as err:
-        raise ThemeWaardenlijstError("Could not retrieve the value list data.") from err
+def update_theme(
+    file_path: Path,
+    *,
+    force: bool = False,
+    value_lists: Mapping[str, Future[ValueList]] | None = None,
+) -> SyncResult | None:
+    """
+    Synchronize the themes with the value list and dump them as a fixture.
+
+    :param force: synchronize the value list, even if it wasn't modified.
+    :param value_lists: the value lists which are already being fetched.
+    :returns: the number of synchronized themes, or ``None`` if the value list
+      wasn't modified.
+    """
+    if value_lists is None:
+        value_lists = fetch_value_lists([WAARDENLIJST_URL], force=force)
 
     try:
-        response.raise_for_status()
-    except requests.RequestException as err:
+        value_list = value_lists[WAARDENLIJST_URL].result()
+    except ValueListFetchError as err:
+        if err.status_code is None:
+            raise ThemeWaardenlijstError(
+                "Could not retrieve the value list data."
+            ) from err
         raise ThemeWaardenlijstError(
-            f"Got an unexpected response status code when retrieving the value list data: {response.status_code}."
+            f"Got an unexpected response status code when retrieving the value list data: {err.status_code}."
         ) from err
 
-    data = response.json()
-    if not data:
-        raise ThemeWaardenlijstError("Received empty data from value list.")
+    result = None
+    if value_list.modified:
+        data = value_list.json()
+        if not data:
+            raise ThemeWaardenlijstError("Received empty data from value list.")
+
+        result = sync_themes(data)
+        # moving themes in the tree doesn't send signals
+        caching.invalidate(THEME_CACHE_NAMESPACE)
+        transaction.on_commit(value_list.mark_synchronized)
+
+    fixture_data = serializers.serialize(
+        "json",
+        Theme.objects.all(),
+        indent=4,
+        use_natural_primary_keys=True,
+    )
+
+    with open(file_path, "w") as outfile:
+        outfile.write(fixture_data)
+
+    return result
+
 
+def sync_themes(data: list[dict]) -> SyncResult:
+    """
+    Rebuild the tree of themes from the value list in bulk.
+
+    The target tree is computed in memory - the themes that aren't in the value list
+    keep their parent - and the materialized path columns are compared with the
+    current ones. Only the changed and new themes are written, with ``bulk_update``
+    and ``bulk_create`` in one transaction, rather than moving the themes one by one,
+    which rewrites the paths of their siblings and descendants every time.
+    """
     waardenlijst = [
         glom(theme, SPEC, skip_exc=PathAccessError)
         for theme in data
         if theme["@type"][0] == "http://www.w3.org/2004/02/skos/core#Concept"
     ]
 
-    root_themes_data = [theme for theme in waardenlijst if not theme.get("parent")]
-    sub_themes = [theme for theme in waardenlijst if theme.get("parent")]
-
-    # create/update root themes
-    for theme in root_themes_data:
-        try:
-            theme_object = Theme.objects.get(identifier=theme["identifier"])
-            theme_object.naam = theme["naam"]
-            theme_object.save()
-        except Theme.DoesNotExist:
-            Theme.add_root(identifier=theme["identifier"], naam=theme["naam"])
-
-    # create/update sub themes
-    for theme in sub_themes:
-        try:
-            move = False
-            theme_object = Theme.objects.get(identifier=theme["identifier"])
-            theme_object.naam = theme["naam"]
-            theme_object.save()
-            if parent := theme_object.get_parent():
-                assert isinstance(parent, Theme)
-                if theme["parent"] != parent.identifier:
-                    move = True
-            else:
-                move = True
-
-            if move:
-                theme_object.move(
-                    Theme.objects.get(identifier=theme["parent"]), "sorted-child"
+    with transaction.atomic():
+        themes = list(Theme.objects.select_for_update().order_by("path"))
+        themes_by_identifier = {theme.identifier: theme for theme in themes}
+        themes_by_path = {theme.path: theme for theme in themes}
+        current = {
+            theme.pk: (theme.path, theme.depth, theme.numchild, theme.naam)
+            for theme in themes
+        }
+
+        # the parents in the target tree
+        parents: dict[str, str | None] = {}
+        for theme in themes:
+            parent = themes_by_path.get(theme.path[slice(0, -Theme.steplen)])
+            parents[theme.identifier] = parent.identifier if parent else None
+
+        new_themes: list[Theme] = []
+        for entry in waardenlijst:
+            identifier = entry["identifier"]
+            if (theme := themes_by_identifier.get(identifier)) is None:
+                theme = Theme(identifier=identifier)
+                themes_by_identifier[identifier] = theme
+                new_themes.append(theme)
+            theme.naam = entry["naam"]
+            parents[identifier] = entry["parent"] or None
+
+        children: dict[str | None, list[Theme]] = defaultdict(list)
+        for identifier, parent in parents.items():
+            if parent is not None and parent not in themes_by_identifier:
+                raise ThemeWaardenlijstError(
+                    f"The parent `{parent}` of the theme `{identifier}` does not exist."
                 )
+            children[parent].append(themes_by_identifier[identifier])
 
-        except Theme.DoesNotExist:
-            parent = Theme.objects.get(identifier=theme["parent"])
-            parent.add_child(
-                identifier=theme["identifier"],
-                naam=theme["naam"],
+        placed = _set_tree_fields(children)
+        if unplaced := themes_by_identifier.keys() - placed:
+            raise ThemeWaardenlijstError(
+                f"The theme `{min(unplaced)}` is part of a cycle."
             )
 
-    fixture_data = serializers.serialize(
-        "json",
-        Theme.objects.all(),
-        indent=4,
-        use_natural_primary_keys=True,
+        changed = [
+            theme
+            for theme in themes
+            if (theme.path, theme.depth, theme.numchild, theme.naam)
+            != current[theme.pk]
+        ]
+        moved = [theme for theme in changed if theme.path != current[theme.pk][0]]
+        if moved:
+            # the paths are unique, move the themes out of the way first
+            final_paths = [theme.path for theme in moved]
+            for theme in moved:
+                theme.path = f"{_TEMPORARY_PATH_PREFIX}{theme.pk}"
+            Theme.objects.bulk_update(moved, ["path"], batch_size=BATCH_SIZE)
+            for theme, path in zip(moved, final_paths):
+                theme.path = path
+
+        Theme.objects.bulk_update(
+            changed, ["path", "depth", "numchild", "naam"], batch_size=BATCH_SIZE
+        )
+        Theme.objects.bulk_create(new_themes, batch_size=BATCH_SIZE)
+
+    return SyncResult(
+        created=len(new_themes),
+        updated=len(changed),
+        unchanged=len(themes) - len(changed),
     )
 
-    with open(file_path, "w") as outfile:
-        outfile.write(fixture_data)
+
+def _set_tree_fields(children: Mapping[str | None, list[Theme]]) -> set[str]:
+    """
+    Set the path, depth and number of children of the themes in the tree.
+
+    :param children: the child themes, keyed by the identifier of the parent theme
+      (``None`` for the root themes).
+    :returns: the identifiers of the themes that are reachable from the roots.
+    """
+    placed: set[str] = set()
+    # iteratively, the tree can be deeper than the recursion limit
+    stack: list[tuple[str | None, str, int]] = [(None, "", 1)]
+    while stack:
+        parent, parent_path, depth = stack.pop()
+        # like treebeard's sorted siblings, the existing themes go first on a tie
+        siblings = sorted(
+            children.get(parent, []),
+            key=lambda theme: (theme.naam, theme.pk is None, theme.path),
+        )
+        for step, theme in enumerate(siblings, start=1):
+            theme.path = Theme._get_path(parent_path, depth, step)
+            theme.depth = depth
+            theme.numchild = len(children.get(theme.identifier, []))
+            placed.add(theme.identifier)
+            stack.append((theme.identifier, theme.path, depth + 1))
+
+    return placed
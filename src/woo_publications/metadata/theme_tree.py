@@ -0,0 +1,56 @@
+"""
+Build the (nested) tree of themes from a single query.
+
+Treebeard stores the position of a theme in the tree as its materialized path, so
+ordering the themes by path lists every theme directly after its parent (and
+siblings). The tree is built in one pass over that list and kept in the cache until
+the themes change.
+"""
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from woo_publications.api import caching
+
+from .constants import THEME_CACHE_NAMESPACE
+from .models import Theme
+
+__all__ = ["build_tree", "get_theme_tree"]
+
+_TREE_CACHE_KEY = "woo_publications:theme-tree:{generation}"
+
+
+def build_tree(themes: Iterable[Theme]) -> list[Theme]:
+    """
+    Link the themes to their sub themes.
+
+    :param themes: the themes, ordered by path.
+    :returns: the themes of which the parent is not included, in order.
+    """
+    roots: list[Theme] = []
+    themes_by_path: dict[str, Theme] = {}
+    for theme in themes:
+        theme.sub_themes = []
+        themes_by_path[theme.path] = theme
+        parent_path = theme.path[slice(0, -Theme.steplen)]
+        if (parent := themes_by_path.get(parent_path)) is not None:
+            parent.sub_themes.append(theme)
+        else:
+            roots.append(theme)
+    return roots
+
+
+def get_theme_tree() -> list[Theme]:
+    """
+    Get the root themes, with the sub themes linked at every depth.
+    """
+    if (generation := caching.get_generation(THEME_CACHE_NAMESPACE)) is None:
+        return build_tree(Theme.objects.order_by("path"))
+
+    key = _TREE_CACHE_KEY.format(generation=generation)
+    if (roots := cache.get(key)) is None:
+        roots = build_tree(Theme.objects.order_by("path"))
+        cache.set(key, roots, timeout=settings.API_RESPONSE_CACHE_TIMEOUT)
+    return roots
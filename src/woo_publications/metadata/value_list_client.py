@@ -0,0 +1,135 @@
+"""
+Retrieve the value lists (waardenlijsten) published on overheid.nl.
+
+The value lists are fetched concurrently, through one session. The ``ETag`` and
+``Last-Modified`` headers and a hash of the content of the last synchronized version
+of a value list are kept in the cache, so the next requests are conditional. A value
+list that wasn't modified since doesn't need to be synchronized again.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.cache import cache
+
+import requests
+
+__all__ = ["ValueList", "ValueListFetchError", "fetch_value_lists"]
+
+TIMEOUT = (10, 60)
+"""
+The connect and read timeout of the requests, in seconds.
+"""
+
+MAX_WORKERS = 8
+"""
+The maximum number of value lists that are fetched at the same time.
+"""
+
+_VALIDATORS_CACHE_KEY = "woo_publications:value-list:{digest}:validators"
+
+# shared by the syncs, the connections to the repository are reused
+session = requests.Session()
+
+
+class ValueListFetchError(Exception):
+    def __init__(self, url: str, status_code: int | None = None):
+        self.url = url
+        self.status_code = status_code
+        super().__init__(url, status_code)
+
+
+def _get_cache_key(url: str) -> str:
+    digest = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+    return _VALIDATORS_CACHE_KEY.format(digest=digest)
+
+
+@dataclass
+class ValueList:
+    url: str
+    response: requests.Response
+    content_hash: str | None
+    """
+    The hash of the content, ``None`` if the server responded with ``304``.
+    """
+    previous_content_hash: str | None = None
+
+    @property
+    def modified(self) -> bool:
+        """
+        Indicate if the value list was modified since it was last synchronized.
+        """
+        return (
+            self.content_hash is not None
+            and self.content_hash != self.previous_content_hash
+        )
+
+    def json(self) -> Any:
+        return self.response.json()
+
+    def mark_synchronized(self) -> None:
+        """
+        Remember this version of the value list for the next (conditional) requests.
+        """
+        if not self.modified:
+            return
+        validators = {
+            "etag": self.response.headers.get("ETag", ""),
+            "last_modified": self.response.headers.get("Last-Modified", ""),
+            "content_hash": self.content_hash,
+        }
+        cache.set(_get_cache_key(self.url), validators, timeout=None)
+
+
+def _fetch(url: str, force: bool) -> ValueList:
+    validators = {} if force else (cache.get(_get_cache_key(url)) or {})
+    headers = {}
+    if etag := validators.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("last_modified"):
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = session.get(url, headers=headers, timeout=TIMEOUT)
+    except requests.RequestException as err:
+        raise ValueListFetchError(url) from err
+
+    if response.status_code == requests.codes.not_modified:
+        return ValueList(url=url, response=response, content_hash=None)
+
+    try:
+        response.raise_for_status()
+    except requests.RequestException as err:
+        raise ValueListFetchError(url, status_code=response.status_code) from err
+
+    return ValueList(
+        url=url,
+        response=response,
+        content_hash=hashlib.sha256(response.content).hexdigest(),
+        previous_content_hash=validators.get("content_hash"),
+    )
+
+
+def fetch_value_lists(
+    urls: Iterable[str], *, force: bool = False
+) -> dict[str, Future[ValueList]]:
+    """
+    Start fetching the value lists concurrently.
+
+    :param urls: the URLs of the value lists.
+    :param force: ignore the previously synchronized versions of the value lists.
+    :returns: the futures of the value lists, keyed by URL. Their result raises
+      :class:`ValueListFetchError` if the value list could not be retrieved.
+    """
+    urls = list(dict.fromkeys(urls))
+    executor = ThreadPoolExecutor(
+        max_workers=max(min(len(urls), MAX_WORKERS), 1),
+        thread_name_prefix="value-list",
+    )
+    futures = {url: executor.submit(_fetch, url, force) for url in urls}
+    # the running requests are completed, the threads exit afterwards
+    executor.shutdown(wait=False)
+    return futures
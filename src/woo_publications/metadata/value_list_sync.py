@@ -0,0 +1,111 @@
+"""
+Synchronize the value list entries with the database in bulk.
+
+The existing rows are loaded in one go, keyed by their identifier, and compared with
+the value list in memory. Only the new and changed rows are written, with
+``bulk_create`` and ``bulk_update`` in a single transaction. Bulk operations don't
+call :meth:`~django.db.models.Model.save` and don't send signals - the callers
+invalidate the cached API responses themselves.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, cast
+
+from django.db import models, transaction
+
+from ordered_model.models import OrderedModel, OrderedModelQuerySet
+
+__all__ = ["SyncResult", "sync_value_list"]
+
+BATCH_SIZE = 500
+
+
+@dataclass
+class SyncResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.created} created, {self.updated} updated, "
+            f"{self.unchanged} unchanged"
+        )
+
+
+def sync_value_list[
+    M: models.Model
+](
+    model: type[M],
+    entries: Mapping[str, Mapping[str, Any]],
+    *,
+    batch_size: int = BATCH_SIZE,
+) -> SyncResult:
+    """
+    Create or update the rows of the value list entries, by identifier.
+
+    :param model: the model with a unique ``identifier`` field.
+    :param entries: the field values of the entries, keyed by identifier.
+    :returns: the number of created, updated and unchanged rows.
+    """
+    result = SyncResult()
+    meta = model._meta
+    to_create: list[M] = []
+    to_update: list[M] = []
+    updated_fields: set[str] = set()
+
+    with transaction.atomic():
+        existing: dict[str, M] = model._default_manager.select_for_update().in_bulk(
+            list(entries), field_name="identifier"
+        )
+
+        for identifier, fields in entries.items():
+            if (instance := existing.get(identifier)) is None:
+                to_create.append(model(identifier=identifier, **fields))
+                continue
+
+            changed = False
+            for name, value in fields.items():
+                field = cast(models.Field, meta.get_field(name))
+                value = field.to_python(value)
+                if getattr(instance, field.attname) != value:
+                    setattr(instance, field.attname, value)
+                    updated_fields.add(name)
+                    changed = True
+
+            if changed:
+                to_update.append(instance)
+            else:
+                result.unchanged += 1
+
+        if issubclass(model, OrderedModel):
+            _set_missing_order(model, to_create)
+
+        if to_update:
+            model._default_manager.bulk_update(
+                to_update, fields=sorted(updated_fields), batch_size=batch_size
+            )
+        if to_create:
+            # the ordered model queryset would overwrite the order of the value list
+            models.QuerySet(model).bulk_create(to_create, batch_size=batch_size)
+
+    result.created = len(to_create)
+    result.updated = len(to_update)
+    return result
+
+
+def _set_missing_order(model: type[OrderedModel], instances: list[Any]) -> None:
+    # like OrderedModel.save(), append the rows without an order at the end
+    field_name = model.order_field_name
+    missing = [
+        instance for instance in instances if getattr(instance, field_name) is None
+    ]
+    if not missing:
+        return
+    # OrderedModel checks that its managers return an OrderedModelQuerySet
+    queryset = cast(OrderedModelQuerySet, model._default_manager.all())
+    next_order = queryset.get_next_order()
+    for instance in missing:
+        setattr(instance, field_name, next_order)
+        next_order += 1
@@ -4,13 +4,14 @@ from django.contrib import admin
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
 from django.utils.html import format_html_join
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext, gettext_lazy as _
 
 from furl import furl
 
 from woo_publications.logging.service import (
     AdminAuditLogMixin,
     AuditLogInlineformset,
+    annotate_owner,
     get_logs_link,
 )
 from woo_publications.metadata.models import Organisation
@@ -19,6 +20,15 @@ from .constants import PublicationStatusOptions
 from .models import Document, Publication
 
 
+def _format_owner(obj: Publication | Document) -> str:
+    if (owner := obj.get_owner()) is None:
+        return "-"
+    return gettext("{name} ({identifier})").format(
+        name=owner["display_name"],
+        identifier=owner["identifier"],
+    )
+
+
 class DocumentInlineAdmin(admin.StackedInline):
     formset = AuditLogInlineformset
     model = Document
@@ -35,6 +45,7 @@ class PublicationAdmin(AdminAuditLogMixin, admin.ModelAdmin):
         "officiele_titel",
         "verkorte_titel",
         "publicatiestatus",
+        "show_owner",
         "registratiedatum",
         "uuid",
         "show_actions",
@@ -62,6 +73,14 @@ class PublicationAdmin(AdminAuditLogMixin, admin.ModelAdmin):
     date_hierarchy = "registratiedatum"
     inlines = (DocumentInlineAdmin,)
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return annotate_owner(qs)
+
+    @admin.display(description=_("owner"))
+    def show_owner(self, obj: Publication) -> str:
+        return _format_owner(obj)
+
     def has_change_permission(self, request, obj=None):
         if obj and obj.publicatiestatus == PublicationStatusOptions.revoked:
             return False
@@ -99,6 +118,7 @@ class DocumentAdmin(AdminAuditLogMixin, admin.ModelAdmin):
         "publicatiestatus",
         "show_filesize",
         "identifier",
+        "show_owner",
         "registratiedatum",
         "show_actions",
     )
@@ -165,6 +185,14 @@ class DocumentAdmin(AdminAuditLogMixin, admin.ModelAdmin):
     )
     date_hierarchy = "registratiedatum"
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return annotate_owner(qs)
+
+    @admin.display(description=_("owner"))
+    def show_owner(self, obj: Document) -> str:
+        return _format_owner(obj)
+
     @admin.display(description=_("file size"), ordering="bestandsomvang")
     def show_filesize(self, obj: Document) -> str:
         return filesizeformat(obj.bestandsomvang)
@@ -0,0 +1,9 @@
+from woo_publications.api.pagination import OptionalCursorPagination
+
+
+class PublicationPagination(OptionalCursorPagination):
+    cursor_ordering = "registratiedatum"
+
+
+class DocumentPagination(OptionalCursorPagination):
+    cursor_ordering = "creatiedatum"
@@ -1,3 +1,6 @@
+from functools import cached_property
+from uuid import UUID
+
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
@@ -6,10 +9,13 @@ from rest_framework import serializers
 from woo_publications.contrib.documents_api.client import FilePart
 from woo_publications.logging.service import extract_audit_parameters
 from woo_publications.metadata.models import InformationCategory, Organisation
+from woo_publications.metadata.service import get_inspannings_verplichting
 
-from ..constants import DocumentActionTypeOptions, PublicationStatusOptions
+from ..constants import ChangeTypes, DocumentActionTypeOptions, PublicationStatusOptions
 from ..models import Document, Publication
 
+PUBLICATIONS_CONTEXT_KEY = "publications_by_uuid"
+
 
 class EigenaarSerializer(serializers.Serializer):
     weergave_naam = serializers.CharField(
@@ -61,6 +67,9 @@ class FilePartSerializer(serializers.Serializer[FilePart]):
         ),
         write_only=True,
         use_url=False,
+        # the size of a streamed file is unknown during validation, the Documents API
+        # validates the size of the file part
+        allow_empty_file=True,
     )
 
 
@@ -88,10 +97,38 @@ class DocumentStatusSerializer(serializers.Serializer):
     )
 
 
+class PublicationUUIDField(serializers.SlugRelatedField):
+    """
+    Refer to a publication by its UUID.
+
+    When the publications were looked up in advance by
+    :class:`DocumentBulkCreateSerializer`, they're taken from the serializer context
+    instead of querying the database for every document.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("slug_field", "uuid")
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        publications: dict[UUID, Publication] | None = self.context.get(
+            PUBLICATIONS_CONTEXT_KEY
+        )
+        if publications is None:
+            return super().to_internal_value(data)
+
+        try:
+            publication = publications.get(UUID(str(data)))
+        except ValueError:
+            self.fail("invalid")
+        if publication is None:
+            self.fail("does_not_exist", slug_name=self.slug_field, value=str(data))
+        return publication
+
+
 class DocumentSerializer(serializers.ModelSerializer):
-    publicatie = serializers.SlugRelatedField(
+    publicatie = PublicationUUIDField(
         queryset=Publication.objects.all(),
-        slug_field="uuid",
         help_text=_("The unique identifier of the publication."),
     )
     bestandsdelen = FilePartSerializer(
@@ -169,6 +206,52 @@ class DocumentSerializer(serializers.ModelSerializer):
         return value
 
 
+class DocumentBulkCreateSerializer(serializers.ListSerializer):
+    """
+    Validate the data of multiple documents to create.
+
+    The publications of the documents are looked up in a single query.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            uuids: set[UUID] = set()
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    uuids.add(UUID(str(item.get("publicatie"))))
+                except ValueError:
+                    continue
+            # the responsible organisation is included in the document actions
+            publications = Publication.objects.filter(uuid__in=uuids).select_related(
+                "verantwoordelijke"
+            )
+            self.context[PUBLICATIONS_CONTEXT_KEY] = {
+                publication.uuid: publication for publication in publications
+            }
+        return super().to_internal_value(data)
+
+
+class DocumentRegistrationResultSerializer(serializers.Serializer):
+    geregistreerd = serializers.BooleanField(
+        source="registered",
+        help_text=_(
+            "Indicates if the document was registered. Documents that could not be "
+            "registered in the Documents API are not created."
+        ),
+    )
+    document = DocumentSerializer(
+        help_text=_("The created document. Empty if it could not be registered."),
+        allow_null=True,
+    )
+    foutmelding = serializers.CharField(
+        source="error",
+        help_text=_("The reason the document could not be registered, if any."),
+        allow_blank=True,
+    )
+
+
 class DocumentUpdateSerializer(DocumentSerializer):
     publicatie = serializers.SlugRelatedField(
         slug_field="uuid",
@@ -202,6 +285,32 @@ class DocumentUpdateSerializer(DocumentSerializer):
         }
 
 
+class DiWooInformatieCategorieenField(serializers.ListField):
+    """
+    Output the sitemap information category UUIDs of a publication.
+
+    The field instance is shared by all publications in a list response, so the
+    'inspanningsverplichting' category is looked up at most once per request.
+    """
+
+    child = serializers.UUIDField()
+
+    @cached_property
+    def inspanningsverplichting_uuid(self) -> UUID:
+        return get_inspannings_verplichting().uuid
+
+    def get_attribute(self, instance: Publication) -> list[UUID] | None:
+        try:
+            return instance.get_diwoo_informatie_categorieen_uuids(
+                get_inspanningsverplichting_uuid=lambda: (
+                    self.inspanningsverplichting_uuid
+                )
+            )
+        except InformationCategory.DoesNotExist:
+            # consistent with DRF's behaviour for missing (related) objects
+            return None
+
+
 class PublicationSerializer(serializers.ModelSerializer[Publication]):
     eigenaar = EigenaarSerializer(
         source="get_owner",
@@ -219,9 +328,7 @@ class PublicationSerializer(serializers.ModelSerializer[Publication]):
         many=True,
         allow_empty=False,
     )
-    di_woo_informatie_categorieen = serializers.ListField(
-        child=serializers.UUIDField(),
-        source="get_diwoo_informatie_categorieen_uuids",
+    di_woo_informatie_categorieen = DiWooInformatieCategorieenField(
         help_text=_("The information categories used for the sitemap"),
         read_only=True,
     )
@@ -326,3 +433,67 @@ class PublicationSerializer(serializers.ModelSerializer[Publication]):
             )
 
         return publication
+
+
+class ChangeSerializer(serializers.Serializer):
+    wijziging = serializers.ChoiceField(
+        source="change_type",
+        choices=ChangeTypes.choices,
+        help_text=_(
+            "The kind of change. Deleted and revoked records must be removed from "
+            "the copies of the consumer."
+        ),
+    )
+    uuid = serializers.UUIDField(
+        help_text=_("The unique identifier of the changed record."),
+    )
+    tijdstip = serializers.DateTimeField(
+        source="timestamp",
+        help_text=_("The moment the change occurred."),
+    )
+
+
+class PublicationChangeSerializer(ChangeSerializer):
+    gegevens = PublicationSerializer(
+        source="record",
+        help_text=_(
+            "The current state of the publication. Empty for deleted and revoked "
+            "publications."
+        ),
+        allow_null=True,
+    )
+
+
+class DocumentChangeSerializer(ChangeSerializer):
+    gegevens = DocumentSerializer(
+        source="record",
+        help_text=_(
+            "The current state of the document. Empty for deleted and revoked "
+            "documents."
+        ),
+        allow_null=True,
+    )
+
+
+class ChangeFeedSerializer(serializers.Serializer):
+    token = serializers.CharField(
+        help_text=_(
+            "Opaque token marking the position of the last change in the results. "
+            "Pass it to the next request to resume from this position."
+        ),
+    )
+    next = serializers.URLField(
+        help_text=_(
+            "Link to the next batch of changes, empty if all changes so far were "
+            "returned."
+        ),
+        allow_null=True,
+    )
+
+
+class PublicationChangeFeedSerializer(ChangeFeedSerializer):
+    results = PublicationChangeSerializer(many=True)
+
+
+class DocumentChangeFeedSerializer(ChangeFeedSerializer):
+    results = DocumentChangeSerializer(many=True)
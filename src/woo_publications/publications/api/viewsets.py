@@ -1,13 +1,24 @@
+import binascii
+import json
 import logging
-from collections.abc import Iterable
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import AsyncIterable, Iterable, Mapping
+from datetime import datetime
 from typing import override
 from uuid import UUID
 
 from django.db import transaction
 from django.http import StreamingHttpResponse
-from django.utils.http import content_disposition_header
+from django.http.response import HttpResponseBase
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
+import httpx
+from asgiref.sync import sync_to_async
+from django_sendfile import sendfile
 from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiResponse,
@@ -17,34 +28,142 @@ from drf_spectacular.utils import (
 from requests import RequestException
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.parsers import MultiPartParser
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
+from woo_publications.api.async_views import AsyncTransferMixin
 from woo_publications.api.exceptions import BadGateway
+from woo_publications.api.parsers import StreamingMultiPartParser
+from woo_publications.contrib.documents_api.async_client import get_async_client
 from woo_publications.contrib.documents_api.client import get_client
 from woo_publications.logging.service import (
     AuditTrailViewSetMixin,
+    annotate_owner,
+    audit_api_create_bulk,
     audit_api_download,
     extract_audit_parameters,
 )
 
-from ..models import Document, Publication
+from .. import content_cache
+from ..bulk_registration import register_documents, unregister_documents
+from ..change_feed import Position, get_changes
+from ..download import (
+    ByteRange,
+    UnsatisfiableRange,
+    aiter_content,
+    aopen_upstream_download,
+    get_chunk_size,
+    get_etag,
+    get_last_modified,
+    get_requested_range,
+    iter_content,
+    open_upstream_download,
+)
+from ..export import export_publications, get_export_queryset
+from ..models import Document, DocumentFilePart, Publication
 from .filters import DocumentFilterSet, PublicationFilterSet
+from .pagination import DocumentPagination, PublicationPagination
 from .serializers import (
+    DocumentBulkCreateSerializer,
+    DocumentChangeFeedSerializer,
+    DocumentRegistrationResultSerializer,
     DocumentSerializer,
     DocumentStatusSerializer,
     DocumentUpdateSerializer,
     FilePartSerializer,
+    PublicationChangeFeedSerializer,
     PublicationSerializer,
 )
 
 logger = logging.getLogger(__name__)
 
-DOWNLOAD_CHUNK_SIZE = (
-    8_192  # read 8 kB into memory at a time when downloading from upstream
+# Viewset actions that produce a response body with the serialized record(s) and
+# benefit from fetching the related objects along with the records.
+SERIALIZING_ACTIONS = frozenset(
+    {"list", "retrieve", "update", "partial_update", "changes"},
 )
 
+# The maximum number of documents that can be registered in a single bulk request.
+BULK_CREATE_MAX_DOCUMENTS = 100
+
+CHANGE_FEED_PARAMETERS = [
+    OpenApiParameter(
+        name="token",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        description=_(
+            "The token from a previous response, to only receive the changes after "
+            "it. Without token, all changes are returned from the beginning."
+        ),
+    ),
+    OpenApiParameter(
+        name="pageSize",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        description=_("The maximum number of changes to return."),
+    ),
+]
+
+
+class ChangeFeedMixin:
+    """
+    Expose the incremental change feed of the records of the viewset.
+    """
+
+    change_feed_serializer_class: type[serializers.Serializer]
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="wijzigingen",
+        # the change feed has its own ordering and consumers need all changes
+        filter_backends=(),
+    )
+    def changes(self, request: Request, *args, **kwargs) -> Response:
+        after = self._decode_token(request.query_params.get("token", ""))
+        paginator = self.paginator  # pyright: ignore[reportAttributeAccessIssue]
+        limit = paginator.get_page_size(request)
+        queryset = self.get_queryset()  # pyright: ignore[reportAttributeAccessIssue]
+
+        changes, has_more = get_changes(queryset, after=after, limit=limit)
+
+        last_position = changes[-1].position if changes else after
+        token = self._encode_token(last_position) if last_position else ""
+        next_link = (
+            replace_query_param(request.build_absolute_uri(), "token", token)
+            if has_more
+            else None
+        )
+        serializer = self.change_feed_serializer_class(
+            instance={"token": token, "next": next_link, "results": changes},
+            context=self.get_serializer_context(),  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        return Response(serializer.data)
+
+    @staticmethod
+    def _encode_token(position: Position) -> str:
+        timestamp, source, pk = position
+        data = json.dumps([timestamp.isoformat(), source, pk]).encode("ascii")
+        return urlsafe_b64encode(data).decode("ascii")
+
+    @staticmethod
+    def _decode_token(token: str) -> Position | None:
+        if not token:
+            return None
+        try:
+            timestamp, source, pk = json.loads(urlsafe_b64decode(token.encode("ascii")))
+            position = Position(datetime.fromisoformat(timestamp), int(source), int(pk))
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as exc:
+            raise serializers.ValidationError(
+                {"token": _("Invalid resume token.")}, code="invalid"
+            ) from exc
+        if timezone.is_naive(position.timestamp):
+            raise serializers.ValidationError(
+                {"token": _("Invalid resume token.")}, code="invalid"
+            )
+        return position
+
 
 @extend_schema(tags=["Documenten"])
 @extend_schema_view(
@@ -81,8 +200,23 @@ DOWNLOAD_CHUNK_SIZE = (
             "* specify the organisation RSIN for the created documents"
         ),
     ),
+    changes=extend_schema(
+        summary=_("Changes of the documents."),
+        description=_(
+            "Returns the changes of the documents in the order they occurred, "
+            "including deleted and revoked documents. Use this to keep a copy of the "
+            "documents up to date - pass the `token` of the response to the next "
+            "request to only receive the changes since then. Changes are reported "
+            "after a short delay, so that changes that are still being saved are "
+            "not skipped."
+        ),
+        parameters=CHANGE_FEED_PARAMETERS,
+        responses={200: DocumentChangeFeedSerializer},
+    ),
 )
 class DocumentViewSet(
+    AsyncTransferMixin,
+    ChangeFeedMixin,
     AuditTrailViewSetMixin,
     mixins.CreateModelMixin,
     mixins.UpdateModelMixin,
@@ -90,10 +224,23 @@ class DocumentViewSet(
 ):
     queryset = Document.objects.order_by("-creatiedatum")
     serializer_class = DocumentSerializer
+    change_feed_serializer_class = DocumentChangeFeedSerializer
     filterset_class = DocumentFilterSet
+    pagination_class = DocumentPagination
     lookup_field = "uuid"
     lookup_value_converter = "uuid"
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # the file part and download actions don't serialize the document
+        if self.action not in SERIALIZING_ACTIONS:
+            return qs
+        # the publication is serialized by its UUID and the document actions include
+        # the UUID of the responsible organisation
+        qs = qs.select_related("publicatie__verantwoordelijke")
+        # resolve the owners in bulk rather than a query per serialized document
+        return annotate_owner(qs)
+
     @override
     @transaction.atomic()
     def perform_create(self, serializer):
@@ -114,6 +261,94 @@ class DocumentViewSet(
             return DocumentUpdateSerializer
         return super().get_serializer_class()
 
+    @extend_schema(
+        summary=_("Register the metadata of multiple documents."),
+        description=format_lazy(
+            _(
+                "Bulk variant of the document create endpoint, intended for migrations "
+                "and other large batches of documents. At most {max_documents} documents "
+                "can be registered per request.\n\n"
+                "All documents are validated first - if any document is invalid, none of "
+                "them are created. The valid documents are registered in the underlying "
+                "Documents API concurrently. The response contains a result for each "
+                "document, in the order of the request body. Documents that could not be "
+                "registered in the Documents API are not created, and can be submitted "
+                "again in a new request."
+            ),
+            max_documents=BULK_CREATE_MAX_DOCUMENTS,
+        ),
+        request=DocumentSerializer(many=True),
+        responses={201: DocumentRegistrationResultSerializer(many=True)},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        url_name="bulk-create",
+        filter_backends=(),
+        pagination_class=None,
+    )
+    def bulk_create(self, request: Request, *args, **kwargs) -> Response:
+        user_id, user_repr, remarks = extract_audit_parameters(request)
+        context = self.get_serializer_context()
+        serializer = DocumentBulkCreateSerializer(
+            child=DocumentSerializer(),
+            data=request.data,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_DOCUMENTS,
+            context=context,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        documents = [Document(**data) for data in serializer.validated_data]
+        # no transaction is held open during the requests to the Documents API
+        results = register_documents(
+            documents, build_absolute_uri=request.build_absolute_uri
+        )
+
+        registered = [result.document for result in results if result.registered]
+        try:
+            with transaction.atomic():
+                Document.objects.bulk_create(registered)
+                DocumentFilePart.objects.bulk_create(
+                    [
+                        file_part
+                        for document in registered
+                        for file_part in document.build_file_parts()
+                    ]
+                )
+                audit_api_create_bulk(
+                    content_objects=registered,
+                    user_id=user_id,
+                    user_display=user_repr,
+                    remarks=remarks,
+                )
+        except Exception:
+            # don't leave the documents behind in the Documents API
+            unregister_documents(registered)
+            raise
+
+        response_serializer = DocumentRegistrationResultSerializer(
+            instance=[
+                {
+                    "registered": result.registered,
+                    "document": result.document if result.registered else None,
+                    "error": (
+                        ""
+                        if result.registered
+                        else _(
+                            "The document could not be registered in the Documents "
+                            "API."
+                        )
+                    ),
+                }
+                for result in results
+            ],
+            many=True,
+            context=context,
+        )
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
     @extend_schema(
         summary=_("Upload file part"),
         description=_(
@@ -121,7 +356,7 @@ class DocumentViewSet(
             "The response data of the document create endpoints returns the list of "
             "expected file parts, pointing to this endpoint. The client must split "
             "the binary file in the expected part sizes and then upload each chunk "
-            "individually.\n\n"
+            "individually. The chunks may be uploaded in parallel.\n\n"
             "Once all file parts for the document are received, the document will be "
             "automatically unlocked in the Documents API and ready for use.\n\n"
             "**NOTE** this endpoint expects `multipart/form-data` rather than JSON to "
@@ -133,11 +368,14 @@ class DocumentViewSet(
         detail=True,
         methods=["put"],
         serializer_class=FilePartSerializer,
-        parser_classes=(MultiPartParser,),
+        # the file part is forwarded while it's received
+        parser_classes=(StreamingMultiPartParser,),
         url_path="bestandsdelen/<uuid:part_uuid>",
         url_name="filepart-detail",
     )
-    def file_part(self, request: Request, part_uuid: UUID, *args, **kwargs) -> Response:
+    def file_part(
+        self, request: Request, part_uuid: UUID, *args, **kwargs
+    ) -> HttpResponseBase:
         document = self.get_object()
         assert isinstance(document, Document)
         serializer = FilePartSerializer(
@@ -147,6 +385,30 @@ class DocumentViewSet(
         serializer.is_valid(raise_exception=True)
 
         file = serializer.validated_data["inhoud"]
+        if self.transfer_async:
+            service = document.get_document_service()
+            assert service, "Document must exist in upstream API"
+            async_client = get_async_client(service)
+
+            async def transfer() -> HttpResponseBase:
+                try:
+                    await async_client.proxy_file_part_upload(
+                        file, file_part_uuid=part_uuid, lock=document.lock
+                    )
+                except httpx.HTTPStatusError as exc:
+                    # we can only handle HTTP 400 responses
+                    if exc.response.status_code != 400:
+                        raise
+                    raise serializers.ValidationError(
+                        detail=exc.response.json()
+                    ) from exc
+                is_completed = await sync_to_async(document.complete_file_part)(
+                    part_uuid
+                )
+                return self._file_part_response(is_completed)
+
+            return self.defer_transfer(transfer)
+
         try:
             is_completed = document.upload_part_data(uuid=part_uuid, file=file)
         except RequestException as exc:
@@ -158,6 +420,10 @@ class DocumentViewSet(
             # XXX: should we transform these error responses?
             raise serializers.ValidationError(detail=_response.json()) from exc
 
+        return self._file_part_response(is_completed)
+
+    @staticmethod
+    def _file_part_response(is_completed: bool) -> Response:
         response_serializer = DocumentStatusSerializer(
             instance={"document_upload_voltooid": is_completed}
         )
@@ -169,24 +435,66 @@ class DocumentViewSet(
             "Download the binary content of the document. The endpoint does not return "
             "JSON data, but instead the file content is streamed.\n\n"
             "You can only download the content of files that are completely uploaded "
-            "in the upstream API."
+            "in the upstream API.\n\n"
+            "Interrupted downloads can be resumed by requesting the remaining part of "
+            "the file with the `Range` header (a single byte range is supported). Use "
+            "the `ETag` or `Last-Modified` response headers for conditional requests, "
+            "to avoid downloading unchanged files again."
         ),
         responses={
             (status.HTTP_200_OK, "application/octet-stream"): OpenApiResponse(
                 description=_("The binary file contents."),
                 response=bytes,
             ),
+            (status.HTTP_206_PARTIAL_CONTENT, "application/octet-stream"): (
+                OpenApiResponse(
+                    description=_("The requested range of the binary file contents."),
+                    response=bytes,
+                )
+            ),
+            status.HTTP_304_NOT_MODIFIED: OpenApiResponse(
+                description=_("The file contents have not been modified."),
+            ),
+            status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: OpenApiResponse(
+                description=_("The requested range is outside of the file."),
+            ),
             status.HTTP_502_BAD_GATEWAY: OpenApiResponse(
                 description=_("Bad gateway - failure to stream content."),
             ),
         },
         parameters=[
+            OpenApiParameter(
+                name="Range",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description=_(
+                    "Request a part of the file, e.g. `bytes=1024-` to resume a "
+                    "download after the first 1024 bytes."
+                ),
+            ),
+            OpenApiParameter(
+                name="If-None-Match",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description=_(
+                    "Only download the file if its `ETag` differs from this value."
+                ),
+            ),
             OpenApiParameter(
                 name="Content-Length",
                 type=str,
                 location=OpenApiParameter.HEADER,
                 description=_("Total size in bytes of the download."),
-                response=(200,),
+                response=[200, 206],
+            ),
+            OpenApiParameter(
+                name="Content-Range",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                description=_("The range of the file contents in the response."),
+                response=[206],
             ),
             OpenApiParameter(
                 name="Content-Disposition",
@@ -195,73 +503,232 @@ class DocumentViewSet(
                 description=_(
                     "Marks the file as attachment and includes the filename."
                 ),
-                response=(200,),
+                response=[200, 206],
+            ),
+            OpenApiParameter(
+                name="ETag",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                description=_("Identifies the version of the file contents."),
+                response=[200, 206, 304],
+            ),
+            OpenApiParameter(
+                name="Last-Modified",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                description=_("The moment the document was last modified."),
+                response=[200, 206, 304],
             ),
         ],
     )
     @action(detail=True, methods=["get"], url_name="download")
-    def download(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+    def download(self, request: Request, *args, **kwargs) -> HttpResponseBase:
         document = self.get_object()
         assert isinstance(document, Document)
 
-        assert (
-            document.document_service is not None
-        ), "Document must exist in upstream API"
-
-        endpoint = f"enkelvoudiginformatieobjecten/{document.document_uuid}/download"
-        with get_client(document.document_service) as client:
-            upstream_response = client.get(endpoint, stream=True)
-
-            if (_status := upstream_response.status_code) != status.HTTP_200_OK:
-                logger.warning(
-                    "Streaming of file contents (ID: %s) fails. Status code: %r.",
-                    document.document_uuid,
-                    _status,
-                    extra={
-                        "document_id": document.document_uuid,
-                        "api_root": client.base_url,
-                    },
-                )
-                raise BadGateway(detail=_("Could not download from the upstream."))
+        service = document.get_document_service()
+        assert service is not None, "Document must exist in upstream API"
 
-            # generator that produces the chunks
-            streaming_content: Iterable[bytes] = (
-                chunk
-                for chunk in upstream_response.iter_content(
-                    chunk_size=DOWNLOAD_CHUNK_SIZE
-                )
-                if chunk
-            )
+        etag, last_modified = get_etag(document), get_last_modified(document)
+        conditional_headers = {
+            "ETag": etag,
+            "Last-Modified": http_date(last_modified.timestamp()),
+        }
+        # 304 Not Modified or 412 Precondition Failed
+        if conditional_response := get_conditional_response(
+            request,  # pyright: ignore[reportArgumentType]
+            etag=etag,
+            last_modified=int(last_modified.timestamp()),
+        ):
+            for header, value in conditional_headers.items():
+                conditional_response.headers[header] = value
+            return conditional_response
 
-            response = StreamingHttpResponse(
-                streaming_content,
-                # TODO: if we have format information, we can use it, but that's not part
-                # of BB-MVP
-                content_type="application/octet-stream",
-                headers={
-                    "Content-Length": upstream_response.headers.get(
-                        "Content-Length", str(document.bestandsomvang)
-                    ),
-                    "Content-Disposition": content_disposition_header(
-                        as_attachment=True,
-                        filename=document.bestandsnaam,
-                    ),
-                    # nginx-specific header that prevents files being buffered, instead
-                    # they will be sent synchronously to the nginx client.
-                    "X-Accel-Buffering": "no",
-                },
+        try:
+            byte_range = get_requested_range(
+                request, document  # pyright: ignore[reportArgumentType]
+            )
+        except UnsatisfiableRange:
+            return Response(
+                status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{document.bestandsomvang}"},
             )
 
-            user_id, user_repr, remarks = extract_audit_parameters(request)
-            audit_api_download(
-                content_object=document,
-                user_id=user_id,
-                user_display=user_repr,
-                remarks=remarks,
+        content_disposition = content_disposition_header(
+            as_attachment=True,
+            filename=document.bestandsnaam,
+        )
+
+        # the reverse proxy serves cached files, including the requested range
+        if (cached_file := content_cache.get_cached_file(document)) is not None:
+            response = sendfile(
+                request,
+                cached_file,
+                mimetype="application/octet-stream",
             )
+            for header, value in {
+                **conditional_headers,
+                "Accept-Ranges": "bytes",
+                "Content-Disposition": content_disposition,
+            }.items():
+                response.headers[header] = value
+            self._audit_download(request, document, byte_range)
+            return response
+
+        extra_headers = {
+            **conditional_headers,
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": content_disposition,
+        }
+        chunk_size = get_chunk_size(
+            document.bestandsomvang if byte_range is None else byte_range.length
+        )
+
+        if self.transfer_async:
+            async_client = get_async_client(service)
+
+            async def transfer() -> HttpResponseBase:
+                upstream_response = await aopen_upstream_download(
+                    async_client, document, byte_range
+                )
+                try:
+                    self._check_upstream_download(
+                        upstream_response.status_code,
+                        document,
+                        byte_range,
+                        api_root=async_client.client.base_url,
+                    )
+                except BadGateway:
+                    await upstream_response.aclose()
+                    raise
+                content = aiter_content(upstream_response, byte_range, chunk_size)
+                if byte_range is None:
+                    content = content_cache.acache_while_streaming(document, content)
+                response = self._build_download_response(
+                    content,
+                    upstream_response.status_code,
+                    upstream_response.headers,
+                    document,
+                    byte_range,
+                    extra_headers,
+                )
+                await sync_to_async(self._audit_download)(request, document, byte_range)
+                return response
 
+            return self.defer_transfer(transfer)
+
+        with get_client(service) as client:
+            upstream_response = open_upstream_download(client, document, byte_range)
+            self._check_upstream_download(
+                upstream_response.status_code,
+                document,
+                byte_range,
+                api_root=client.base_url,
+            )
+            content = iter_content(upstream_response, byte_range, chunk_size)
+            if byte_range is None:
+                content = content_cache.cache_while_streaming(document, content)
+            response = self._build_download_response(
+                content,
+                upstream_response.status_code,
+                upstream_response.headers,
+                document,
+                byte_range,
+                extra_headers,
+            )
+            self._audit_download(request, document, byte_range)
             return response
 
+    @staticmethod
+    def _check_upstream_download(
+        upstream_status: int,
+        document: Document,
+        byte_range: ByteRange | None,
+        *,
+        api_root: str,
+    ) -> None:
+        expected_statuses = {status.HTTP_200_OK}
+        if byte_range is not None:
+            expected_statuses.add(status.HTTP_206_PARTIAL_CONTENT)
+        if upstream_status in expected_statuses:
+            return
+        logger.warning(
+            "Streaming of file contents (ID: %s) fails. Status code: %r.",
+            document.document_uuid,
+            upstream_status,
+            extra={
+                "document_id": document.document_uuid,
+                "api_root": api_root,
+            },
+        )
+        raise BadGateway(detail=_("Could not download from the upstream."))
+
+    @staticmethod
+    def _build_download_response(
+        content: Iterable[bytes] | AsyncIterable[bytes],
+        upstream_status: int,
+        upstream_headers: Mapping[str, str],
+        document: Document,
+        byte_range: ByteRange | None,
+        extra_headers: dict[str, str],
+    ) -> StreamingHttpResponse:
+        if byte_range is None:
+            headers = {
+                "Content-Length": upstream_headers.get(
+                    "Content-Length", str(document.bestandsomvang)
+                ),
+            }
+        elif upstream_status == status.HTTP_206_PARTIAL_CONTENT:
+            headers = {
+                "Content-Length": upstream_headers.get(
+                    "Content-Length", str(byte_range.length)
+                ),
+                "Content-Range": upstream_headers.get(
+                    "Content-Range", byte_range.content_range_header
+                ),
+            }
+        else:
+            # the requested range is selected from the complete file
+            headers = {
+                "Content-Length": str(byte_range.length),
+                "Content-Range": byte_range.content_range_header,
+            }
+
+        return StreamingHttpResponse(
+            content,
+            status=(
+                status.HTTP_200_OK
+                if byte_range is None
+                else status.HTTP_206_PARTIAL_CONTENT
+            ),
+            # TODO: if we have format information, we can use it, but that's not part
+            # of BB-MVP
+            content_type="application/octet-stream",
+            headers={
+                **headers,
+                **extra_headers,
+                # nginx-specific header that prevents files being buffered, instead
+                # they will be sent synchronously to the nginx client.
+                "X-Accel-Buffering": "no",
+            },
+        )
+
+    @staticmethod
+    def _audit_download(
+        request: Request, document: Document, byte_range: ByteRange | None
+    ) -> None:
+        # resuming a download (or reading a part of the file) is not logged as a
+        # separate download
+        if byte_range is not None and byte_range.start > 0:
+            return
+        user_id, user_repr, remarks = extract_audit_parameters(request)
+        audit_api_download(
+            content_object=document,
+            user_id=user_id,
+            user_display=user_repr,
+            remarks=remarks,
+        )
+
 
 @extend_schema(tags=["Publicaties"])
 @extend_schema_view(
@@ -289,10 +756,74 @@ class DocumentViewSet(
         summary=_("Destroy a publication."),
         description=_("Destroy a publication."),
     ),
+    changes=extend_schema(
+        summary=_("Changes of the publications."),
+        description=_(
+            "Returns the changes of the publications in the order they occurred, "
+            "including deleted and revoked publications. Use this to keep a copy of "
+            "the publications up to date - pass the `token` of the response to the "
+            "next request to only receive the changes since then. Changes are "
+            "reported after a short delay, so that changes that are still being "
+            "saved are not skipped."
+        ),
+        parameters=CHANGE_FEED_PARAMETERS,
+        responses={200: PublicationChangeFeedSerializer},
+    ),
 )
-class PublicationViewSet(AuditTrailViewSetMixin, viewsets.ModelViewSet):
+class PublicationViewSet(
+    ChangeFeedMixin, AuditTrailViewSetMixin, viewsets.ModelViewSet
+):
     queryset = Publication.objects.order_by("-registratiedatum")
     serializer_class = PublicationSerializer
+    change_feed_serializer_class = PublicationChangeFeedSerializer
     filterset_class = PublicationFilterSet
+    pagination_class = PublicationPagination
     lookup_field = "uuid"
     lookup_value_converter = "uuid"
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action not in SERIALIZING_ACTIONS:
+            return qs
+        qs = qs.select_related(
+            "publisher",
+            "verantwoordelijke",
+            "opsteller",
+        ).prefetch_related("informatie_categorieen")
+        # resolve the owners in bulk rather than a query per serialized publication
+        return annotate_owner(qs)
+
+    @extend_schema(
+        summary=_("Export the publications with their documents."),
+        description=_(
+            "Export the publications as newline-delimited JSON, with one publication "
+            "per line. Each publication has the layout of the publication endpoints, "
+            "extended with the `documenten` of the publication in the layout of the "
+            "document endpoints.\n\n"
+            "The filters of the publication list endpoint can be used to restrict the "
+            "exported publications. The response is streamed, which makes it "
+            "suitable to harvest all publications at once."
+        ),
+        filters=True,
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiResponse(
+                description=_("The exported publications."),
+                response=bytes,
+            ),
+        },
+    )
+    @action(detail=False, methods=["get"], url_name="export")
+    def export(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        queryset = get_export_queryset(self.filter_queryset(self.get_queryset()))
+        return StreamingHttpResponse(
+            export_publications(queryset, context=self.get_serializer_context()),
+            content_type="application/x-ndjson",
+            headers={
+                "Content-Disposition": content_disposition_header(
+                    as_attachment=True,
+                    filename="publicaties.ndjson",
+                ),
+                # nginx-specific header that prevents the export being buffered
+                "X-Accel-Buffering": "no",
+            },
+        )
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class PublicationsConfig(AppConfig):
     name = "woo_publications.publications"
+
+    def ready(self):
+        from woo_publications.contrib.documents_api import signals  # noqa
+
+        from . import signals  # noqa
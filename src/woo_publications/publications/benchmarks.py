@@ -0,0 +1,204 @@
+"""
+Measure the performance of the publication code paths that are hard to profile in
+production.
+
+The benchmarks run against local stand-ins for external services, so that the
+measurements reflect the work done by this application rather than the network or
+the Documents API.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+from django.core.files.base import ContentFile
+from django.http import StreamingHttpResponse
+
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from woo_publications.contrib.documents_api.client import get_client
+
+from .download import get_chunk_size, iter_content, open_upstream_download
+from .models import Document
+
+__all__ = [
+    "DownloadBenchmarkResult",
+    "FilePartUploadBenchmarkResult",
+    "benchmark_download",
+    "benchmark_file_part_uploads",
+]
+
+# the block of file content the stand-in Documents API sends repeatedly
+_UPSTREAM_BLOCK = b"\0" * 1_048_576
+
+
+@dataclass
+class DownloadBenchmarkResult:
+    size: int
+    chunk_size: int
+    wall_time: float
+    """
+    The elapsed time in seconds.
+    """
+    cpu_time: float
+    """
+    The CPU time in seconds spent by the thread proxying the download.
+    """
+
+    @property
+    def throughput(self) -> float:
+        """
+        The throughput in MB/s.
+        """
+        return self.size / 1_000_000 / self.wall_time
+
+    @property
+    def cpu_time_per_gb(self) -> float:
+        return self.cpu_time / (self.size / 1_000_000_000)
+
+
+@dataclass
+class FilePartUploadBenchmarkResult:
+    parts: int
+    part_size: int
+    sequential_time: float
+    """
+    The elapsed time in seconds to upload the parts one after the other.
+    """
+    concurrent_time: float
+    """
+    The elapsed time in seconds to upload the parts concurrently.
+    """
+
+    @property
+    def speedup(self) -> float:
+        return self.sequential_time / self.concurrent_time
+
+
+class _FileContentHandler(BaseHTTPRequestHandler):
+    size: int
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(self.size))
+        self.end_headers()
+        remaining = self.size
+        while remaining > 0:
+            block = _UPSTREAM_BLOCK[: min(remaining, len(_UPSTREAM_BLOCK))]
+            self.wfile.write(block)
+            remaining -= len(block)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FilePartHandler(BaseHTTPRequestHandler):
+    latency: float
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def _documents_api(handler: type[BaseHTTPRequestHandler]) -> Iterator[Service]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield Service(
+            label="Benchmark Documents API",
+            api_type=APITypes.drc,
+            api_root=f"http://127.0.0.1:{server.server_port}/api/v1/",
+            auth_type=AuthTypes.no_auth,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def benchmark_download(
+    *, size: int, chunk_size: int | None = None
+) -> DownloadBenchmarkResult:
+    """
+    Proxy the download of ``size`` bytes of file content, like the download endpoint.
+
+    :param size: the size of the file in bytes.
+    :param chunk_size: the size of the chunks read from the Documents API, defaults to
+      the size picked by :func:`get_chunk_size`.
+    """
+    if chunk_size is None:
+        chunk_size = get_chunk_size(size)
+    document = Document(document_uuid=uuid4(), bestandsomvang=size)
+
+    handler = type("Handler", (_FileContentHandler,), {"size": size})
+    with _documents_api(handler) as service, get_client(service) as client:
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        upstream_response = open_upstream_download(client, document)
+        upstream_response.raise_for_status()
+        response = StreamingHttpResponse(
+            iter_content(upstream_response, None, chunk_size=chunk_size)
+        )
+        received = sum(len(chunk) for chunk in response)
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.thread_time() - cpu_start
+
+    assert received == size, "Incomplete download"
+    return DownloadBenchmarkResult(
+        size=size, chunk_size=chunk_size, wall_time=wall_time, cpu_time=cpu_time
+    )
+
+
+def benchmark_file_part_uploads(
+    *, parts: int, part_size: int, latency: float
+) -> FilePartUploadBenchmarkResult:
+    """
+    Proxy ``parts`` file part uploads, first one after the other and then
+    concurrently, like clients uploading the parts of a document in parallel.
+
+    :param parts: the number of file parts.
+    :param part_size: the size of each file part in bytes.
+    :param latency: the simulated response time of the Documents API in seconds.
+    """
+    handler = type("Handler", (_FilePartHandler,), {"latency": latency})
+    content = b"\0" * part_size
+
+    with _documents_api(handler) as service, get_client(service) as client:
+
+        def upload(_index: int) -> None:
+            client.proxy_file_part_upload(
+                ContentFile(content), file_part_uuid=uuid4(), lock="benchmark"
+            )
+
+        start = time.perf_counter()
+        for index in range(parts):
+            upload(index)
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            list(executor.map(upload, range(parts)))
+        concurrent_time = time.perf_counter() - start
+
+    return FilePartUploadBenchmarkResult(
+        parts=parts,
+        part_size=part_size,
+        sequential_time=sequential_time,
+        concurrent_time=concurrent_time,
+    )
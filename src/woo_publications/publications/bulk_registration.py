@@ -0,0 +1,174 @@
+"""
+Register documents in the Documents API in bulk.
+
+Registering a document requires a request to the Documents API, which dominates the
+time it takes to create a document. For large batches, these requests are sent
+concurrently by a bounded pool of threads. No database queries are performed
+per document.
+"""
+
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from requests import RequestException
+
+from woo_publications.config.cache import get_global_configuration
+from woo_publications.contrib.documents_api.client import (
+    Document as ZGWDocument,
+    get_client,
+)
+
+from .models import Document, Publication, get_document_type_url
+
+__all__ = ["RegistrationResult", "register_documents", "unregister_documents"]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RegistrationResult:
+    document: Document
+    error: RequestException | None = None
+    """
+    The reason the registration in the Documents API failed, if it did.
+    """
+
+    @property
+    def registered(self) -> bool:
+        return self.error is None
+
+
+def _get_document_type_urls(
+    publication_ids: set[int], build_absolute_uri: Callable[[str], str]
+) -> dict[int, str]:
+    # equivalent to ``publication.informatie_categorieen.first()`` for every
+    # publication, in a single query - the information categories are ordered by
+    # their (ordered model) order
+    through_model = Publication.informatie_categorieen.through
+    first_categories = (
+        through_model.objects.filter(publication_id__in=publication_ids)
+        .order_by("publication_id", "informationcategory__order")
+        .distinct("publication_id")
+        .values_list("publication_id", "informationcategory__uuid")
+    )
+    return {
+        publication_id: get_document_type_url(category_uuid, build_absolute_uri)
+        for publication_id, category_uuid in first_categories
+    }
+
+
+def register_documents(
+    documents: Sequence[Document],
+    *,
+    build_absolute_uri: Callable[[str], str],
+    max_workers: int | None = None,
+) -> list[RegistrationResult]:
+    """
+    Create the (unsaved) documents in the Documents API.
+
+    This is the bulk equivalent of :meth:`Document.register_in_documents_api`, except
+    that the documents are not saved - the caller is expected to save the registered
+    documents in bulk, and to call :func:`unregister_documents` if that fails.
+    Documents that cannot be registered in the Documents API are reported in their
+    result instead of raising an exception.
+
+    :param documents: the (unsaved) documents to register.
+    :param build_absolute_uri: callable to build the absolute URLs of the file parts
+      and document types.
+    :param max_workers: the maximum number of concurrent requests to the Documents
+      API, defaults to ``settings.DOCUMENTS_API_MAX_CONCURRENT_REQUESTS``.
+    :returns: the results, in the same order as the documents.
+    """
+    if not documents:
+        return []
+    assert all(document.pk is None for document in documents)
+
+    config = get_global_configuration()
+    if (service := config.documents_api_service) is None:
+        raise RuntimeError(
+            "No documents API configured yet! Set up the global configuration."
+        )
+
+    publication_ids: set[int] = {
+        document.publicatie_id  # pyright: ignore[reportAttributeAccessIssue]
+        for document in documents
+    }
+    document_type_urls = _get_document_type_urls(publication_ids, build_absolute_uri)
+
+    if max_workers is None:
+        max_workers = settings.DOCUMENTS_API_MAX_CONCURRENT_REQUESTS
+    num_workers = max(min(max_workers, len(documents)), 1)
+
+    # The (pooled) client is shared by the workers - its connection pool keeps the
+    # connections to the Documents API alive between the requests.
+    client = get_client(service)
+
+    def _create(document: Document) -> ZGWDocument | RequestException:
+        publication_id: int = (
+            document.publicatie_id  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        try:
+            return document.create_in_documents_api(
+                client,
+                organisation_rsin=config.organisation_rsin,
+                document_type_url=document_type_urls[publication_id],
+            )
+        except RequestException as exc:
+            return exc
+
+    with client, ThreadPoolExecutor(max_workers=num_workers) as executor:
+        outcomes = list(executor.map(_create, documents))
+
+    results: list[RegistrationResult] = []
+    for document, outcome in zip(documents, outcomes, strict=True):
+        if isinstance(outcome, RequestException):
+            logger.warning(
+                "Registration of document %s in the Documents API failed.",
+                document.uuid,
+                exc_info=outcome,
+                extra={"document_uuid": document.uuid},
+            )
+            results.append(RegistrationResult(document=document, error=outcome))
+            continue
+        document.set_documents_api_reference(service, outcome, build_absolute_uri)
+        results.append(RegistrationResult(document=document))
+
+    return results
+
+
+def unregister_documents(
+    documents: Sequence[Document], *, max_workers: int | None = None
+) -> None:
+    """
+    Delete the registered documents in the Documents API again.
+
+    Compensates for :func:`register_documents` when the registered documents cannot
+    be saved. Failures are logged, the remaining documents are still deleted.
+    """
+    if not documents:
+        return
+
+    config = get_global_configuration()
+    assert config.documents_api_service is not None
+    if max_workers is None:
+        max_workers = settings.DOCUMENTS_API_MAX_CONCURRENT_REQUESTS
+    num_workers = max(min(max_workers, len(documents)), 1)
+    client = get_client(config.documents_api_service)
+
+    def _destroy(document: Document) -> None:
+        assert document.document_uuid is not None
+        try:
+            client.destroy_document(uuid=document.document_uuid)
+        except RequestException:
+            logger.exception(
+                "Deleting document %s in the Documents API failed.",
+                document.uuid,
+                extra={"document_uuid": document.uuid},
+            )
+
+    with client, ThreadPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(_destroy, documents))
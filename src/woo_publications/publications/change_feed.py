@@ -0,0 +1,143 @@
+"""
+Incremental change feeds of publications and documents.
+
+The changes of a kind of record are the modified records themselves and the
+:class:`~woo_publications.publications.models.Tombstone` records of deleted records,
+ordered on their timestamp. A :class:`Position` in this stream acts as watermark -
+consumers resume from the position of the last change they processed, so changes
+are never skipped, even when many records share the same timestamp.
+
+The timestamps are set when a record is saved, not when its transaction is
+committed. A change could become visible after changes with a later timestamp were
+reported, and be skipped by the consumers resuming after those. To prevent this, only
+the changes older than ``settings.CHANGE_FEED_SAFETY_LAG`` seconds are reported -
+transactions taking longer than that can still lead to skipped changes.
+"""
+
+import heapq
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import NamedTuple
+from uuid import UUID
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from .constants import ChangeTypes, PublicationStatusOptions, TombstoneObjectTypes
+from .models import Document, Publication, Tombstone
+
+__all__ = ["Position", "Change", "get_changes"]
+
+# the order of the sources for changes with identical timestamps
+_SOURCE_RECORDS = 0
+_SOURCE_TOMBSTONES = 1
+
+
+type Record = Publication | Document
+
+
+class Position(NamedTuple):
+    timestamp: datetime
+    source: int
+    pk: int
+
+
+@dataclass
+class Change:
+    change_type: ChangeTypes
+    uuid: UUID
+    timestamp: datetime
+    record: Record | None
+    """
+    The modified record, ``None`` for deleted and revoked records.
+    """
+    position: Position
+
+
+def _get_record_changes(
+    queryset: models.QuerySet, after: Position | None, until: datetime
+) -> models.QuerySet:
+    queryset = queryset.filter(laatst_gewijzigd_datum__lte=until)
+    if after is not None:
+        condition = models.Q(laatst_gewijzigd_datum__gt=after.timestamp)
+        if after.source == _SOURCE_RECORDS:
+            condition |= models.Q(
+                laatst_gewijzigd_datum=after.timestamp, pk__gt=after.pk
+            )
+        queryset = queryset.filter(condition)
+    return queryset.order_by("laatst_gewijzigd_datum", "pk")
+
+
+def _get_tombstones(
+    object_type: TombstoneObjectTypes, after: Position | None, until: datetime
+) -> models.QuerySet[Tombstone]:
+    queryset = Tombstone.objects.filter(object_type=object_type, timestamp__lte=until)
+    if after is not None:
+        if after.source == _SOURCE_RECORDS:
+            condition = models.Q(timestamp__gte=after.timestamp)
+        else:
+            condition = models.Q(timestamp__gt=after.timestamp) | models.Q(
+                timestamp=after.timestamp, pk__gt=after.pk
+            )
+        queryset = queryset.filter(condition)
+    return queryset.order_by("timestamp", "pk")
+
+
+def _record_to_change(record: Record) -> Change:
+    is_revoked = record.publicatiestatus == PublicationStatusOptions.revoked
+    return Change(
+        change_type=ChangeTypes.revoked if is_revoked else ChangeTypes.modified,
+        uuid=record.uuid,
+        timestamp=record.laatst_gewijzigd_datum,
+        record=None if is_revoked else record,
+        position=Position(record.laatst_gewijzigd_datum, _SOURCE_RECORDS, record.pk),
+    )
+
+
+def _tombstone_to_change(tombstone: Tombstone) -> Change:
+    return Change(
+        change_type=ChangeTypes.deleted,
+        uuid=tombstone.uuid,
+        timestamp=tombstone.timestamp,
+        record=None,
+        position=Position(tombstone.timestamp, _SOURCE_TOMBSTONES, tombstone.pk),
+    )
+
+
+def get_changes(
+    queryset: models.QuerySet[Publication] | models.QuerySet[Document],
+    *,
+    after: Position | None,
+    limit: int,
+) -> tuple[list[Change], bool]:
+    """
+    Get the next ``limit`` changes after the given position, leaving out the changes
+    of the last ``settings.CHANGE_FEED_SAFETY_LAG`` seconds.
+
+    :param queryset: the records to report changes for. Any related objects required
+      to process the changed records should be selected/prefetched.
+    :param after: the position of the last processed change, or ``None`` to start
+      from the beginning.
+    :returns: the changes and whether there are more changes after them.
+    """
+    object_type = (
+        TombstoneObjectTypes.publication
+        if queryset.model is Publication
+        else TombstoneObjectTypes.document
+    )
+    # the changes of transactions that may not be committed yet are left out
+    until = timezone.now() - timedelta(seconds=settings.CHANGE_FEED_SAFETY_LAG)
+    # Fetch (at most) one change more than requested from each source to find out if
+    # more changes are available.
+    records = _get_record_changes(queryset, after, until)[: limit + 1]
+    tombstones = _get_tombstones(object_type, after, until)[: limit + 1]
+
+    merged: Iterator[Change] = heapq.merge(
+        map(_record_to_change, records),
+        map(_tombstone_to_change, tombstones),
+        key=lambda change: change.position,
+    )
+    changes = list(merged)
+    return changes[:limit], len(changes) > limit
@@ -12,3 +12,14 @@ class DocumentActionTypeOptions(models.TextChoices):
     signed = "ondertekening", _("Signed")
     received = "ontvangst", _("Received")
     declared = "vaststelling", _("Declared")
+
+
+class ChangeTypes(models.TextChoices):
+    modified = "gewijzigd", _("Modified")
+    revoked = "ingetrokken", _("Revoked")
+    deleted = "verwijderd", _("Deleted")
+
+
+class TombstoneObjectTypes(models.TextChoices):
+    publication = "publicatie", _("Publication")
+    document = "document", _("Document")
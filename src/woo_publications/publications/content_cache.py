@@ -0,0 +1,251 @@
+"""
+Cache the file contents of published documents on disk.
+
+Published documents rarely change, so their contents are kept in
+``PRIVATE_MEDIA_ROOT`` after they are downloaded from the Documents API. Cached files
+are served with django-sendfile2, so that the reverse proxy sends them to the client
+rather than an application worker.
+
+A cached file is identified by the ETag of the document, which changes whenever the
+document is modified. Outdated files are removed when a document is saved or deleted.
+The total size of the cache is limited by ``settings.DOCUMENT_CONTENT_CACHE_MAX_SIZE``
+- the least recently used files are evicted first. The size of the added files is
+tracked in the Django cache, the cache directory is only scanned for files to evict
+once the tracked size exceeds the limit.
+"""
+
+import logging
+import os
+import shutil
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .constants import PublicationStatusOptions
+from .download import get_etag
+from .models import Document
+
+__all__ = [
+    "get_cached_file",
+    "cache_while_streaming",
+    "acache_while_streaming",
+    "invalidate",
+    "evict",
+]
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRECTORY = "document-content"
+
+_SIZE_CACHE_KEY = "woo_publications:document-content-cache:size"
+
+# the fraction of the maximum size the cache is reduced to when it's full, so that
+# not every file added to a full cache requires scanning the cache directory
+EVICTION_TARGET = 0.9
+
+
+def _get_cache_root() -> Path:
+    return Path(settings.PRIVATE_MEDIA_ROOT) / CACHE_DIRECTORY
+
+
+def _get_path(document: Document) -> Path:
+    return _get_cache_root() / str(document.uuid) / get_etag(document).strip('"')
+
+
+def is_cacheable(document: Document) -> bool:
+    max_size: int = settings.DOCUMENT_CONTENT_CACHE_MAX_SIZE
+    return (
+        document.publicatiestatus == PublicationStatusOptions.published
+        and 0 < document.bestandsomvang <= max_size
+    )
+
+
+def get_cached_file(document: Document) -> Path | None:
+    """
+    Get the path to the cached file contents of the document, if they are cached.
+    """
+    if not is_cacheable(document):
+        return None
+    path = _get_path(document)
+    try:
+        # mark the file as recently used
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    return path
+
+
+class _CacheWriter:
+    """
+    Write the file contents of the document to a temporary file in the cache, which
+    is added to the cache once the complete contents have been written.
+
+    Failing to write the file is logged, but doesn't raise.
+    """
+
+    def __init__(self, document: Document):
+        self.document = document
+        self.path = _get_path(document)
+        self.size = 0
+        self._temp_file: IO[bytes] | None = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._temp_file = NamedTemporaryFile(
+                dir=self.path.parent, prefix=".", delete=False
+            )
+        except OSError:
+            logger.exception("Could not create a file in the document content cache.")
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._temp_file is None:
+            return
+        try:
+            self._temp_file.write(chunk)
+        except OSError:
+            logger.exception(
+                "Could not write to the document content cache.",
+                extra={"document_uuid": self.document.uuid},
+            )
+            self.discard()
+
+    def commit(self) -> None:
+        if (temp_file := self._temp_file) is None:
+            return
+        # the download was incomplete
+        if self.size != self.document.bestandsomvang:
+            self.discard()
+            return
+        try:
+            temp_file.close()
+            os.replace(temp_file.name, self.path)
+        except OSError:
+            logger.exception(
+                "Could not add the file to the document content cache.",
+                extra={"document_uuid": self.document.uuid},
+            )
+            self.discard()
+            return
+        self._temp_file = None
+        _remove_outdated(self.document.uuid, keep=self.path)
+        _track_size(self.size)
+
+    def discard(self) -> None:
+        if (temp_file := self._temp_file) is None:
+            return
+        self._temp_file = None
+        temp_file.close()
+        Path(temp_file.name).unlink(missing_ok=True)
+
+
+def cache_while_streaming(
+    document: Document, chunks: Iterable[bytes]
+) -> Iterator[bytes]:
+    """
+    Pass the chunks of the file contents through, while writing them to the cache.
+
+    The file is only added to the cache once the complete file contents have been
+    received. Failing to write the file doesn't interrupt the stream.
+    """
+    if not is_cacheable(document):
+        yield from chunks
+        return
+
+    writer = _CacheWriter(document)
+    try:
+        for chunk in chunks:
+            writer.write(chunk)
+            yield chunk
+        writer.commit()
+    finally:
+        # the download was interrupted
+        writer.discard()
+
+
+async def acache_while_streaming(
+    document: Document, chunks: AsyncIterable[bytes]
+) -> AsyncIterator[bytes]:
+    """
+    Async equivalent of :func:`cache_while_streaming`.
+    """
+    if not is_cacheable(document):
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    writer = _CacheWriter(document)
+    try:
+        async for chunk in chunks:
+            writer.write(chunk)
+            yield chunk
+        writer.commit()
+    finally:
+        writer.discard()
+
+
+def _remove_outdated(document_uuid: UUID, keep: Path) -> None:
+    for path in (_get_cache_root() / str(document_uuid)).glob("[!.]*"):
+        if path != keep:
+            path.unlink(missing_ok=True)
+
+
+def invalidate(document_uuid: UUID) -> None:
+    """
+    Remove the cached file contents of the document.
+    """
+    shutil.rmtree(_get_cache_root() / str(document_uuid), ignore_errors=True)
+
+
+def _track_size(size: int) -> None:
+    """
+    Add the size of an added file to the tracked size of the cache, and evict files
+    if the cache is full.
+
+    Removed files are not subtracted, the tracked size is corrected when the cache
+    directory is scanned.
+    """
+    max_size: int = settings.DOCUMENT_CONTENT_CACHE_MAX_SIZE
+    try:
+        total_size = cache.incr(_SIZE_CACHE_KEY, size)
+    except ValueError:
+        # the size is not tracked (yet)
+        total_size = None
+    if total_size is None or total_size > max_size:
+        evict(int(max_size * EVICTION_TARGET))
+
+
+def evict(max_size: int | None = None) -> None:
+    """
+    Remove the least recently used files until the cache fits in ``max_size`` bytes.
+
+    The tracked size of the cache is updated to the size of the remaining files.
+
+    :param max_size: defaults to ``settings.DOCUMENT_CONTENT_CACHE_MAX_SIZE``.
+    """
+    if max_size is None:
+        max_size = settings.DOCUMENT_CONTENT_CACHE_MAX_SIZE
+
+    files: list[tuple[float, int, Path]] = []
+    for path in _get_cache_root().glob("*/*"):
+        # skip the files that are still being written
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total_size <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= size
+
+    cache.set(_SIZE_CACHE_KEY, total_size, timeout=None)
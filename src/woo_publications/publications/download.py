@@ -0,0 +1,259 @@
+"""
+Serve (parts of) the file content of documents from the Documents API.
+
+The file content is identified by the document and its last modification timestamp,
+which enables conditional requests (``If-None-Match``/``If-Modified-Since``) and
+resuming interrupted downloads with ``Range`` requests.
+"""
+
+import hashlib
+import re
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils.http import parse_http_date_safe, quote_etag
+
+import httpx
+import requests
+from rest_framework import status
+
+from woo_publications.contrib.documents_api.async_client import AsyncDocumentenClient
+from woo_publications.contrib.documents_api.client import DocumentenClient
+
+from .models import Document
+
+__all__ = [
+    "ByteRange",
+    "UnsatisfiableRange",
+    "get_etag",
+    "get_last_modified",
+    "get_requested_range",
+    "get_chunk_size",
+    "open_upstream_download",
+    "iter_content",
+    "aopen_upstream_download",
+    "aiter_content",
+]
+
+# the number of chunks a file is (roughly) split into, within the configured bounds
+CHUNKS_PER_FILE = 64
+
+# only a single range is supported - requests for multiple ranges are served the
+# complete file, which is allowed by RFC 9110
+_RANGE_RE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+class UnsatisfiableRange(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    start: int
+    end: int
+    """
+    The position of the last byte in the range (inclusive).
+    """
+    size: int
+    """
+    The size of the complete file.
+    """
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    @property
+    def range_header(self) -> str:
+        return f"bytes={self.start}-{self.end}"
+
+    @property
+    def content_range_header(self) -> str:
+        return f"bytes {self.start}-{self.end}/{self.size}"
+
+
+def get_etag(document: Document) -> str:
+    """
+    Get the (strong) entity tag of the file content of the document.
+    """
+    key = f"{document.uuid}:{document.document_uuid}:{document.laatst_gewijzigd_datum}"
+    return quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+
+
+def get_last_modified(document: Document) -> datetime:
+    return document.laatst_gewijzigd_datum
+
+
+def parse_range_header(header: str, size: int) -> ByteRange | None:
+    """
+    Parse the ``Range`` header value for a file of ``size`` bytes.
+
+    :returns: the requested range, or ``None`` if the complete file should be served.
+    :raises UnsatisfiableRange: if the range is outside of the file.
+    """
+    if not (match := _RANGE_RE.match(header)):
+        return None
+    first, last = match.groups()
+
+    if not first:
+        # suffix range - the last N bytes
+        if not last:
+            return None
+        if not (suffix_length := int(last)) or not size:
+            raise UnsatisfiableRange
+        return ByteRange(start=max(size - suffix_length, 0), end=size - 1, size=size)
+
+    start = int(first)
+    if last and int(last) < start:
+        return None  # invalid, ignore the header
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size:
+        raise UnsatisfiableRange
+    return ByteRange(start=start, end=end, size=size)
+
+
+def get_requested_range(request: HttpRequest, document: Document) -> ByteRange | None:
+    """
+    Determine the part of the file content requested with the ``Range`` header.
+
+    The range is ignored if the ``If-Range`` condition does not match the current
+    file content.
+
+    :raises UnsatisfiableRange: if the range is outside of the file.
+    """
+    if not (range_header := request.headers.get("Range")):
+        return None
+
+    if if_range := request.headers.get("If-Range"):
+        if if_range.startswith(('"', "W/")):
+            if if_range != get_etag(document):
+                return None
+        else:
+            timestamp = parse_http_date_safe(if_range)
+            last_modified = int(get_last_modified(document).timestamp())
+            if timestamp is None or timestamp < last_modified:
+                return None
+
+    return parse_range_header(range_header, document.bestandsomvang)
+
+
+def get_chunk_size(size: int) -> int:
+    """
+    Pick the size of the chunks to stream ``size`` bytes of file content in.
+
+    Small files are read in small chunks, so that little memory is held per download.
+    Large files are read in larger chunks to reduce the overhead per chunk, which
+    otherwise dominates the CPU time of the download. The chunk size is a power of two
+    between ``settings.DOWNLOAD_MIN_CHUNK_SIZE`` and
+    ``settings.DOWNLOAD_MAX_CHUNK_SIZE``.
+    """
+    min_chunk_size: int = settings.DOWNLOAD_MIN_CHUNK_SIZE
+    max_chunk_size: int = settings.DOWNLOAD_MAX_CHUNK_SIZE
+    target = -(-size // CHUNKS_PER_FILE)  # rounded up
+    chunk_size = 1 << max(target - 1, 0).bit_length()
+    return max(min_chunk_size, min(chunk_size, max_chunk_size))
+
+
+def open_upstream_download(
+    client: DocumentenClient,
+    document: Document,
+    byte_range: ByteRange | None = None,
+) -> requests.Response:
+    """
+    Request the file content from the Documents API, without reading it yet.
+
+    The range is forwarded to the Documents API. Check the status code of the
+    response - it may ignore the range and respond with the complete file instead.
+    """
+    return client.get(
+        f"enkelvoudiginformatieobjecten/{document.document_uuid}/download",
+        headers={"Range": byte_range.range_header} if byte_range else None,
+        stream=True,
+    )
+
+
+def iter_content(
+    upstream_response: requests.Response,
+    byte_range: ByteRange | None,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """
+    Read the (requested part of the) file content from the upstream response.
+    """
+    chunks = (
+        chunk
+        for chunk in upstream_response.iter_content(chunk_size=chunk_size)
+        if chunk
+    )
+    if (
+        byte_range is None
+        or upstream_response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    ):
+        yield from chunks
+        return
+
+    # the Documents API ignored the range - select it from the complete content
+    position = 0
+    for chunk in chunks:
+        chunk_start, position = position, position + len(chunk)
+        if position <= byte_range.start:
+            continue
+        yield _select_range(chunk, chunk_start, byte_range)
+        if position > byte_range.end:
+            break
+
+
+async def aopen_upstream_download(
+    client: AsyncDocumentenClient,
+    document: Document,
+    byte_range: ByteRange | None = None,
+) -> httpx.Response:
+    """
+    Async equivalent of :func:`open_upstream_download`.
+
+    The response must be closed, which :func:`aiter_content` does once the content
+    is read.
+    """
+    return await client.download(
+        document_uuid=document.document_uuid,
+        headers={"Range": byte_range.range_header} if byte_range else None,
+    )
+
+
+async def aiter_content(
+    upstream_response: httpx.Response,
+    byte_range: ByteRange | None,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    Async equivalent of :func:`iter_content`, closing the upstream response.
+    """
+    try:
+        chunks = upstream_response.aiter_bytes(chunk_size=chunk_size)
+        if (
+            byte_range is None
+            or upstream_response.status_code == status.HTTP_206_PARTIAL_CONTENT
+        ):
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        position = 0
+        async for chunk in chunks:
+            chunk_start, position = position, position + len(chunk)
+            if position <= byte_range.start:
+                continue
+            yield _select_range(chunk, chunk_start, byte_range)
+            if position > byte_range.end:
+                break
+    finally:
+        await upstream_response.aclose()
+
+
+def _select_range(chunk: bytes, chunk_start: int, byte_range: ByteRange) -> bytes:
+    # the chunk starts at position ``chunk_start`` of the complete content
+    offset, stop = byte_range.start - chunk_start, byte_range.end + 1 - chunk_start
+    return chunk[slice(max(offset, 0), stop)]
@@ -0,0 +1,78 @@
+"""
+Bulk export of the publications and their documents.
+
+The export is written as newline-delimited JSON (one publication per line), using
+the same field layout as the API endpoints. Records are fetched in chunks through a
+server-side cursor and each line is produced when it's consumed, so the memory usage
+does not depend on the number of exported records.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from django.db.models import Prefetch, QuerySet
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from woo_publications.logging.service import annotate_owner
+
+from .api.serializers import DocumentSerializer, PublicationSerializer
+from .models import Document, Publication
+
+__all__ = ["get_export_queryset", "export_publications"]
+
+EXPORT_CHUNK_SIZE = 500
+
+
+def get_export_queryset(
+    queryset: QuerySet[Publication] | None = None,
+) -> QuerySet[Publication]:
+    """
+    Fetch all the data required for the export along with the publications.
+
+    :param queryset: the publications to export, all publications by default.
+    """
+    if queryset is None:
+        queryset = Publication.objects.order_by("pk")
+    documents = annotate_owner(Document.objects.order_by("-creatiedatum", "pk"))
+    return annotate_owner(
+        queryset.select_related(
+            "publisher",
+            "verantwoordelijke",
+            "opsteller",
+        ).prefetch_related(
+            "informatie_categorieen",
+            # the prefetched documents have their publication set to the instance
+            # from the outer query
+            Prefetch("document_set", queryset=documents),
+        )
+    )
+
+
+def export_publications(
+    queryset: QuerySet[Publication],
+    *,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    context: dict[str, Any] | None = None,
+) -> Iterator[bytes]:
+    """
+    Produce the NDJSON lines of the publications, with their documents nested.
+
+    :param queryset: the publications to export, see :func:`get_export_queryset`.
+    :param chunk_size: the number of publications fetched from the database at a
+      time. The related objects are prefetched per chunk.
+    :param context: the serializer context.
+    """
+    # The serializer instances are reused for all records, which also ensures that
+    # lookups cached on the fields are only done once.
+    publication_serializer = PublicationSerializer(context=context or {})
+    document_serializer = DocumentSerializer(context=context or {})
+    renderer = CamelCaseJSONRenderer()
+
+    for publication in queryset.iterator(chunk_size=chunk_size):
+        data = publication_serializer.to_representation(publication)
+        data["documenten"] = [
+            document_serializer.to_representation(document)
+            for document in publication.document_set.all()  # pyright: ignore[reportAttributeAccessIssue]
+        ]
+        yield renderer.render(data) + b"\n"
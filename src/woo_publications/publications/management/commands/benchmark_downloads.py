@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks import benchmark_download
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput and CPU time of proxying document downloads from "
+        "the Documents API, using a local stand-in for the Documents API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            action="store",
+            type=int,
+            default=1024,
+            help="The size of the downloaded file in MiB.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            action="append",
+            type=int,
+            dest="chunk_sizes",
+            help=(
+                "The size of the chunks in bytes, may be repeated. By default, the "
+                "chunk size that is picked for the file size is measured."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        size: int = options["size"]
+        chunk_sizes: list[int | None] = options["chunk_sizes"] or [None]
+        if size < 1:
+            raise CommandError("The size must be a positive number.")
+        if any(chunk_size is not None and chunk_size < 1 for chunk_size in chunk_sizes):
+            raise CommandError("The chunk size must be a positive number.")
+
+        for chunk_size in chunk_sizes:
+            result = benchmark_download(size=size * 1_048_576, chunk_size=chunk_size)
+            self.stdout.write(
+                f"chunk size {result.chunk_size:>9} B: "
+                f"{result.throughput:8.1f} MB/s, "
+                f"{result.cpu_time_per_gb:6.2f} s CPU/GB"
+            )
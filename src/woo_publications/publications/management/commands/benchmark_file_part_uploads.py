@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmarks import benchmark_file_part_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the time to proxy file part uploads to the Documents API one after "
+        "the other and concurrently, using a local stand-in for the Documents API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--parts",
+            action="append",
+            type=int,
+            dest="parts",
+            help="The number of file parts, may be repeated. Defaults to 1, 4 and 8.",
+        )
+        parser.add_argument(
+            "--part-size",
+            action="store",
+            type=int,
+            default=1024,
+            help="The size of each file part in KiB.",
+        )
+        parser.add_argument(
+            "--latency",
+            action="store",
+            type=int,
+            default=200,
+            help="The simulated response time of the Documents API in milliseconds.",
+        )
+
+    def handle(self, *args, **options):
+        parts: list[int] = options["parts"] or [1, 4, 8]
+        part_size: int = options["part_size"]
+        latency: int = options["latency"]
+        if any(num_parts < 1 for num_parts in parts):
+            raise CommandError("The number of parts must be a positive number.")
+        if part_size < 1:
+            raise CommandError("The part size must be a positive number.")
+        if latency < 0:
+            raise CommandError("The latency can not be negative.")
+
+        for num_parts in parts:
+            result = benchmark_file_part_uploads(
+                parts=num_parts, part_size=part_size * 1024, latency=latency / 1000
+            )
+            self.stdout.write(
+                f"{result.parts:>3} parts: "
+                f"{result.sequential_time:6.2f} s sequential, "
+                f"{result.concurrent_time:6.2f} s concurrent "
+                f"({result.speedup:.1f}x)"
+            )
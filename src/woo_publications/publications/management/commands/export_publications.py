@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...export import EXPORT_CHUNK_SIZE, export_publications, get_export_queryset
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all publications with their documents as newline-delimited JSON, "
+        "using the field layout of the API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--file-path",
+            action="store",
+            help="The file to write the export to. By default, stdout is used.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            action="store",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="The number of publications to fetch from the database at a time.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size: int = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("The chunk size must be a positive number.")
+
+        lines = export_publications(get_export_queryset(), chunk_size=chunk_size)
+
+        if (file_path := options["file_path"]) is None:
+            for line in lines:
+                self.stdout.write(line.decode("utf-8"), ending="")
+            return
+
+        with Path(file_path).open("wb") as outfile:
+            outfile.writelines(lines)
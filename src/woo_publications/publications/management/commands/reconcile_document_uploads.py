@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from requests import RequestException
+
+from woo_publications.contrib.documents_api.client import get_client
+
+from ...models import Document
+
+
+class Command(BaseCommand):
+    help = (
+        "Synchronize the tracked file parts of documents with incomplete uploads with "
+        "the Documents API, and unlock the documents that are completely uploaded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            action="store",
+            type=int,
+            default=60,
+            help=(
+                "Only reconcile documents registered at least this many minutes ago, "
+                "to leave uploads in progress alone. Defaults to 60 minutes."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        min_age: int = options["min_age"]
+        if min_age < 0:
+            raise CommandError("The minimum age must not be negative.")
+
+        documents = (
+            Document.objects.filter(
+                file_parts__completed=False,
+                registratiedatum__lte=timezone.now() - timedelta(minutes=min_age),
+            )
+            .select_related("document_service")
+            .distinct()
+            .order_by("pk")
+        )
+
+        num_completed = num_failed = 0
+        for document in documents.iterator():
+            assert document.document_service is not None
+            try:
+                with get_client(document.document_service) as client:
+                    completed = document.reconcile_upload_status(client)
+            except RequestException as exc:
+                num_failed += 1
+                self.stderr.write(
+                    f"Could not reconcile the upload status of document "
+                    f"{document.uuid}: {exc}"
+                )
+                continue
+            num_completed += completed
+
+        self.stdout.write(
+            f"Completed the upload of {num_completed} document(s), "
+            f"{num_failed} failure(s)."
+        )
+        if num_failed:
+            raise CommandError(
+                "The upload status of some documents could not be reconciled."
+            )
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("publications", "0012_alter_document_bestandsomvang"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="document",
+            name="owner_display_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="The display name of the user that created the record, as recorded in the audit trails.",
+                max_length=255,
+                verbose_name="owner display name",
+            ),
+        ),
+        migrations.AddField(
+            model_name="document",
+            name="owner_identifier",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="The system identifier of the user that created the record, as recorded in the audit trails.",
+                max_length=255,
+                verbose_name="owner identifier",
+            ),
+        ),
+        migrations.AddField(
+            model_name="publication",
+            name="owner_display_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="The display name of the user that created the record, as recorded in the audit trails.",
+                max_length=255,
+                verbose_name="owner display name",
+            ),
+        ),
+        migrations.AddField(
+            model_name="publication",
+            name="owner_identifier",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="The system identifier of the user that created the record, as recorded in the audit trails.",
+                max_length=255,
+                verbose_name="owner identifier",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.17 on 2026-10-18 10:58
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # build the indexes without blocking writes to the tables
+    atomic = False
+
+    dependencies = [
+        ("publications", "0013_document_owner_and_publication_owner"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="document",
+            index=models.Index(
+                fields=["creatiedatum", "id"], name="document_creatiedatum_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="publication",
+            index=models.Index(
+                fields=["registratiedatum", "id"], name="publication_registratie_idx"
+            ),
+        ),
+    ]
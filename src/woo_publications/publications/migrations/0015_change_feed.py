@@ -0,0 +1,80 @@
+# Generated by Django 4.2.17 on 2026-10-18 11:01
+
+import django.utils.timezone
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # build the indexes on the existing tables without blocking writes
+    atomic = False
+
+    dependencies = [
+        ("publications", "0014_cursor_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.CharField(
+                        choices=[
+                            ("publicatie", "Publication"),
+                            ("document", "Document"),
+                        ],
+                        max_length=50,
+                        verbose_name="object type",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        help_text="The UUID of the deleted record.", verbose_name="UUID"
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="deleted on",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "tombstone",
+                "verbose_name_plural": "tombstones",
+            },
+        ),
+        AddIndexConcurrently(
+            model_name="document",
+            index=models.Index(
+                fields=["laatst_gewijzigd_datum", "id"], name="document_gewijzigd_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="publication",
+            index=models.Index(
+                fields=["laatst_gewijzigd_datum", "id"],
+                name="publication_gewijzigd_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["object_type", "timestamp", "id"],
+                name="tombstone_change_feed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.2.17 on 2026-10-18 11:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("publications", "0015_change_feed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentFilePart",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        help_text="The UUID of the file part in the Documents API.",
+                        verbose_name="UUID",
+                    ),
+                ),
+                (
+                    "order",
+                    models.PositiveIntegerField(
+                        help_text="The sequence number of the file part.",
+                        verbose_name="order",
+                    ),
+                ),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(
+                        help_text="The expected size of the file part, in bytes.",
+                        verbose_name="size",
+                    ),
+                ),
+                (
+                    "completed",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the file part has been uploaded.",
+                        verbose_name="completed",
+                    ),
+                ),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="file_parts",
+                        to="publications.document",
+                        verbose_name="document",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "document file part",
+                "verbose_name_plural": "document file parts",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="documentfilepart",
+            constraint=models.UniqueConstraint(
+                fields=("document", "uuid"), name="unique_document_file_part"
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+from django.db import migrations, transaction
+from django.db.migrations.state import StateApps
+
+CHUNK_SIZE = 1000
+
+
+# The owners of the records created before the owner columns were added are only
+# recorded in the audit logs - copy them over, so filtering on the owner doesn't
+# have to fall back to the audit logs. The backfill_owners management command does
+# the same, and can be used to resume an interrupted run.
+#
+# Only the historical models are used, so that later changes to the application code
+# don't affect this migration.
+def backfill_publication_and_document_owners(apps: StateApps, _):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    TimelineLog = apps.get_model("timeline_logger", "TimelineLog")
+
+    for model_name in ("publication", "document"):
+        model = apps.get_model("publications", model_name)
+        content_type = ContentType.objects.filter(
+            app_label="publications", model=model_name
+        ).first()
+        # without a content type, no audit logs can exist for the model
+        if content_type is None:
+            continue
+
+        last_pk = 0
+        while True:
+            pks = list(
+                model.objects.filter(pk__gt=last_pk, owner_identifier="")
+                .order_by("pk")
+                .values_list("pk", flat=True)[:CHUNK_SIZE]
+            )
+            if not pks:
+                break
+
+            create_logs = (
+                TimelineLog.objects.filter(
+                    content_type=content_type,
+                    object_id__in=[str(pk) for pk in pks],
+                    extra_data__event="create",
+                )
+                .order_by("object_id", "pk")
+                .distinct("object_id")
+                .values_list("object_id", "extra_data__acting_user")
+            )
+
+            to_update = []
+            for object_id, acting_user in create_logs:
+                if not isinstance(acting_user, dict) or not acting_user.get(
+                    "identifier"
+                ):
+                    continue
+                to_update.append(
+                    model(
+                        pk=int(object_id),
+                        owner_identifier=str(acting_user["identifier"]),
+                        owner_display_name=acting_user.get("display_name", ""),
+                    )
+                )
+
+            with transaction.atomic():
+                model.objects.bulk_update(
+                    to_update,
+                    fields=("owner_identifier", "owner_display_name"),
+                )
+
+            last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    # commit every chunk of the backfill separately
+    atomic = False
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("timeline_logger", "0006_auto_20220413_0749"),
+        ("publications", "0016_document_file_parts"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_publication_and_document_owners, migrations.RunPython.noop
+        ),
+    ]
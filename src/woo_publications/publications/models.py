@@ -10,11 +10,14 @@ from django.utils.translation import gettext_lazy as _
 
 from rest_framework.reverse import reverse
 from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
 
 from woo_publications.accounts.models import User
-from woo_publications.config.models import GlobalConfiguration
+from woo_publications.api.parsers import StreamedFile
+from woo_publications.config.cache import get_global_configuration, get_service
 from woo_publications.contrib.documents_api.client import (
     Document as ZGWDocument,
+    DocumentenClient,
     get_client,
 )
 from woo_publications.logging.serializing import serialize_instance
@@ -28,7 +31,11 @@ from woo_publications.metadata.constants import InformationCategoryOrigins
 from woo_publications.metadata.models import InformationCategory
 from woo_publications.metadata.service import get_inspannings_verplichting
 
-from .constants import DocumentActionTypeOptions, PublicationStatusOptions
+from .constants import (
+    DocumentActionTypeOptions,
+    PublicationStatusOptions,
+    TombstoneObjectTypes,
+)
 from .typing import DocumentActions
 
 # when the document isn't specified both the service and uuid needs to be unset
@@ -37,6 +44,21 @@ _DOCUMENT_NOT_SET = models.Q(document_service=None, document_uuid=None)
 _DOCUMENT_SET = ~models.Q(document_service=None) & ~models.Q(document_uuid=None)
 
 
+def get_document_type_url(
+    information_category_uuid: UUID, build_absolute_uri: Callable[[str], str]
+) -> str:
+    """
+    Get the URL of the 'informatieobjecttype' of an information category.
+
+    The information categories are exposed as document types to the Documents API.
+    """
+    iot_path = reverse(
+        "catalogi-informatieobjecttypen-detail",
+        kwargs={"uuid": information_category_uuid},
+    )
+    return build_absolute_uri(iot_path)
+
+
 class Publication(ModelOwnerMixin, models.Model):
     id: int  # implicitly provided by django
     uuid = models.UUIDField(
@@ -120,6 +142,18 @@ class Publication(ModelOwnerMixin, models.Model):
     class Meta:  # pyright: ignore
         verbose_name = _("publication")
         verbose_name_plural = _("publications")
+        indexes = [
+            # supports the cursor pagination in the API
+            models.Index(
+                fields=["registratiedatum", "id"],
+                name="publication_registratie_idx",
+            ),
+            # supports the change feed in the API
+            models.Index(
+                fields=["laatst_gewijzigd_datum", "id"],
+                name="publication_gewijzigd_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.officiele_titel
@@ -169,24 +203,35 @@ class Publication(ModelOwnerMixin, models.Model):
                 **log_extra_kwargs,  # pyright: ignore[reportArgumentType]
             )
 
-    @property
     def get_diwoo_informatie_categorieen_uuids(
         self,
-    ) -> models.QuerySet[InformationCategory, UUID]:
-        return (
-            self.informatie_categorieen.annotate(
-                sitemap_uuid=models.Case(
-                    models.When(
-                        oorsprong=InformationCategoryOrigins.custom_entry,
-                        then=models.Value(get_inspannings_verplichting().uuid),
-                    ),
-                    default=models.F("uuid"),
-                )
-            )
-            .order_by("sitemap_uuid")
-            .distinct("sitemap_uuid")
-            .values_list("sitemap_uuid", flat=True)
-        )
+        get_inspanningsverplichting_uuid: Callable[[], UUID] = (
+            lambda: get_inspannings_verplichting().uuid
+        ),
+    ) -> list[UUID]:
+        """
+        Determine the (sorted, unique) information category UUIDs for the sitemap.
+
+        Custom information categories are reported as the 'inspanningsverplichting'
+        category. The categories are evaluated in Python so that prefetched
+        ``informatie_categorieen`` are used, and the 'inspanningsverplichting' UUID is
+        only looked up if a custom category is present.
+        """
+        uuids: set[UUID] = set()
+        has_custom_entry = False
+        for information_category in self.informatie_categorieen.all():
+            if (
+                information_category.oorsprong
+                == InformationCategoryOrigins.custom_entry
+            ):
+                has_custom_entry = True
+            else:
+                uuids.add(information_category.uuid)
+
+        if has_custom_entry:
+            uuids.add(get_inspanningsverplichting_uuid())
+
+        return sorted(uuids)
 
 
 class Document(ModelOwnerMixin, models.Model):
@@ -317,6 +362,18 @@ class Document(ModelOwnerMixin, models.Model):
     class Meta:  # pyright: ignore
         verbose_name = _("document")
         verbose_name_plural = _("documents")
+        indexes = [
+            # supports the cursor pagination in the API
+            models.Index(
+                fields=["creatiedatum", "id"],
+                name="document_creatiedatum_idx",
+            ),
+            # supports the change feed in the API
+            models.Index(
+                fields=["laatst_gewijzigd_datum", "id"],
+                name="document_gewijzigd_idx",
+            ),
+        ]
         constraints = [
             models.CheckConstraint(
                 check=(_DOCUMENT_NOT_SET | _DOCUMENT_SET),
@@ -368,6 +425,16 @@ class Document(ModelOwnerMixin, models.Model):
 
         self.soort_handeling = documenthandeling["soort_handeling"]
 
+    def get_document_service(self) -> Service | None:
+        """
+        Get the Documents API service of the document from the configuration cache,
+        rather than querying it.
+        """
+        service_id: int | None = (
+            self.document_service_id  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        return None if service_id is None else get_service(service_id)
+
     @property
     def zgw_document(self) -> ZGWDocument | None:
         """
@@ -407,7 +474,7 @@ class Document(ModelOwnerMixin, models.Model):
         """
 
         # Look up which service to use to register the document
-        config = GlobalConfiguration.get_solo()
+        config = get_global_configuration()
         if (service := config.documents_api_service) is None:
             raise RuntimeError(
                 "No documents API configured yet! Set up the global configuration."
@@ -417,61 +484,276 @@ class Document(ModelOwnerMixin, models.Model):
         # XXX: if there are multiple, which to pick?
         information_category = self.publicatie.informatie_categorieen.first()
         assert isinstance(information_category, InformationCategory)
-        iot_path = reverse(
-            "catalogi-informatieobjecttypen-detail",
-            kwargs={"uuid": information_category.uuid},
-        )
-        documenttype_url = build_absolute_uri(iot_path)
 
         with get_client(service) as client:
-            zgw_document = client.create_document(
-                # woo_document.identifier will have duplicates
-                identification=str(self.uuid),
-                source_organisation=config.organisation_rsin,
-                document_type_url=documenttype_url,
-                creation_date=self.creatiedatum,
-                title=self.officiele_titel[:200],
-                filesize=self.bestandsomvang,
-                filename=self.bestandsnaam,
-                author="GPP-Woo/ODRC",  # FIXME
-                # content_type=,  # TODO, later
-                description=self.omschrijving[:1000],
+            zgw_document = self.create_in_documents_api(
+                client,
+                organisation_rsin=config.organisation_rsin,
+                document_type_url=get_document_type_url(
+                    information_category.uuid, build_absolute_uri
+                ),
             )
 
-            # set the URLs for the endpoints. this is not the ideal place to do this,
-            # but we need to know the document UUID *and* the part UUID
-            for part in zgw_document.file_parts:
-                part.url = build_absolute_uri(
-                    reverse(
-                        "api:document-filepart-detail",
-                        kwargs={
-                            "uuid": self.uuid,
-                            "part_uuid": part.uuid,
-                        },
-                    )
+        # update reference in the database to the created document
+        self.set_documents_api_reference(service, zgw_document, build_absolute_uri)
+        self.save()
+        DocumentFilePart.objects.bulk_create(self.build_file_parts())
+
+    def create_in_documents_api(
+        self,
+        client: DocumentenClient,
+        *,
+        organisation_rsin: str,
+        document_type_url: str,
+    ) -> ZGWDocument:
+        """
+        Create the matching document in the Documents API.
+
+        No database queries are performed, so this is safe to call from other threads.
+        """
+        return client.create_document(
+            # woo_document.identifier will have duplicates
+            identification=str(self.uuid),
+            source_organisation=organisation_rsin,
+            document_type_url=document_type_url,
+            creation_date=self.creatiedatum,
+            title=self.officiele_titel[:200],
+            filesize=self.bestandsomvang,
+            filename=self.bestandsnaam,
+            author="GPP-Woo/ODRC",  # FIXME
+            # content_type=,  # TODO, later
+            description=self.omschrijving[:1000],
+        )
+
+    def set_documents_api_reference(
+        self,
+        service: Service,
+        zgw_document: ZGWDocument,
+        build_absolute_uri: Callable[[str], str],
+    ) -> None:
+        """
+        Point to the document created in the Documents API, without saving.
+
+        As a side-effect, this populates ``self.zgw_document``.
+        """
+        # set the URLs for the endpoints. this is not the ideal place to do this,
+        # but we need to know the document UUID *and* the part UUID
+        for part in zgw_document.file_parts:
+            part.url = build_absolute_uri(
+                reverse(
+                    "api:document-filepart-detail",
+                    kwargs={
+                        "uuid": self.uuid,
+                        "part_uuid": part.uuid,
+                    },
                 )
+            )
 
-        # update reference in the database to the created document
         self.document_service = service
         self.document_uuid = zgw_document.uuid
         self.lock = zgw_document.lock
-        self.save()
 
         # cache reference
         self.zgw_document = zgw_document
 
-    def upload_part_data(self, uuid: UUID, file: File) -> bool:
-        assert self.document_service, "A Documents API service must be recorded"
+    def build_file_parts(self) -> list["DocumentFilePart"]:
+        """
+        Build the (unsaved) records of the file parts expected by the Documents API.
+        """
+        assert self.zgw_document is not None, "The document must be registered first"
+        return [
+            DocumentFilePart(
+                document=self,
+                uuid=part.uuid,
+                order=part.order,
+                size=part.size,
+            )
+            for part in self.zgw_document.file_parts
+        ]
+
+    def upload_part_data(self, uuid: UUID, file: File | StreamedFile) -> bool:
+        """
+        Upload the file part to the Documents API and unlock the document when all
+        parts are received.
+
+        The received file parts are tracked locally, so only a single request to the
+        Documents API is needed per part (and one more to unlock the document). The
+        upload status of documents without tracked file parts is checked in the
+        Documents API instead.
+
+        The file parts of a document may be uploaded concurrently - exactly one of
+        the uploads unlocks the document.
+
+        :returns: whether all file parts of the document are received.
+        """
+        service = self.get_document_service()
+        assert service, "A Documents API service must be recorded"
 
-        with get_client(self.document_service) as client:
+        with get_client(service) as client:
             client.proxy_file_part_upload(
                 file,
                 file_part_uuid=uuid,
                 lock=self.lock,
             )
+            return self._complete_file_part(client, uuid)
+
+    def complete_file_part(self, uuid: UUID) -> bool:
+        """
+        Record that the file part is uploaded to the Documents API, and unlock the
+        document when all parts are received.
+
+        Use this when the file part is uploaded separately, e.g. asynchronously -
+        see :meth:`upload_part_data`.
+
+        :returns: whether all file parts of the document are received.
+        """
+        service = self.get_document_service()
+        assert service, "A Documents API service must be recorded"
+
+        with get_client(service) as client:
+            return self._complete_file_part(client, uuid)
+
+    @transaction.atomic()
+    def _complete_file_part(self, client: DocumentenClient, uuid: UUID) -> bool:
+        self._lock_for_upload_status()
+        file_parts = DocumentFilePart.objects.filter(document=self)
+
+        # only the first upload of a part marks it as completed
+        if not file_parts.filter(uuid=uuid, completed=False).update(completed=True):
+            if not file_parts.filter(uuid=uuid).exists():
+                return self.reconcile_upload_status(client)
+            # the file part was uploaded before, and the document unlocked if that
+            # completed the upload
+            return not file_parts.filter(completed=False).exists()
+
+        completed = not file_parts.filter(completed=False).exists()
+        if completed:
+            # if unlocking fails, the file part is not marked as completed, so that
+            # the upload can be retried
+            client.unlock_document(uuid=self.document_uuid, lock=self.lock)
+        return completed
+
+    def _lock_for_upload_status(self) -> None:
+        # Lock the document row until the end of the transaction. Concurrent
+        # uploads of the file parts of this document wait for each other, so they
+        # can't both conclude that they completed the upload.
+        Document.objects.select_for_update().filter(pk=self.pk).values("pk").get()
 
-            completed = client.check_uploads_complete(document_uuid=self.document_uuid)
-            if completed:
-                client.unlock_document(uuid=self.document_uuid, lock=self.lock)
+    @transaction.atomic()
+    def reconcile_upload_status(self, client: DocumentenClient) -> bool:
+        """
+        Synchronize the tracked file parts with the upload status in the Documents API.
+
+        The document is unlocked if all file parts are received but the document is
+        still locked, e.g. because unlocking it failed before.
+
+        :returns: whether all file parts of the document are received.
+        """
+        self._lock_for_upload_status()
+        upload_status = client.get_upload_status(document_uuid=self.document_uuid)
+        if not upload_status.locked:
+            # the Documents API discards the file parts once the document is unlocked
+            DocumentFilePart.objects.filter(document=self).update(completed=True)
+            return True
+
+        DocumentFilePart.objects.bulk_create(
+            [
+                DocumentFilePart(
+                    document=self,
+                    uuid=part.uuid,
+                    order=part.order,
+                    size=part.size,
+                    completed=part.completed,
+                )
+                for part in upload_status.file_parts
+            ],
+            update_conflicts=True,
+            unique_fields=["document", "uuid"],
+            update_fields=["completed"],
+        )
 
+        completed = all(part.completed for part in upload_status.file_parts)
+        if completed:
+            client.unlock_document(uuid=self.document_uuid, lock=self.lock)
         return completed
+
+
+class DocumentFilePart(models.Model):
+    """
+    Track the upload status of a file part of a document in the Documents API.
+    """
+
+    document = models.ForeignKey(
+        Document,
+        verbose_name=_("document"),
+        on_delete=models.CASCADE,
+        related_name="file_parts",
+    )
+    uuid = models.UUIDField(
+        _("UUID"),
+        help_text=_("The UUID of the file part in the Documents API."),
+    )
+    order = models.PositiveIntegerField(
+        _("order"),
+        help_text=_("The sequence number of the file part."),
+    )
+    size = models.PositiveBigIntegerField(
+        _("size"),
+        help_text=_("The expected size of the file part, in bytes."),
+    )
+    completed = models.BooleanField(
+        _("completed"),
+        default=False,
+        help_text=_("Indicates whether the file part has been uploaded."),
+    )
+
+    class Meta:  # pyright: ignore
+        verbose_name = _("document file part")
+        verbose_name_plural = _("document file parts")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document", "uuid"],
+                name="unique_document_file_part",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.document} - {self.order}"
+
+
+class Tombstone(models.Model):
+    """
+    Record the deletion of a publication or document.
+
+    Tombstones are reported in the change feeds of the API, so that consumers syncing
+    the records can remove their copy of deleted records.
+    """
+
+    object_type = models.CharField(
+        _("object type"),
+        max_length=50,
+        choices=TombstoneObjectTypes.choices,
+    )
+    uuid = models.UUIDField(
+        _("UUID"),
+        help_text=_("The UUID of the deleted record."),
+    )
+    timestamp = models.DateTimeField(
+        _("deleted on"),
+        default=timezone.now,
+        editable=False,
+    )
+
+    class Meta:  # pyright: ignore
+        verbose_name = _("tombstone")
+        verbose_name_plural = _("tombstones")
+        indexes = [
+            # supports the change feed in the API
+            models.Index(
+                fields=["object_type", "timestamp", "id"],
+                name="tombstone_change_feed_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_object_type_display()} {self.uuid}"
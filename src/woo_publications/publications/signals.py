@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import content_cache
+from .constants import TombstoneObjectTypes
+from .models import Document, Publication, Tombstone
+
+
+@receiver(post_delete, sender=Publication)
+@receiver(post_delete, sender=Document)
+def record_tombstone(sender, instance: Publication | Document, **kwargs) -> None:
+    object_type = (
+        TombstoneObjectTypes.publication
+        if isinstance(instance, Publication)
+        else TombstoneObjectTypes.document
+    )
+    Tombstone.objects.create(object_type=object_type, uuid=instance.uuid)
+
+
+@receiver([post_save, post_delete], sender=Document)
+def invalidate_document_content_cache(sender, instance: Document, **kwargs) -> None:
+    # the cached file contents are identified by the last modification of the
+    # document, outdated contents are never served but take up disk space
+    if kwargs.get("created"):
+        return
+    content_cache.invalidate(instance.uuid)
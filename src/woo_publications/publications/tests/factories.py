@@ -6,7 +6,7 @@ from woo_publications.contrib.documents_api.tests.factories import ServiceFactor
 from woo_publications.metadata.models import InformationCategory
 from woo_publications.metadata.tests.factories import OrganisationFactory
 
-from ..models import Document, Publication
+from ..models import Document, DocumentFilePart, Publication
 
 
 class PublicationFactory(factory.django.DjangoModelFactory[Publication]):
@@ -48,3 +48,13 @@ class DocumentFactory(factory.django.DjangoModelFactory[Document]):
             ),
             document_uuid=factory.Faker("uuid4"),
         )
+
+
+class DocumentFilePartFactory(factory.django.DjangoModelFactory[DocumentFilePart]):
+    document = factory.SubFactory(DocumentFactory, with_registered_document=True)
+    uuid = factory.Faker("uuid4")
+    order = factory.Sequence(lambda n: n + 1)
+    size = 100
+
+    class Meta:  # pyright: ignore
+        model = DocumentFilePart
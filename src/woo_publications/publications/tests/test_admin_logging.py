@@ -79,6 +79,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                 "id": added_item.pk,
                 "informatie_categorieen": [ic.pk, ic2.pk],
                 "laatst_gewijzigd_datum": "2024-09-25T00:14:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "officiele_titel": "The official title of this publication",
                 "omschrijving": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. Mauris risus nibh, iaculis eu cursus sit amet, accumsan ac urna. Mauris interdum eleifend eros sed consectetur.",
                 "opsteller": organisation2.pk,
@@ -160,6 +162,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "id": publication.pk,
                     "informatie_categorieen": [ic.pk],
                     "laatst_gewijzigd_datum": "2024-09-28T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "officiele_titel": "changed official title",
                     "omschrijving": "changed description",
                     "opsteller": organisation2.pk,
@@ -261,6 +265,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "id": publication.pk,
                     "informatie_categorieen": [ic.pk, ic2.pk],
                     "laatst_gewijzigd_datum": "2024-09-28T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "officiele_titel": "title one",
                     "omschrijving": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
                     "opsteller": organisation.pk,
@@ -305,6 +311,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "document_service": None,
                     "registratiedatum": "2024-09-27T00:14:00Z",
                     "laatst_gewijzigd_datum": "2024-09-28T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                 },
                 "_cached_object_repr": "title",
@@ -353,6 +361,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                 "id": publication.pk,
                 "informatie_categorieen": [information_category.pk],
                 "laatst_gewijzigd_datum": "2024-09-27T00:14:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "officiele_titel": "title one",
                 "omschrijving": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
                 "opsteller": organisation.pk,
@@ -446,6 +456,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "document_service": None,
                     "registratiedatum": "2024-09-25T00:14:00Z",
                     "laatst_gewijzigd_datum": "2024-09-25T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                 },
                 "_cached_object_repr": "title",
@@ -538,6 +550,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "officiele_titel": "title",
                     "registratiedatum": "2024-09-26T00:14:00Z",
                     "laatst_gewijzigd_datum": "2024-09-26T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                     "document_service": None,
                     "document_uuid": None,
@@ -627,6 +641,8 @@ class TestPublicationAdminAuditLogging(WebTest):
                     "document_service": None,
                     "registratiedatum": "2024-09-25T00:14:00Z",
                     "laatst_gewijzigd_datum": "2024-09-25T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                 },
                 "_cached_object_repr": "DELETE THIS ITEM",
@@ -698,6 +714,8 @@ class TestDocumentAdminAuditLogging(WebTest):
                 "document_service": None,
                 "registratiedatum": "2024-09-24T12:00:00Z",
                 "laatst_gewijzigd_datum": "2024-09-24T12:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "soort_handeling": DocumentActionTypeOptions.declared,
             },
             "_cached_object_repr": "The official title of this document",
@@ -779,6 +797,8 @@ class TestDocumentAdminAuditLogging(WebTest):
                     "document_service": None,
                     "registratiedatum": "2024-09-25T14:00:00Z",
                     "laatst_gewijzigd_datum": "2024-09-29T14:00:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                 },
                 "_cached_object_repr": "changed official title",
@@ -839,6 +859,8 @@ class TestDocumentAdminAuditLogging(WebTest):
                 "document_service": None,
                 "registratiedatum": "2024-09-25T14:00:00Z",
                 "laatst_gewijzigd_datum": "2024-09-25T14:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "soort_handeling": DocumentActionTypeOptions.declared,
             },
             "_cached_object_repr": "title one",
@@ -88,6 +88,8 @@ class PublicationLoggingTests(TokenAuthMixin, APITestCase):
                 "id": publication.pk,
                 "informatie_categorieen": [ic.id],
                 "laatst_gewijzigd_datum": "2024-09-24T12:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "officiele_titel": "title one",
                 "omschrijving": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
                 "opsteller": organisation.pk,
@@ -146,6 +148,8 @@ class PublicationLoggingTests(TokenAuthMixin, APITestCase):
                 "id": publication.pk,
                 "informatie_categorieen": [ic.id],
                 "laatst_gewijzigd_datum": "2024-09-27T12:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "officiele_titel": "changed offical title",
                 "omschrijving": "changed description",
                 "opsteller": organisation.pk,
@@ -228,6 +232,8 @@ class PublicationLoggingTests(TokenAuthMixin, APITestCase):
                     "id": publication.pk,
                     "informatie_categorieen": [ic.pk, ic2.pk],
                     "laatst_gewijzigd_datum": "2024-09-28T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "officiele_titel": "title one",
                     "omschrijving": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
                     "opsteller": organisation.pk,
@@ -270,6 +276,8 @@ class PublicationLoggingTests(TokenAuthMixin, APITestCase):
                     "document_service": None,
                     "registratiedatum": "2024-09-27T00:14:00Z",
                     "laatst_gewijzigd_datum": "2024-09-28T00:14:00Z",
+                    "owner_display_name": "",
+                    "owner_identifier": "",
                     "soort_handeling": DocumentActionTypeOptions.declared,
                 },
                 "_cached_object_repr": "title",
@@ -310,6 +318,8 @@ class PublicationLoggingTests(TokenAuthMixin, APITestCase):
                 "id": publication.id,
                 "informatie_categorieen": [ic.id],
                 "laatst_gewijzigd_datum": "2024-09-24T12:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "officiele_titel": "title one",
                 "omschrijving": (
                     "Lorem ipsum dolor sit amet, consectetur adipiscing elit."
@@ -397,6 +407,8 @@ class DocumentLoggingTests(TokenAuthMixin, APITestCase):
                 "id": document.pk,
                 "identifier": "document-1",
                 "laatst_gewijzigd_datum": "2024-09-27T12:00:00Z",
+                "owner_display_name": "",
+                "owner_identifier": "",
                 "lock": "",
                 "officiele_titel": "changed officiele_title",
                 "omschrijving": "changed omschrijving",
@@ -0,0 +1,289 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.urls import include, path
+
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from zgw_consumers.constants import APITypes
+
+from woo_publications.api.async_views import async_transfer_view
+from woo_publications.api.tests.factories import TokenAuthFactory
+from woo_publications.api.tests.mixins import AUDIT_HEADERS
+from woo_publications.contrib.documents_api.client import client_pool
+from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
+from woo_publications.logging.constants import Events
+from woo_publications.logging.models import TimelineLogProxy
+
+from ..api.viewsets import DocumentViewSet
+from ..constants import PublicationStatusOptions
+from ..download import get_etag
+from ..models import DocumentFilePart
+from .factories import DocumentFactory, DocumentFilePartFactory
+
+CONTENT = bytes(range(256)) * 40  # 10 kB
+
+# the routes of the API with ASYNC_FILE_TRANSFERS enabled
+urlpatterns = [
+    path(
+        "api/v1/documenten/<uuid:uuid>/download",
+        async_transfer_view(DocumentViewSet, {"get": "download"}, basename="document"),
+    ),
+    path(
+        "api/v1/documenten/<uuid:uuid>/bestandsdelen/<uuid:part_uuid>",
+        async_transfer_view(DocumentViewSet, {"put": "file_part"}, basename="document"),
+    ),
+    path("", include("woo_publications.urls")),
+]
+
+
+class FakeDocumentsAPI(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+        self.download_status = 200
+        self.download_barrier: threading.Barrier | None = None
+        self.downloads_in_flight = 0
+        self.peak_downloads_in_flight = 0
+        self.download_requests = 0
+        self.upload_status = 200
+        self.uploaded: list[bytes] = []
+        self.unlock_requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def api_root(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/documenten/api/v1/"
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: FakeDocumentsAPI
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.download_requests += 1
+            self.server.downloads_in_flight += 1
+            self.server.peak_downloads_in_flight = max(
+                self.server.peak_downloads_in_flight, self.server.downloads_in_flight
+            )
+        try:
+            self._download()
+        finally:
+            with self.server.lock:
+                self.server.downloads_in_flight -= 1
+
+    def _download(self):
+        if (barrier := self.server.download_barrier) is not None:
+            # only passed when all the downloads are in flight at the same time
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                self._respond(504, b"")
+                return
+        if self.server.download_status != 200:
+            self._respond(self.server.download_status, b"")
+            return
+
+        if range_header := self.headers.get("Range"):
+            start, end = (int(pos) for pos in range_header[6:].split("-"))
+            self._respond(
+                206,
+                CONTENT[slice(start, end + 1)],
+                {"Content-Range": f"bytes {start}-{end}/{len(CONTENT)}"},
+            )
+            return
+        self._respond(200, CONTENT)
+
+    def do_PUT(self):
+        body = self._read_body()
+        if self.server.upload_status != 200:
+            error = {"invalidParams": [{"name": "inhoud", "code": "file-size"}]}
+            self._respond(self.server.upload_status, json.dumps(error).encode())
+            return
+        with self.server.lock:
+            self.server.uploaded.append(body)
+        self._respond(200, b"{}")
+
+    def do_POST(self):
+        self._read_body()
+        with self.server.lock:
+            self.server.unlock_requests += 1
+        self._respond(204, b"")
+
+    def _read_body(self) -> bytes:
+        if "Content-Length" in self.headers:
+            return self.rfile.read(int(self.headers["Content-Length"]))
+        # chunked transfer encoding
+        body = b""
+        while size := int(self.rfile.readline().strip(), 16):
+            body += self.rfile.read(size + 2)[:-2]
+        self.rfile.readline()
+        return body
+
+    def _respond(
+        self, status_code: int, content: bytes, headers: dict[str, str] | None = None
+    ) -> None:
+        self.send_response(status_code)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# like ASYNC_FILE_TRANSFERS under ASGI
+@override_settings(
+    ROOT_URLCONF=__name__,
+    MIDDLEWARE=[
+        settings.ASYNC_CAPABLE_MIDDLEWARE.get(name, name)
+        for name in settings.MIDDLEWARE
+    ],
+)
+class AsyncTransferTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.token = TokenAuthFactory.create(read_write_permission=True).token
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+        self.headers = {"Authorization": f"Token {self.token}", **AUDIT_HEADERS}
+
+        self.documents_api = FakeDocumentsAPI()
+        thread = threading.Thread(target=self.documents_api.serve_forever)
+        thread.start()
+        self.addCleanup(self.documents_api.server_close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.documents_api.shutdown)
+
+        service = ServiceFactory.create(
+            api_root=self.documents_api.api_root, api_type=APITypes.drc
+        )
+        self.document = DocumentFactory.create(
+            publicatiestatus=PublicationStatusOptions.published,
+            document_service=service,
+            document_uuid=uuid4(),
+            bestandsomvang=len(CONTENT),
+            bestandsnaam="report.pdf",
+            lock="abc",
+        )
+        self.download_url = f"/api/v1/documenten/{self.document.uuid}/download"
+
+    async def _download(self, **headers) -> tuple[int, dict[str, str], bytes]:
+        response = await self.async_client.get(
+            self.download_url, headers={**self.headers, **headers}
+        )
+        if response.streaming:
+            content = b"".join([chunk async for chunk in response.streaming_content])
+        else:
+            content = response.content
+        return response.status_code, dict(response.headers), content
+
+    async def test_download(self):
+        status_code, headers, content = await self._download()
+
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertEqual(content, CONTENT)
+        self.assertEqual(headers["Content-Length"], str(len(CONTENT)))
+        self.assertEqual(headers["ETag"], get_etag(self.document))
+        self.assertEqual(
+            headers["Content-Disposition"], 'attachment; filename="report.pdf"'
+        )
+        audit_logs = TimelineLogProxy.objects.filter(extra_data__event=Events.download)
+        self.assertEqual(await audit_logs.acount(), 1)
+
+    async def test_download_range(self):
+        status_code, headers, content = await self._download(Range="bytes=100-199")
+
+        self.assertEqual(status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(content, CONTENT[100:200])
+        self.assertEqual(headers["Content-Range"], f"bytes 100-199/{len(CONTENT)}")
+
+    async def test_download_not_modified(self):
+        status_code, _, _ = await self._download(
+            **{"If-None-Match": get_etag(self.document)}
+        )
+
+        self.assertEqual(status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(self.documents_api.download_requests, 0)
+
+    async def test_download_upstream_error(self):
+        self.documents_api.download_status = 500
+
+        status_code, _, content = await self._download()
+
+        self.assertEqual(status_code, status.HTTP_502_BAD_GATEWAY)
+        self.assertIn("detail", json.loads(content))
+        audit_logs = TimelineLogProxy.objects.filter(extra_data__event=Events.download)
+        self.assertFalse(await audit_logs.aexists())
+
+    async def test_download_requires_authentication(self):
+        response = await self.async_client.get(self.download_url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.documents_api.download_requests, 0)
+
+    async def test_concurrent_downloads_share_the_event_loop(self):
+        # the upstream requests are held until all ten are in flight - one at a time,
+        # the barrier times out and the downloads fail
+        self.documents_api.download_barrier = threading.Barrier(10, timeout=10)
+
+        results = await asyncio.gather(*(self._download() for _ in range(10)))
+
+        self.assertEqual([status_code for status_code, _, _ in results], [200] * 10)
+        self.assertTrue(all(content == CONTENT for _, _, content in results))
+        self.assertEqual(self.documents_api.peak_downloads_in_flight, 10)
+
+    async def _upload_part(self, part: DocumentFilePart):
+        return await self.async_client.put(
+            f"/api/v1/documenten/{self.document.uuid}/bestandsdelen/{part.uuid}",
+            data=encode_multipart(
+                BOUNDARY, {"inhoud": SimpleUploadedFile("part.bin", CONTENT)}
+            ),
+            content_type=MULTIPART_CONTENT,
+            headers=self.headers,
+        )
+
+    async def test_upload_file_part(self):
+        part = await sync_to_async(DocumentFilePartFactory.create)(
+            document=self.document, size=len(CONTENT)
+        )
+
+        response = await self._upload_part(part)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"documentUploadVoltooid": True})
+        self.assertEqual(len(self.documents_api.uploaded), 1)
+        self.assertIn(CONTENT, self.documents_api.uploaded[0])
+        self.assertIn(b'name="lock"\r\n\r\nabc\r\n', self.documents_api.uploaded[0])
+        self.assertEqual(self.documents_api.unlock_requests, 1)
+        await part.arefresh_from_db()
+        self.assertTrue(part.completed)
+
+    async def test_upload_file_part_rejected(self):
+        self.documents_api.upload_status = 400
+        part = await sync_to_async(DocumentFilePartFactory.create)(
+            document=self.document, size=len(CONTENT)
+        )
+
+        response = await self._upload_part(part)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"invalidParams": [{"name": "inhoud", "code": "file-size"}]},
+        )
+        self.assertEqual(self.documents_api.unlock_requests, 0)
+        await part.arefresh_from_db()
+        self.assertFalse(part.completed)
@@ -0,0 +1,67 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+from ..benchmarks import benchmark_download, benchmark_file_part_uploads
+
+
+class DownloadBenchmarkTests(SimpleTestCase):
+    def test_benchmark_download(self):
+        result = benchmark_download(size=3_000_000, chunk_size=65_536)
+
+        self.assertEqual(result.size, 3_000_000)
+        self.assertEqual(result.chunk_size, 65_536)
+        self.assertGreater(result.wall_time, 0)
+        self.assertGreater(result.throughput, 0)
+        self.assertGreaterEqual(result.cpu_time_per_gb, 0)
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_downloads",
+            size=1,
+            chunk_sizes=[8_192, 1_048_576],
+            stdout=stdout,
+        )
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("chunk size      8192 B", lines[0])
+        self.assertIn("chunk size   1048576 B", lines[1])
+
+    def test_command_invalid_size(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_downloads", size=0, stdout=StringIO())
+
+
+class FilePartUploadBenchmarkTests(SimpleTestCase):
+    def test_benchmark_file_part_uploads(self):
+        result = benchmark_file_part_uploads(parts=3, part_size=10_000, latency=0)
+
+        self.assertEqual(result.parts, 3)
+        self.assertEqual(result.part_size, 10_000)
+        self.assertGreater(result.sequential_time, 0)
+        self.assertGreater(result.concurrent_time, 0)
+        self.assertGreater(result.speedup, 0)
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command(
+            "benchmark_file_part_uploads",
+            parts=[1, 2],
+            part_size=1,
+            latency=0,
+            stdout=stdout,
+        )
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("  1 parts:", lines[0])
+        self.assertIn("  2 parts:", lines[1])
+
+    def test_command_invalid_parts(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark_file_part_uploads", parts=[0], stdout=StringIO())
@@ -0,0 +1,258 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import ConstantQueryCountMixin, TokenAuthMixin
+from woo_publications.metadata.constants import InformationCategoryOrigins
+from woo_publications.metadata.tests.factories import InformationCategoryFactory
+
+from ..constants import PublicationStatusOptions, TombstoneObjectTypes
+from ..models import Tombstone
+from .factories import DocumentFactory, PublicationFactory
+
+AUDIT_HEADERS = {
+    "AUDIT_USER_REPRESENTATION": "username",
+    "AUDIT_USER_ID": "id",
+    "AUDIT_REMARKS": "remark",
+}
+
+
+class PublicationChangeFeedTests(TokenAuthMixin, ConstantQueryCountMixin, APITestCase):
+    url = reverse("api:publication-changes")
+
+    def test_changes_in_order(self):
+        ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list
+        )
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            modified, revoked, deleted = PublicationFactory.create_batch(
+                3, informatie_categorieen=[ic]
+            )
+        with freeze_time("2024-09-25T12:00:00-00:00"):
+            deleted_uuid = deleted.uuid
+            deleted.delete()
+            revoked.publicatiestatus = PublicationStatusOptions.revoked
+            revoked.save()
+
+        response = self.client.get(self.url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertTrue(data["token"])
+        results = data["results"]
+        self.assertEqual(
+            [(item["wijziging"], item["uuid"]) for item in results],
+            [
+                ("gewijzigd", str(modified.uuid)),
+                ("ingetrokken", str(revoked.uuid)),
+                ("verwijderd", str(deleted_uuid)),
+            ],
+        )
+        self.assertEqual(results[0]["tijdstip"], "2024-09-24T14:00:00+02:00")
+        self.assertEqual(results[0]["gegevens"]["uuid"], str(modified.uuid))
+        self.assertEqual(
+            results[0]["gegevens"]["informatieCategorieen"], [str(ic.uuid)]
+        )
+        self.assertEqual(
+            results[1],
+            {
+                "wijziging": "ingetrokken",
+                "uuid": str(revoked.uuid),
+                "tijdstip": "2024-09-25T14:00:00+02:00",
+                "gegevens": None,
+            },
+        )
+        self.assertEqual(
+            results[2],
+            {
+                "wijziging": "verwijderd",
+                "uuid": str(deleted_uuid),
+                "tijdstip": "2024-09-25T14:00:00+02:00",
+                "gegevens": None,
+            },
+        )
+
+    def test_resume_from_token(self):
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            # identical timestamps must not cause skipped or duplicated changes
+            publication, publication2 = PublicationFactory.create_batch(2)
+            Tombstone.objects.create(
+                object_type=TombstoneObjectTypes.publication,
+                uuid="f0a6d1b3-bc8a-4e8b-a3c4-05e8f0f8ff0e",
+            )
+
+        with self.subTest("follow the next links"):
+            uuids = []
+            next_url = f"{self.url}?pageSize=1"
+            while next_url:
+                response = self.client.get(next_url, headers=AUDIT_HEADERS)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                data = response.json()
+                uuids += [item["uuid"] for item in data["results"]]
+                next_url = data["next"]
+                token = data["token"]
+
+            self.assertEqual(
+                uuids,
+                [
+                    str(publication.uuid),
+                    str(publication2.uuid),
+                    "f0a6d1b3-bc8a-4e8b-a3c4-05e8f0f8ff0e",
+                ],
+            )
+
+        with self.subTest("no new changes"):
+            response = self.client.get(
+                self.url, {"token": token}, headers=AUDIT_HEADERS
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(data["results"], [])
+            self.assertEqual(data["token"], token)
+            self.assertIsNone(data["next"])
+
+        with self.subTest("new changes"):
+            with freeze_time("2024-09-25T12:00:00-00:00"):
+                publication.officiele_titel = "changed"
+                publication.save()
+
+            response = self.client.get(
+                self.url, {"token": token}, headers=AUDIT_HEADERS
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]], [str(publication.uuid)]
+            )
+            self.assertEqual(
+                data["results"][0]["gegevens"]["officieleTitel"], "changed"
+            )
+            self.assertNotEqual(data["token"], token)
+
+    @override_settings(CHANGE_FEED_SAFETY_LAG=5)
+    def test_recent_changes_are_held_back(self):
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            publication = PublicationFactory.create()
+        with freeze_time("2024-09-24T12:00:10-00:00"):
+            recent_publication = PublicationFactory.create()
+            Tombstone.objects.create(
+                object_type=TombstoneObjectTypes.publication,
+                uuid="f0a6d1b3-bc8a-4e8b-a3c4-05e8f0f8ff0e",
+            )
+
+        with self.subTest("within the safety lag"):
+            with freeze_time("2024-09-24T12:00:14-00:00"):
+                response = self.client.get(self.url, headers=AUDIT_HEADERS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]], [str(publication.uuid)]
+            )
+            self.assertIsNone(data["next"])
+            token = data["token"]
+
+        with self.subTest("after the safety lag"):
+            with freeze_time("2024-09-24T12:00:15-00:00"):
+                response = self.client.get(
+                    self.url, {"token": token}, headers=AUDIT_HEADERS
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(
+                [item["uuid"] for item in response.json()["results"]],
+                [str(recent_publication.uuid), "f0a6d1b3-bc8a-4e8b-a3c4-05e8f0f8ff0e"],
+            )
+
+    def test_invalid_token(self):
+        for token in ("foo", "WzFd", "WyJmb28iLCAwLCAxXQ=="):
+            with self.subTest(token=token):
+                response = self.client.get(
+                    self.url, {"token": token}, headers=AUDIT_HEADERS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("token", response.json())
+
+    @override_settings(CHANGE_FEED_SAFETY_LAG=0)
+    def test_constant_number_of_queries(self):
+        ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.custom_entry
+        )
+        InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list,
+            identifier=settings.INSPANNINGSVERPLICHTING_IDENTIFIER,
+        )
+        # the inspanningsverplichting category is cached
+        self.addCleanup(cache.clear)
+
+        self.assertListQueryCountIsConstant(
+            self.url,
+            lambda amount: PublicationFactory.create_batch(
+                amount, informatie_categorieen=[ic]
+            ),
+        )
+
+
+class DocumentChangeFeedTests(TokenAuthMixin, APITestCase):
+    url = reverse("api:document-changes")
+
+    def test_deleted_publication_results_in_document_tombstones(self):
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            publication = PublicationFactory.create()
+            document = DocumentFactory.create(publicatie=publication)
+            other_document = DocumentFactory.create()
+        with freeze_time("2024-09-25T12:00:00-00:00"):
+            publication.delete()
+
+        response = self.client.get(self.url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.json()["results"]
+        self.assertEqual(
+            [(item["wijziging"], item["uuid"]) for item in results],
+            [
+                ("gewijzigd", str(other_document.uuid)),
+                ("verwijderd", str(document.uuid)),
+            ],
+        )
+        self.assertEqual(
+            results[0]["gegevens"]["publicatie"], str(other_document.publicatie.uuid)
+        )
+
+    def test_revoked_documents(self):
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            publication = PublicationFactory.create(
+                publicatiestatus=PublicationStatusOptions.published
+            )
+            document = DocumentFactory.create(
+                publicatie=publication,
+                publicatiestatus=PublicationStatusOptions.published,
+            )
+        with freeze_time("2024-09-25T12:00:00-00:00"):
+            publication.revoke_own_published_documents(
+                user={"identifier": "123", "display_name": "Henk"}
+            )
+
+        response = self.client.get(self.url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "wijziging": "ingetrokken",
+                    "uuid": str(document.uuid),
+                    "tijdstip": "2024-09-25T14:00:00+02:00",
+                    "gegevens": None,
+                }
+            ],
+        )
@@ -0,0 +1,292 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+import requests_mock
+from django_sendfile.utils import _get_sendfile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import TokenAuthMixin
+from woo_publications.contrib.documents_api.client import client_pool
+from woo_publications.logging.constants import Events
+from woo_publications.logging.models import TimelineLogProxy
+
+from .. import content_cache
+from ..constants import PublicationStatusOptions
+from ..download import get_etag
+from ..models import Document
+from .factories import DocumentFactory
+
+AUDIT_HEADERS = {
+    "AUDIT_USER_REPRESENTATION": "username",
+    "AUDIT_USER_ID": "id",
+    "AUDIT_REMARKS": "remark",
+}
+
+API_ROOT = "http://openzaak.docker.internal:8001/documenten/api/v1/"
+
+CONTENT = b"%PDF" + b"A" * 996
+
+
+class ContentCacheMixin:
+    def setUp(self):
+        super().setUp()  # pyright: ignore[reportAttributeAccessIssue]
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)  # pyright: ignore[reportAttributeAccessIssue]
+        self.private_media_root = Path(tmpdir.name)
+        # the tracked size of the cache
+        self.addCleanup(cache.clear)  # pyright: ignore[reportAttributeAccessIssue]
+
+        overrides = override_settings(
+            PRIVATE_MEDIA_ROOT=tmpdir.name,
+            SENDFILE_ROOT=tmpdir.name,
+            SENDFILE_BACKEND="django_sendfile.backends.nginx",
+            DOCUMENT_CONTENT_CACHE_MAX_SIZE=10_000,
+        )
+        overrides.enable()
+        self.addCleanup(  # pyright: ignore[reportAttributeAccessIssue]
+            overrides.disable
+        )
+
+    def _get_cached_files(self) -> list[Path]:
+        root = self.private_media_root / content_cache.CACHE_DIRECTORY
+        return sorted(path for path in root.glob("*/*"))
+
+
+@requests_mock.Mocker()
+class CachedDownloadTests(ContentCacheMixin, TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+        self.document = DocumentFactory.create(
+            with_registered_document=True,
+            publicatiestatus=PublicationStatusOptions.published,
+            bestandsomvang=len(CONTENT),
+            bestandsnaam="report.pdf",
+        )
+        self.url = reverse("api:document-download", kwargs={"uuid": self.document.uuid})
+        self.upstream_url = (
+            f"{API_ROOT}enkelvoudiginformatieobjecten/"
+            f"{self.document.document_uuid}/download"
+        )
+
+    def _download(self, **headers):
+        response = self.client.get(self.url, headers={**AUDIT_HEADERS, **headers})
+        content = (
+            b"".join(response.streaming_content)
+            if response.streaming
+            else response.content
+        )
+        return response, content
+
+    def test_cache_miss_then_hit(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+
+        with self.subTest("cache miss"):
+            response, content = self._download()
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.streaming)
+            self.assertEqual(content, CONTENT)
+            self.assertEqual(m.call_count, 1)
+            cached_files = self._get_cached_files()
+            self.assertEqual(len(cached_files), 1)
+            self.assertEqual(cached_files[0].read_bytes(), CONTENT)
+
+        with self.subTest("cache hit"):
+            response, content = self._download()
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(
+                response["X-Accel-Redirect"],
+                "/private-media/document-content/"
+                f"{self.document.uuid}/{cached_files[0].name}",
+            )
+            self.assertEqual(content, b"")
+            self.assertEqual(response["ETag"], get_etag(self.document))
+            self.assertEqual(response["Accept-Ranges"], "bytes")
+            self.assertEqual(
+                response["Content-Disposition"], 'attachment; filename="report.pdf"'
+            )
+
+        with self.subTest("downloads are audited"):
+            self.assertEqual(
+                TimelineLogProxy.objects.filter(
+                    extra_data__event=Events.download
+                ).count(),
+                2,
+            )
+
+    @override_settings(SENDFILE_BACKEND="django_sendfile.backends.simple")
+    def test_serve_cached_file_without_reverse_proxy(self, m):
+        # the backend is resolved once and cached by django-sendfile2
+        _get_sendfile.cache_clear()
+        self.addCleanup(_get_sendfile.cache_clear)
+        m.get(self.upstream_url, content=CONTENT)
+        self._download()
+
+        response, content = self._download()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(content, CONTENT)
+        self.assertEqual(m.call_count, 1)
+
+    def test_not_modified_without_reading_cache(self, m):
+        response, _ = self._download(**{"If-None-Match": get_etag(self.document)})
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(self._get_cached_files(), [])
+
+    def test_documents_not_cached(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+        cases = (
+            ("concept", {"publicatiestatus": PublicationStatusOptions.concept}, {}),
+            ("cache disabled", {}, {"DOCUMENT_CONTENT_CACHE_MAX_SIZE": 0}),
+            ("too large", {}, {"DOCUMENT_CONTENT_CACHE_MAX_SIZE": len(CONTENT) - 1}),
+            ("incomplete", {"bestandsomvang": len(CONTENT) + 1}, {}),
+        )
+        for description, document_fields, settings in cases:
+            with self.subTest(description), override_settings(**settings):
+                Document.objects.filter(pk=self.document.pk).update(**document_fields)
+
+                response, content = self._download()
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(content, CONTENT)
+                self.assertEqual(self._get_cached_files(), [])
+
+    def test_range_requests_not_cached(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+
+        response, content = self._download(Range="bytes=0-99")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(content, CONTENT[:100])
+        self.assertEqual(self._get_cached_files(), [])
+
+    def test_modified_document_is_invalidated(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+        self._download()
+        self.assertEqual(len(self._get_cached_files()), 1)
+
+        self.document.officiele_titel = "changed"
+        self.document.save()
+
+        self.assertEqual(self._get_cached_files(), [])
+        response, content = self._download()
+        self.assertTrue(response.streaming)
+        self.assertEqual(content, CONTENT)
+        self.assertEqual(m.call_count, 2)
+
+    def test_deleted_document_is_invalidated(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+        self._download()
+
+        self.document.delete()
+
+        self.assertEqual(self._get_cached_files(), [])
+
+
+class ContentCacheTests(ContentCacheMixin, TestCase):
+    def _cache(self, document: Document) -> Path:
+        content = b"A" * document.bestandsomvang
+        b"".join(content_cache.cache_while_streaming(document, [content]))
+        path = content_cache.get_cached_file(document)
+        assert path is not None
+        return path
+
+    def test_interrupted_download_not_cached(self):
+        document = DocumentFactory.create(
+            publicatiestatus=PublicationStatusOptions.published, bestandsomvang=20
+        )
+        stream = content_cache.cache_while_streaming(document, [b"A" * 10] * 2)
+
+        next(stream)
+        stream.close()
+
+        self.assertIsNone(content_cache.get_cached_file(document))
+        self.assertEqual(self._get_cached_files(), [])
+
+    @override_settings(DOCUMENT_CONTENT_CACHE_MAX_SIZE=250)
+    def test_least_recently_used_files_are_evicted(self):
+        document1, document2, document3 = DocumentFactory.create_batch(
+            3,
+            publicatiestatus=PublicationStatusOptions.published,
+            bestandsomvang=100,
+        )
+        path1, path2 = self._cache(document1), self._cache(document2)
+        # document 1 was downloaded again after document 2
+        now = time.time()
+        os.utime(path2, (now - 60, now - 60))
+        os.utime(path1, (now - 30, now - 30))
+
+        path3 = self._cache(document3)
+
+        self.assertTrue(path1.exists())
+        self.assertFalse(path2.exists())
+        self.assertTrue(path3.exists())
+
+    @override_settings(DOCUMENT_CONTENT_CACHE_MAX_SIZE=250)
+    def test_cache_is_only_scanned_when_full(self):
+        documents = DocumentFactory.create_batch(
+            4,
+            publicatiestatus=PublicationStatusOptions.published,
+            bestandsomvang=100,
+        )
+
+        with patch.object(
+            content_cache, "evict", wraps=content_cache.evict
+        ) as mock_evict:
+            # the size is not tracked yet
+            self._cache(documents[0])
+            mock_evict.assert_called_once_with(225)
+            mock_evict.reset_mock()
+
+            self._cache(documents[1])
+            mock_evict.assert_not_called()
+
+            self._cache(documents[2])
+            mock_evict.assert_called_once_with(225)
+            mock_evict.reset_mock()
+
+            self._cache(documents[3])
+            mock_evict.assert_called_once_with(225)
+
+        self.assertEqual(len(self._get_cached_files()), 2)
+
+    def test_cache_hit_marks_file_as_recently_used(self):
+        document = DocumentFactory.create(
+            publicatiestatus=PublicationStatusOptions.published, bestandsomvang=10
+        )
+        path = self._cache(document)
+        os.utime(path, (0, 0))
+
+        content_cache.get_cached_file(document)
+
+        self.assertGreater(path.stat().st_mtime, 0)
+
+    def test_outdated_versions_are_removed(self):
+        document = DocumentFactory.create(
+            publicatiestatus=PublicationStatusOptions.published, bestandsomvang=10
+        )
+        old_path = self._cache(document)
+        # bypass the signals
+        Document.objects.filter(pk=document.pk).update(officiele_titel="changed")
+        document.refresh_from_db()
+        document.laatst_gewijzigd_datum = document.laatst_gewijzigd_datum.replace(
+            year=2000
+        )
+
+        new_path = self._cache(document)
+
+        self.assertNotEqual(old_path, new_path)
+        self.assertFalse(old_path.exists())
+        self.assertEqual(self._get_cached_files(), [new_path])
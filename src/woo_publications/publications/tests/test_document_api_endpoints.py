@@ -3,11 +3,14 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.http import StreamingHttpResponse
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
+import factory
 from freezegun import freeze_time
 from requests.exceptions import ConnectionError, HTTPError
 from rest_framework import status
@@ -17,8 +20,10 @@ from woo_publications.accounts.tests.factories import UserFactory
 from woo_publications.api.tests.mixins import (
     APIKeyUnAuthorizedMixin,
     APITestCaseMixin,
+    ConstantQueryCountMixin,
     TokenAuthMixin,
 )
+from woo_publications.config.cache import configuration_cache
 from woo_publications.config.models import GlobalConfiguration
 from woo_publications.contrib.documents_api.client import get_client
 from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
@@ -32,7 +37,7 @@ from woo_publications.metadata.tests.factories import (
 from woo_publications.utils.tests.vcr import VCRMixin
 
 from ..constants import DocumentActionTypeOptions, PublicationStatusOptions
-from ..models import Document
+from ..models import Document, DocumentFilePart
 from .factories import DocumentFactory, PublicationFactory
 
 AUDIT_HEADERS = {
@@ -89,7 +94,9 @@ class DocumentApiAuthorizationAndPermissionTests(APIKeyUnAuthorizedMixin, APITes
         self.assertWrongApiKeyProhibitsPostEndpointAccess(list_url)
 
 
-class DocumentApiReadTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
+class DocumentApiReadTestsCase(
+    TokenAuthMixin, APITestCaseMixin, ConstantQueryCountMixin, APITestCase
+):
     def test_list_documents(self):
         organisation = OrganisationFactory.create()
         publication = PublicationFactory.create(verantwoordelijke=organisation)
@@ -270,6 +277,99 @@ class DocumentApiReadTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
             data = response.json()
             self.assertEqual(data["count"], 2)
 
+    def test_list_documents_owner_resolved_in_bulk(self):
+        publication = PublicationFactory.create()
+
+        def _create_documents(amount: int) -> None:
+            for document in DocumentFactory.create_batch(
+                amount, publicatie=publication
+            ):
+                audit_api_create(
+                    content_object=document,
+                    user_id="123",
+                    user_display="blauw",
+                    object_data=serialize_instance(document),
+                    remarks="test",
+                )
+
+        def _count_audit_log_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    reverse("api:document-list"),
+                    {"page_size": 100},
+                    headers=AUDIT_HEADERS,
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for result in response.json()["results"]:
+                self.assertEqual(
+                    result["eigenaar"], {"weergaveNaam": "blauw", "identifier": "123"}
+                )
+            return sum(
+                "timeline_logger_timelinelog" in query["sql"]
+                for query in context.captured_queries
+            )
+
+        _create_documents(1)
+        num_queries_single = _count_audit_log_queries()
+        _create_documents(9)
+        num_queries_multiple = _count_audit_log_queries()
+
+        self.assertEqual(num_queries_single, num_queries_multiple)
+
+    def test_list_documents_constant_number_of_queries(self):
+        def _create_documents(amount: int) -> None:
+            for document in DocumentFactory.create_batch(
+                amount,
+                publicatie__verantwoordelijke=factory.SubFactory(OrganisationFactory),
+            ):
+                audit_api_create(
+                    content_object=document,
+                    user_id="123",
+                    user_display="blauw",
+                    object_data=serialize_instance(document),
+                    remarks="test",
+                )
+
+        self.assertListQueryCountIsConstant(
+            reverse("api:document-list"), _create_documents
+        )
+
+    def test_list_documents_cursor_pagination(self):
+        publication = PublicationFactory.create()
+        # documents created on the same date are ordered on their primary key
+        document, document2, document3 = DocumentFactory.create_batch(
+            3, publicatie=publication, creatiedatum="2024-09-24"
+        )
+        newest = DocumentFactory.create(
+            publicatie=publication, creatiedatum="2024-09-25"
+        )
+        DocumentFactory.create(publicatie=publication, creatiedatum="2024-09-23")
+
+        response = self.client.get(
+            reverse("api:document-list"),
+            # the cursor mode always uses its own ordering
+            {"cursor": "", "pageSize": 2, "sorteer": "creatiedatum"},
+            headers=AUDIT_HEADERS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["uuid"] for item in data["results"]],
+            [str(newest.uuid), str(document3.uuid)],
+        )
+
+        response = self.client.get(data["next"], headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [item["uuid"] for item in data["results"]],
+            [str(document2.uuid), str(document.uuid)],
+        )
+        self.assertIsNotNone(data["next"])
+
     def test_list_documents_filter_order(self):
         publication, publication2 = PublicationFactory.create_batch(2)
         with freeze_time("2024-09-25T12:30:00-00:00"):
@@ -1179,6 +1279,7 @@ class DocumentApiCreateTests(VCRMixin, TokenAuthMixin, APITestCase):
     def setUp(self):
         super().setUp()
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
 
     def _get_vcr_kwargs(self, **kwargs):
         kwargs.setdefault("ignore_hosts", ("invalid-domain",))
@@ -1248,6 +1349,10 @@ class DocumentApiCreateTests(VCRMixin, TokenAuthMixin, APITestCase):
                 "http://host.docker.internal:8000/api/v1/documenten/"
                 f"{document.uuid}/bestandsdelen/{file_parts[0]["uuid"]}",
             )
+            # the upload status of the file parts is tracked
+            file_part = DocumentFilePart.objects.get(document=document)
+            self.assertEqual(str(file_part.uuid), file_parts[0]["uuid"])
+            self.assertFalse(file_part.completed)
 
         # check that we can look up the document in the Open Zaak API:
         with (
@@ -1624,6 +1729,7 @@ class DocumentDownloadTests(VCRMixin, TokenAuthMixin, APITestCase):
     def setUp(self):
         super().setUp()
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
 
     def test_download_document(self):
         document = DocumentFactory.create(
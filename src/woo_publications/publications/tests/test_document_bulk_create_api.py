@@ -0,0 +1,338 @@
+import threading
+import time
+from datetime import date
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+from django.db import IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+from zgw_consumers.constants import APITypes
+
+from woo_publications.api.tests.mixins import TokenAuthMixin
+from woo_publications.config.cache import configuration_cache
+from woo_publications.config.models import GlobalConfiguration
+from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
+from woo_publications.logging.constants import Events
+from woo_publications.logging.models import TimelineLogProxy
+from woo_publications.metadata.tests.factories import (
+    InformationCategoryFactory,
+    OrganisationFactory,
+)
+
+from ..bulk_registration import register_documents
+from ..constants import DocumentActionTypeOptions
+from ..models import Document, Tombstone
+from .factories import PublicationFactory
+
+AUDIT_HEADERS = {
+    "AUDIT_USER_REPRESENTATION": "username",
+    "AUDIT_USER_ID": "id",
+    "AUDIT_REMARKS": "remark",
+}
+
+API_ROOT = "https://documenten.example.com/api/v1/"
+
+
+def _create_document_response(request, context):
+    document_uuid = uuid4()
+    context.status_code = 201
+    return {
+        "url": f"{API_ROOT}enkelvoudiginformatieobjecten/{document_uuid}",
+        "lock": f"lock-{request.json()['identificatie']}",
+        "bestandsdelen": [
+            {
+                "url": f"{API_ROOT}bestandsdelen/{uuid4()}",
+                "volgnummer": 1,
+                "omvang": request.json()["bestandsomvang"],
+            }
+        ],
+    }
+
+
+@requests_mock.Mocker()
+class DocumentBulkCreateTests(TokenAuthMixin, APITestCase):
+    url = reverse("api:document-bulk-create")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.service = ServiceFactory.create(api_root=API_ROOT, api_type=APITypes.drc)
+        config = GlobalConfiguration.get_solo()
+        config.documents_api_service = cls.service
+        config.organisation_rsin = "000000000"
+        config.save()
+
+        cls.information_category = InformationCategoryFactory.create()
+        cls.publication = PublicationFactory.create(
+            informatie_categorieen=[cls.information_category],
+            verantwoordelijke=OrganisationFactory.create(),
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
+
+    def _get_body(self, amount: int) -> list[dict]:
+        return [
+            {
+                "identifier": f"WOO-P/{index}",
+                "publicatie": str(self.publication.uuid),
+                "officieleTitel": f"Document {index}",
+                "creatiedatum": "2024-11-05",
+                "bestandsnaam": f"document-{index}.pdf",
+                "bestandsomvang": 10 + index,
+            }
+            for index in range(amount)
+        ]
+
+    def test_bulk_create_documents(self, m):
+        m.post(
+            f"{API_ROOT}enkelvoudiginformatieobjecten", json=_create_document_response
+        )
+        body = self._get_body(3)
+        body[1]["documenthandelingen"] = [
+            {"soortHandeling": DocumentActionTypeOptions.signed}
+        ]
+
+        response = self.client.post(self.url, data=body, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.json()
+        self.assertEqual(len(results), 3)
+        documents = {
+            str(document.uuid): document for document in Document.objects.all()
+        }
+        self.assertEqual(len(documents), 3)
+
+        for index, result in enumerate(results):
+            with self.subTest(index=index):
+                self.assertTrue(result["geregistreerd"])
+                self.assertEqual(result["foutmelding"], "")
+                data = result["document"]
+                self.assertEqual(data["officieleTitel"], f"Document {index}")
+                self.assertEqual(
+                    data["eigenaar"], {"weergaveNaam": "username", "identifier": "id"}
+                )
+                document = documents[data["uuid"]]
+                self.assertEqual(document.document_service, self.service)
+                self.assertIsNotNone(document.document_uuid)
+                self.assertEqual(document.lock, f"lock-{document.uuid}")
+                self.assertEqual(document.owner_identifier, "id")
+
+                file_parts = data["bestandsdelen"]
+                self.assertEqual(len(file_parts), 1)
+                self.assertQuerySetEqual(
+                    document.file_parts.values_list("uuid", "completed"),
+                    [(UUID(file_parts[0]["uuid"]), False)],
+                )
+                self.assertEqual(file_parts[0]["omvang"], 10 + index)
+                self.assertEqual(
+                    file_parts[0]["url"],
+                    f"http://testserver/api/v1/documenten/{document.uuid}"
+                    f"/bestandsdelen/{file_parts[0]['uuid']}",
+                )
+
+        with self.subTest("document actions"):
+            self.assertEqual(
+                results[1]["document"]["documenthandelingen"][0]["soortHandeling"],
+                DocumentActionTypeOptions.signed,
+            )
+            self.assertEqual(
+                results[0]["document"]["documenthandelingen"][0]["wasAssciatedWith"],
+                str(self.publication.verantwoordelijke.uuid),
+            )
+
+        with self.subTest("documents API requests"):
+            requests = m.request_history
+            self.assertEqual(len(requests), 3)
+            self.assertEqual(
+                {request.json()["identificatie"] for request in requests},
+                set(documents),
+            )
+            self.assertEqual(
+                requests[0].json()["informatieobjecttype"],
+                "http://testserver/catalogi/api/v1/informatieobjecttypen/"
+                f"{self.information_category.uuid}",
+            )
+
+        with self.subTest("audit logs"):
+            logs = TimelineLogProxy.objects.for_object(  # pyright: ignore[reportAttributeAccessIssue]
+                documents[results[0]["document"]["uuid"]]
+            )
+            self.assertEqual(logs.count(), 1)
+            log = logs.get()
+            assert log.extra_data is not None
+            self.assertEqual(log.extra_data["event"], Events.create)
+            self.assertEqual(
+                log.extra_data["acting_user"],
+                {"identifier": "id", "display_name": "username"},
+            )
+            self.assertEqual(log.extra_data["remarks"], "remark")
+            self.assertEqual(
+                log.extra_data["object_data"]["officiele_titel"], "Document 0"
+            )
+            self.assertEqual(TimelineLogProxy.objects.count(), 3)
+
+    def test_document_type_of_first_information_category(self, m):
+        m.post(
+            f"{API_ROOT}enkelvoudiginformatieobjecten", json=_create_document_response
+        )
+        # the order of the information categories differs from their ids
+        last, first = InformationCategoryFactory.create_batch(2)
+        first.top()
+        assert first.pk > last.pk
+        publication = PublicationFactory.create(informatie_categorieen=[last, first])
+        self.assertEqual(publication.informatie_categorieen.first(), first)
+        body = self._get_body(1)
+        body[0]["publicatie"] = str(publication.uuid)
+
+        response = self.client.post(self.url, data=body, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            m.last_request.json()["informatieobjecttype"],
+            "http://testserver/catalogi/api/v1/informatieobjecttypen/" f"{first.uuid}",
+        )
+
+    def test_documents_api_failure_is_reported_per_document(self, m):
+        def _callback(request, context):
+            if request.json()["titel"] == "Document 1":
+                context.status_code = 500
+                return {"detail": "Internal server error"}
+            return _create_document_response(request, context)
+
+        m.post(f"{API_ROOT}enkelvoudiginformatieobjecten", json=_callback)
+
+        response = self.client.post(
+            self.url, data=self._get_body(3), headers=AUDIT_HEADERS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.json()
+        self.assertEqual(
+            [result["geregistreerd"] for result in results], [True, False, True]
+        )
+        self.assertIsNone(results[1]["document"])
+        self.assertNotEqual(results[1]["foutmelding"], "")
+        self.assertEqual(
+            set(Document.objects.values_list("officiele_titel", flat=True)),
+            {"Document 0", "Document 2"},
+        )
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+        # the document that was never created is not reported as deleted
+        self.assertFalse(Tombstone.objects.exists())
+
+    def test_failing_insert_deletes_registered_documents(self, m):
+        created_urls = set()
+
+        def _callback(request, context):
+            response = _create_document_response(request, context)
+            created_urls.add(response["url"])
+            return response
+
+        m.post(f"{API_ROOT}enkelvoudiginformatieobjecten", json=_callback)
+        m.delete(requests_mock.ANY, status_code=204)
+
+        with (
+            patch.object(
+                Document.objects, "bulk_create", side_effect=IntegrityError("boom")
+            ),
+            self.assertRaises(IntegrityError),
+        ):
+            self.client.post(self.url, data=self._get_body(2), headers=AUDIT_HEADERS)
+
+        self.assertEqual(len(created_urls), 2)
+        deleted_urls = {
+            request.url for request in m.request_history if request.method == "DELETE"
+        }
+        self.assertEqual(deleted_urls, created_urls)
+        self.assertFalse(Document.objects.exists())
+
+    def test_invalid_document_creates_nothing(self, m):
+        body = self._get_body(2)
+        body[1]["publicatie"] = str(uuid4())
+
+        response = self.client.post(self.url, data=body, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()
+        self.assertEqual(errors[0], {})
+        self.assertIn("publicatie", errors[1])
+        self.assertFalse(m.called)
+        self.assertFalse(Document.objects.exists())
+
+    def test_invalid_bodies(self, m):
+        cases = (
+            ("empty", []),
+            ("too many documents", self._get_body(101)),
+            ("not a list", self._get_body(1)[0]),
+        )
+        for description, body in cases:
+            with self.subTest(description):
+                response = self.client.post(self.url, data=body, headers=AUDIT_HEADERS)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(m.called)
+        self.assertFalse(Document.objects.exists())
+
+    def test_constant_number_of_queries(self, m):
+        m.post(
+            f"{API_ROOT}enkelvoudiginformatieobjecten", json=_create_document_response
+        )
+        # warm up the caches
+        self.client.post(self.url, data=self._get_body(1), headers=AUDIT_HEADERS)
+
+        num_queries = {}
+        for amount in (1, 10):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.url, data=self._get_body(amount), headers=AUDIT_HEADERS
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            num_queries[amount] = len(context.captured_queries)
+
+        self.assertEqual(num_queries[1], num_queries[10])
+
+    @override_settings(DOCUMENTS_API_MAX_CONCURRENT_REQUESTS=2)
+    def test_concurrent_requests_are_bounded(self, m):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def _callback(request, context):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return _create_document_response(request, context)
+
+        m.post(f"{API_ROOT}enkelvoudiginformatieobjecten", json=_callback)
+        documents = [
+            Document(
+                publicatie=self.publication,
+                officiele_titel=f"Document {index}",
+                creatiedatum=date(2024, 11, 5),
+            )
+            for index in range(6)
+        ]
+
+        results = register_documents(
+            documents, build_absolute_uri=lambda path: f"http://testserver{path}"
+        )
+
+        self.assertTrue(all(result.registered for result in results))
+        self.assertEqual(m.call_count, 6)
+        self.assertLessEqual(max_in_flight, 2)
+        # the references are not saved
+        self.assertFalse(Document.objects.filter(document_uuid__isnull=False).exists())
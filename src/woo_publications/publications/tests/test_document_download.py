@@ -0,0 +1,255 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from django.utils.http import http_date
+
+import requests_mock
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import TokenAuthMixin
+from woo_publications.contrib.documents_api.client import client_pool
+from woo_publications.logging.constants import Events
+from woo_publications.logging.models import TimelineLogProxy
+
+from ..download import (
+    ByteRange,
+    UnsatisfiableRange,
+    get_chunk_size,
+    get_etag,
+    parse_range_header,
+)
+from .factories import DocumentFactory
+
+AUDIT_HEADERS = {
+    "AUDIT_USER_REPRESENTATION": "username",
+    "AUDIT_USER_ID": "id",
+    "AUDIT_REMARKS": "remark",
+}
+
+API_ROOT = "http://openzaak.docker.internal:8001/documenten/api/v1/"
+
+CONTENT = bytes(range(256)) * 80  # 20 kB
+
+
+class ParseRangeHeaderTests(SimpleTestCase):
+    def test_valid_ranges(self):
+        cases = (
+            ("bytes=0-99", ByteRange(start=0, end=99, size=1000)),
+            ("bytes=100-", ByteRange(start=100, end=999, size=1000)),
+            ("bytes=-100", ByteRange(start=900, end=999, size=1000)),
+            ("bytes=-2000", ByteRange(start=0, end=999, size=1000)),
+            ("bytes=900-2000", ByteRange(start=900, end=999, size=1000)),
+            (" bytes = 5 - 5 ", ByteRange(start=5, end=5, size=1000)),
+        )
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range_header(header, 1000), expected)
+
+    def test_ignored_ranges(self):
+        for header in (
+            "bytes=0-99,200-299",
+            "items=0-10",
+            "bytes=-",
+            "bytes=100-50",
+            "garbage",
+        ):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range_header(header, 1000))
+
+    def test_unsatisfiable_ranges(self):
+        for header in ("bytes=1000-", "bytes=2000-3000", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(UnsatisfiableRange):
+                    parse_range_header(header, 1000)
+
+    def test_byte_range_headers(self):
+        byte_range = ByteRange(start=100, end=199, size=1000)
+
+        self.assertEqual(byte_range.length, 100)
+        self.assertEqual(byte_range.range_header, "bytes=100-199")
+        self.assertEqual(byte_range.content_range_header, "bytes 100-199/1000")
+
+
+@override_settings(DOWNLOAD_MIN_CHUNK_SIZE=8_192, DOWNLOAD_MAX_CHUNK_SIZE=1_048_576)
+class ChunkSizeTests(SimpleTestCase):
+    def test_chunk_size_scales_with_file_size(self):
+        cases = (
+            (0, 8_192),
+            (1_000, 8_192),
+            (64 * 8_192, 8_192),
+            (64 * 8_192 + 1, 16_384),
+            (10_000_000, 262_144),
+            (64 * 1_048_576, 1_048_576),
+            (5_000_000_000, 1_048_576),
+        )
+        for size, expected in cases:
+            with self.subTest(size=size):
+                self.assertEqual(get_chunk_size(size), expected)
+
+    @override_settings(DOWNLOAD_MIN_CHUNK_SIZE=1_000, DOWNLOAD_MAX_CHUNK_SIZE=5_000)
+    def test_configured_bounds(self):
+        self.assertEqual(get_chunk_size(1), 1_000)
+        self.assertEqual(get_chunk_size(5_000_000_000), 5_000)
+
+
+@requests_mock.Mocker()
+class DocumentDownloadConditionalRequestTests(TokenAuthMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+        self.document = DocumentFactory.create(
+            with_registered_document=True,
+            bestandsomvang=len(CONTENT),
+            bestandsnaam="report.pdf",
+        )
+        self.url = reverse("api:document-download", kwargs={"uuid": self.document.uuid})
+        self.upstream_url = (
+            f"{API_ROOT}enkelvoudiginformatieobjecten/"
+            f"{self.document.document_uuid}/download"
+        )
+
+    def _get_download_logs(self):
+        return TimelineLogProxy.objects.filter(extra_data__event=Events.download)
+
+    def test_download_has_validators(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+
+        response = self.client.get(self.url, headers=AUDIT_HEADERS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT)
+        self.assertEqual(response["ETag"], get_etag(self.document))
+        self.assertEqual(
+            response["Last-Modified"],
+            http_date(self.document.laatst_gewijzigd_datum.timestamp()),
+        )
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertNotIn("Range", m.last_request.headers)
+        self.assertEqual(self._get_download_logs().count(), 1)
+
+    def test_etag_changes_with_document(self, m):
+        etag = get_etag(self.document)
+
+        self.document.officiele_titel = "changed"
+        self.document.save()
+
+        self.assertNotEqual(get_etag(self.document), etag)
+
+    def test_not_modified(self, m):
+        cases = (
+            ("If-None-Match", get_etag(self.document)),
+            (
+                "If-Modified-Since",
+                http_date(self.document.laatst_gewijzigd_datum.timestamp()),
+            ),
+        )
+        for header, value in cases:
+            with self.subTest(header=header):
+                response = self.client.get(
+                    self.url, headers={**AUDIT_HEADERS, header: value}
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response["ETag"], get_etag(self.document))
+                self.assertEqual(response.content, b"")
+
+        self.assertFalse(m.called)
+        self.assertFalse(self._get_download_logs().exists())
+
+    def test_modified(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+
+        response = self.client.get(
+            self.url, headers={**AUDIT_HEADERS, "If-None-Match": '"outdated"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT)
+
+    def test_range_forwarded_to_documents_api(self, m):
+        m.get(
+            self.upstream_url,
+            status_code=206,
+            content=CONTENT[1000:],
+            headers={
+                "Content-Range": f"bytes 1000-{len(CONTENT) - 1}/{len(CONTENT)}",
+                "Content-Length": str(len(CONTENT) - 1000),
+            },
+        )
+
+        response = self.client.get(
+            self.url, headers={**AUDIT_HEADERS, "Range": "bytes=1000-"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(
+            m.last_request.headers["Range"], f"bytes=1000-{len(CONTENT) - 1}"
+        )
+        self.assertEqual(
+            response["Content-Range"], f"bytes 1000-{len(CONTENT) - 1}/{len(CONTENT)}"
+        )
+        self.assertEqual(response["Content-Length"], str(len(CONTENT) - 1000))
+        self.assertEqual(b"".join(response.streaming_content), CONTENT[1000:])
+        # resuming a download is not audited as another download
+        self.assertFalse(self._get_download_logs().exists())
+
+    def test_range_selected_when_ignored_by_documents_api(self, m):
+        # the range spans multiple chunks read from the upstream response
+        m.get(self.upstream_url, content=CONTENT)
+
+        for header, expected in (
+            ("bytes=8000-16499", CONTENT[8000:16500]),
+            ("bytes=-100", CONTENT[-100:]),
+            ("bytes=0-0", CONTENT[:1]),
+        ):
+            with self.subTest(header=header):
+                response = self.client.get(
+                    self.url, headers={**AUDIT_HEADERS, "Range": header}
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+                content = b"".join(response.streaming_content)
+                self.assertEqual(content, expected)
+                self.assertEqual(response["Content-Length"], str(len(expected)))
+
+    def test_range_not_satisfiable(self, m):
+        response = self.client.get(
+            self.url, headers={**AUDIT_HEADERS, "Range": f"bytes={len(CONTENT)}-"}
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], f"bytes */{len(CONTENT)}")
+        self.assertFalse(m.called)
+
+    def test_if_range(self, m):
+        m.get(self.upstream_url, content=CONTENT)
+        last_modified = self.document.laatst_gewijzigd_datum.timestamp()
+        cases = (
+            (get_etag(self.document), status.HTTP_206_PARTIAL_CONTENT),
+            ('"outdated"', status.HTTP_200_OK),
+            (http_date(last_modified), status.HTTP_206_PARTIAL_CONTENT),
+            (http_date(last_modified - 3600), status.HTTP_200_OK),
+        )
+        for if_range, expected_status in cases:
+            with self.subTest(if_range=if_range):
+                response = self.client.get(
+                    self.url,
+                    headers={
+                        **AUDIT_HEADERS,
+                        "Range": "bytes=100-",
+                        "If-Range": if_range,
+                    },
+                )
+
+                self.assertEqual(response.status_code, expected_status)
+
+    def test_upstream_error(self, m):
+        m.get(self.upstream_url, status_code=404)
+
+        response = self.client.get(
+            self.url, headers={**AUDIT_HEADERS, "Range": "bytes=100-"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
@@ -0,0 +1,223 @@
+from datetime import timedelta
+from io import StringIO
+from uuid import uuid4
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.utils import timezone
+
+import requests_mock
+
+from woo_publications.contrib.documents_api.client import client_pool
+
+from ..models import Document, DocumentFilePart
+from .factories import DocumentFactory, DocumentFilePartFactory
+
+API_ROOT = "http://openzaak.docker.internal:8001/documenten/api/v1/"
+
+
+def _detail_response(document: Document, *, locked: bool, completed: list[bool]):
+    return {
+        "url": f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}",
+        "locked": locked,
+        "bestandsdelen": [
+            {
+                "url": f"{API_ROOT}bestandsdelen/{part.uuid}",
+                "volgnummer": part.order,
+                "omvang": part.size,
+                "voltooid": part_completed,
+            }
+            for part, part_completed in zip(
+                DocumentFilePart.objects.filter(document=document).order_by("order"),
+                completed,
+                # the file parts are discarded once the document is unlocked
+                strict=False,
+            )
+        ],
+    }
+
+
+@requests_mock.Mocker()
+class UploadPartDataTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+
+    def test_single_documents_api_request_per_part(self, m):
+        document = DocumentFactory.create(with_registered_document=True, lock="abc")
+        part1, part2, part3 = DocumentFilePartFactory.create_batch(3, document=document)
+        m.put(requests_mock.ANY, json={})
+        unlock_url = (
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}/unlock"
+        )
+        m.post(unlock_url, status_code=204)
+
+        for part, expected_completed in (
+            (part2, False),
+            (part1, False),
+            (part3, True),
+        ):
+            with self.subTest(part=part.order):
+                completed = document.upload_part_data(
+                    uuid=part.uuid, file=SimpleUploadedFile("part.bin", b"A" * 100)
+                )
+
+                self.assertEqual(completed, expected_completed)
+                part.refresh_from_db()
+                self.assertTrue(part.completed)
+
+        self.assertEqual(
+            [(request.method, request.url) for request in m.request_history],
+            [
+                ("PUT", f"{API_ROOT}bestandsdelen/{part2.uuid}"),
+                ("PUT", f"{API_ROOT}bestandsdelen/{part1.uuid}"),
+                ("PUT", f"{API_ROOT}bestandsdelen/{part3.uuid}"),
+                ("POST", unlock_url),
+            ],
+        )
+        self.assertEqual(m.last_request.json(), {"lock": "abc"})
+
+    def test_untracked_file_parts_checked_in_documents_api(self, m):
+        document = DocumentFactory.create(with_registered_document=True, lock="abc")
+        part_uuid = uuid4()
+        detail_url = f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}"
+        m.put(f"{API_ROOT}bestandsdelen/{part_uuid}", json={})
+        m.get(
+            detail_url,
+            json={
+                "url": detail_url,
+                "locked": True,
+                "bestandsdelen": [
+                    {
+                        "url": f"{API_ROOT}bestandsdelen/{part_uuid}",
+                        "volgnummer": 1,
+                        "omvang": 5,
+                        "voltooid": True,
+                    },
+                    {
+                        "url": f"{API_ROOT}bestandsdelen/{uuid4()}",
+                        "volgnummer": 2,
+                        "omvang": 5,
+                        "voltooid": False,
+                    },
+                ],
+            },
+        )
+
+        completed = document.upload_part_data(
+            uuid=part_uuid, file=SimpleUploadedFile("part.bin", b"aAaAa")
+        )
+
+        self.assertFalse(completed)
+        file_parts = DocumentFilePart.objects.filter(document=document).order_by(
+            "order"
+        )
+        self.assertEqual(
+            [(part.order, part.completed) for part in file_parts],
+            [(1, True), (2, False)],
+        )
+        # tracked from now on
+        self.assertEqual(file_parts[0].uuid, part_uuid)
+
+
+@requests_mock.Mocker()
+class ReconcileDocumentUploadsCommandTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+
+    def _create_document(self, minutes_ago: int = 120, **kwargs) -> Document:
+        document = DocumentFactory.create(with_registered_document=True, lock="abc")
+        Document.objects.filter(pk=document.pk).update(
+            registratiedatum=timezone.now() - timedelta(minutes=minutes_ago)
+        )
+        DocumentFilePartFactory.create_batch(2, document=document, **kwargs)
+        return document
+
+    def test_unlock_completely_uploaded_document(self, m):
+        document = self._create_document()
+        m.get(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}",
+            json=_detail_response(document, locked=True, completed=[True, True]),
+        )
+        m.post(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}/unlock",
+            status_code=204,
+        )
+        stdout = StringIO()
+
+        call_command("reconcile_document_uploads", stdout=stdout)
+
+        self.assertFalse(
+            DocumentFilePart.objects.filter(document=document, completed=False).exists()
+        )
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.json(), {"lock": "abc"})
+        self.assertIn("Completed the upload of 1 document(s)", stdout.getvalue())
+
+    def test_synchronize_incomplete_upload(self, m):
+        document = self._create_document()
+        m.get(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}",
+            json=_detail_response(document, locked=True, completed=[True, False]),
+        )
+
+        call_command("reconcile_document_uploads", stdout=StringIO())
+
+        file_parts = DocumentFilePart.objects.filter(document=document).order_by(
+            "order"
+        )
+        self.assertEqual([part.completed for part in file_parts], [True, False])
+        self.assertEqual(m.call_count, 1)
+
+    def test_already_unlocked_document(self, m):
+        document = self._create_document()
+        m.get(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}",
+            json=_detail_response(document, locked=False, completed=[]),
+        )
+
+        call_command("reconcile_document_uploads", stdout=StringIO())
+
+        self.assertFalse(
+            DocumentFilePart.objects.filter(document=document, completed=False).exists()
+        )
+        self.assertEqual(m.call_count, 1)
+
+    def test_skip_recent_and_completed_documents(self, m):
+        self._create_document(minutes_ago=5)
+        self._create_document(completed=True)
+
+        call_command("reconcile_document_uploads", stdout=StringIO())
+
+        self.assertFalse(m.called)
+
+    def test_failures_are_reported(self, m):
+        failing_document = self._create_document()
+        document = self._create_document()
+        m.get(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{failing_document.document_uuid}",
+            status_code=500,
+        )
+        m.get(
+            f"{API_ROOT}enkelvoudiginformatieobjecten/{document.document_uuid}",
+            json=_detail_response(document, locked=False, completed=[]),
+        )
+        stderr = StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command("reconcile_document_uploads", stdout=StringIO(), stderr=stderr)
+
+        self.assertIn(str(failing_document.uuid), stderr.getvalue())
+        # the other documents are still reconciled
+        self.assertFalse(
+            DocumentFilePart.objects.filter(document=document, completed=False).exists()
+        )
+
+    def test_invalid_min_age(self, m):
+        with self.assertRaisesMessage(
+            CommandError, "The minimum age must not be negative."
+        ):
+            call_command("reconcile_document_uploads", min_age=-1, stdout=StringIO())
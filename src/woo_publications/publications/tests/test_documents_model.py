@@ -6,6 +6,7 @@ from django.test import TestCase
 from zgw_consumers.constants import APITypes
 from zgw_consumers.test.factories import ServiceFactory
 
+from woo_publications.config.cache import configuration_cache
 from woo_publications.config.models import GlobalConfiguration
 
 from ..models import Document
@@ -53,6 +54,7 @@ class TestDocumentApi(TestCase):
 
     def test_register_document_expectedly_crashes_wihout_configuration(self):
         self.addCleanup(GlobalConfiguration.clear_cache)
+        self.addCleanup(configuration_cache.clear)
         config = GlobalConfiguration.get_solo()
         config.documents_api_service = None
         config.organisation_rsin = ""
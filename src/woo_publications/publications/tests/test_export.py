@@ -0,0 +1,188 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from woo_publications.api.tests.mixins import TokenAuthMixin
+from woo_publications.logging.logevent import audit_api_create
+from woo_publications.logging.serializing import serialize_instance
+from woo_publications.metadata.constants import InformationCategoryOrigins
+from woo_publications.metadata.tests.factories import (
+    InformationCategoryFactory,
+    OrganisationFactory,
+)
+
+from ..constants import PublicationStatusOptions
+from .factories import DocumentFactory, PublicationFactory
+
+AUDIT_HEADERS = {
+    "AUDIT_USER_REPRESENTATION": "username",
+    "AUDIT_USER_ID": "id",
+    "AUDIT_REMARKS": "remark",
+}
+
+
+def _parse_lines(content: bytes) -> list[dict]:
+    assert content.endswith(b"\n")
+    return [json.loads(line) for line in content.splitlines()]
+
+
+class PublicationExportApiTests(TokenAuthMixin, APITestCase):
+    def test_export_uses_api_layout(self):
+        ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list
+        )
+        publication = PublicationFactory.create(
+            informatie_categorieen=[ic],
+            verantwoordelijke=OrganisationFactory.create(),
+        )
+        audit_api_create(
+            content_object=publication,
+            user_id="123",
+            user_display="Henk",
+            object_data=serialize_instance(publication),
+            remarks="test",
+        )
+        document = DocumentFactory.create(
+            publicatie=publication, creatiedatum="2024-09-24"
+        )
+        document2 = DocumentFactory.create(
+            publicatie=publication, creatiedatum="2024-09-25"
+        )
+        publication2 = PublicationFactory.create(informatie_categorieen=[ic])
+
+        response = self.client.get(
+            reverse("api:publication-export"), headers=AUDIT_HEADERS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="publicaties.ndjson"',
+        )
+        lines = _parse_lines(b"".join(response.streaming_content))
+        self.assertEqual(len(lines), 2)
+
+        with self.subTest("publication layout"):
+            detail_response = self.client.get(
+                reverse("api:publication-detail", kwargs={"uuid": publication.uuid}),
+                headers=AUDIT_HEADERS,
+            )
+            documents = lines[1].pop("documenten")
+
+            self.assertEqual(lines[1], detail_response.json())
+            self.assertEqual(lines[1]["eigenaar"]["identifier"], "123")
+
+        with self.subTest("document layout"):
+            list_response = self.client.get(
+                reverse("api:document-list"),
+                {"publicatie": publication.uuid},
+                headers=AUDIT_HEADERS,
+            )
+
+            self.assertEqual(documents, list_response.json()["results"])
+            self.assertEqual(
+                [item["uuid"] for item in documents],
+                [str(document2.uuid), str(document.uuid)],
+            )
+
+        with self.subTest("publication without documents"):
+            self.assertEqual(lines[0]["uuid"], str(publication2.uuid))
+            self.assertEqual(lines[0]["documenten"], [])
+
+    def test_export_filters(self):
+        published = PublicationFactory.create(
+            publicatiestatus=PublicationStatusOptions.published
+        )
+        PublicationFactory.create(publicatiestatus=PublicationStatusOptions.concept)
+
+        response = self.client.get(
+            reverse("api:publication-export"),
+            {"publicatiestatus": PublicationStatusOptions.published},
+            headers=AUDIT_HEADERS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = _parse_lines(b"".join(response.streaming_content))
+        self.assertEqual([line["uuid"] for line in lines], [str(published.uuid)])
+
+    def test_export_constant_number_of_queries(self):
+        ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list
+        )
+
+        def _count_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    reverse("api:publication-export"), headers=AUDIT_HEADERS
+                )
+                b"".join(response.streaming_content)
+            return len(context.captured_queries)
+
+        DocumentFactory.create(publicatie__informatie_categorieen=[ic])
+        num_queries_single = _count_queries()
+        for _ in range(9):
+            DocumentFactory.create_batch(
+                2,
+                publicatie=PublicationFactory.create(
+                    informatie_categorieen=[ic],
+                    verantwoordelijke=OrganisationFactory.create(),
+                ),
+            )
+        num_queries_multiple = _count_queries()
+
+        self.assertEqual(num_queries_single, num_queries_multiple)
+
+
+class ExportPublicationsCommandTests(TestCase):
+    def test_export_to_stdout(self):
+        publication = PublicationFactory.create()
+        document = DocumentFactory.create(publicatie=publication)
+        stdout = StringIO()
+
+        call_command("export_publications", stdout=stdout)
+
+        lines = _parse_lines(stdout.getvalue().encode("utf-8"))
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["uuid"], str(publication.uuid))
+        self.assertEqual(lines[0]["documenten"][0]["uuid"], str(document.uuid))
+
+    def test_export_to_file_in_chunks(self):
+        publications = PublicationFactory.create_batch(5)
+        for publication in publications:
+            DocumentFactory.create(publicatie=publication)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "export.ndjson"
+            call_command(
+                "export_publications",
+                file_path=str(file_path),
+                chunk_size=2,
+                stdout=StringIO(),
+            )
+
+            lines = _parse_lines(file_path.read_bytes())
+
+        self.assertEqual(
+            [line["uuid"] for line in lines],
+            [str(publication.uuid) for publication in publications],
+        )
+        for line, publication in zip(lines, publications, strict=True):
+            self.assertEqual(line["documenten"][0]["publicatie"], str(publication.uuid))
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaisesMessage(
+            CommandError, "The chunk size must be a positive number."
+        ):
+            call_command("export_publications", chunk_size=0, stdout=StringIO())
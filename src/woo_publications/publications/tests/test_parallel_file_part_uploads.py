@@ -0,0 +1,169 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from zgw_consumers.constants import APITypes
+
+from woo_publications.api.tests.factories import TokenAuthFactory
+from woo_publications.api.tests.mixins import AUDIT_HEADERS
+from woo_publications.contrib.documents_api.client import client_pool
+from woo_publications.contrib.documents_api.tests.factories import ServiceFactory
+
+from ..models import DocumentFilePart
+from .factories import DocumentFactory, DocumentFilePartFactory
+
+
+class FakeDocumentsAPI(ThreadingHTTPServer):
+    """
+    Handle the file part uploads concurrently, tracking how many are in flight.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RequestHandler)
+        self.unlock_requests = 0
+        self.upload_barrier: threading.Barrier | None = None
+        self.uploads_in_flight = 0
+        self.peak_uploads_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def api_root(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/documenten/api/v1/"
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server: FakeDocumentsAPI
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        self._read_body()
+        server = self.server
+        with server.lock:
+            server.uploads_in_flight += 1
+            server.peak_uploads_in_flight = max(
+                server.peak_uploads_in_flight, server.uploads_in_flight
+            )
+        try:
+            if server.upload_barrier is not None:
+                server.upload_barrier.wait()
+        except threading.BrokenBarrierError:
+            self._respond(504, {})
+        else:
+            self._respond(200, {})
+        finally:
+            with server.lock:
+                server.uploads_in_flight -= 1
+
+    def do_POST(self):
+        self._read_body()
+        with self.server.lock:
+            self.server.unlock_requests += 1
+        self._respond(204)
+
+    def _read_body(self) -> None:
+        if "Content-Length" in self.headers:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            return
+        # chunked transfer encoding
+        while size := int(self.rfile.readline().strip(), 16):
+            self.rfile.read(size + 2)
+        self.rfile.readline()
+
+    def _respond(self, status_code: int, body: dict | None = None) -> None:
+        content = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ParallelFilePartUploadTests(TransactionTestCase):
+    """
+    Upload the file parts of a document concurrently.
+
+    The requests are handled in separate threads, each with their own database
+    connection, like concurrent requests to the application server.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(client_pool.clear)
+        self.token = TokenAuthFactory.create(read_write_permission=True).token
+
+        self.documents_api = FakeDocumentsAPI()
+        thread = threading.Thread(target=self.documents_api.serve_forever)
+        thread.start()
+        self.addCleanup(self.documents_api.server_close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.documents_api.shutdown)
+
+        self.service = ServiceFactory.create(
+            api_root=self.documents_api.api_root, api_type=APITypes.drc
+        )
+
+    def _upload_part(self, part: DocumentFilePart) -> bool:
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {self.token}")
+        endpoint = reverse(
+            "api:document-filepart-detail",
+            kwargs={"uuid": part.document.uuid, "part_uuid": part.uuid},
+        )
+        try:
+            response = client.put(
+                endpoint,
+                data={"inhoud": SimpleUploadedFile("part.bin", b"A" * part.size)},
+                format="multipart",
+                headers=AUDIT_HEADERS,
+            )
+        finally:
+            connection.close()
+        assert response.status_code == status.HTTP_200_OK, response.content
+        return response.json()["documentUploadVoltooid"]
+
+    def _upload_parts_concurrently(self, num_parts: int) -> list[bool]:
+        document = DocumentFactory.create(
+            document_service=self.service,
+            document_uuid=uuid4(),
+            lock="abc",
+        )
+        parts = DocumentFilePartFactory.create_batch(num_parts, document=document)
+
+        with ThreadPoolExecutor(max_workers=num_parts) as executor:
+            return list(executor.map(self._upload_part, parts))
+
+    def test_document_is_unlocked_exactly_once(self):
+        results = self._upload_parts_concurrently(8)
+
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(self.documents_api.unlock_requests, 1)
+        self.assertFalse(DocumentFilePart.objects.filter(completed=False).exists())
+
+    def test_parts_are_uploaded_concurrently(self):
+        for num_parts in (4, 8):
+            with self.subTest(num_parts=num_parts):
+                # the uploads are held until all parts are in flight - one at a time,
+                # the barrier times out and the uploads fail
+                self.documents_api.upload_barrier = threading.Barrier(
+                    num_parts, timeout=10
+                )
+                self.documents_api.peak_uploads_in_flight = 0
+                self.documents_api.unlock_requests = 0
+
+                results = self._upload_parts_concurrently(num_parts)
+
+                self.assertEqual(results.count(True), 1)
+                self.assertEqual(self.documents_api.peak_uploads_in_flight, num_parts)
+                self.assertEqual(self.documents_api.unlock_requests, 1)
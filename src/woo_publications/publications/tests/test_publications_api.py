@@ -2,9 +2,12 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
+import factory
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -13,9 +16,12 @@ from woo_publications.accounts.tests.factories import UserFactory
 from woo_publications.api.tests.mixins import (
     APIKeyUnAuthorizedMixin,
     APITestCaseMixin,
+    ConstantQueryCountMixin,
     TokenAuthMixin,
 )
+from woo_publications.logging.constants import Events
 from woo_publications.logging.logevent import audit_api_create
+from woo_publications.logging.models import TimelineLogProxy
 from woo_publications.logging.serializing import serialize_instance
 from woo_publications.metadata.constants import InformationCategoryOrigins
 from woo_publications.metadata.tests.factories import (
@@ -90,7 +96,9 @@ class PublicationApiAuthorizationAndPermissionTests(
         self.assertWrongApiKeyProhibitsDeleteEndpointAccess(detail_url)
 
 
-class PublicationApiTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
+class PublicationApiTestsCase(
+    TokenAuthMixin, APITestCaseMixin, ConstantQueryCountMixin, APITestCase
+):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
@@ -171,6 +179,79 @@ class PublicationApiTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
 
             self.assertEqual(data["results"][1], expected_second_item_data)
 
+    def test_list_publications_cursor_pagination(self):
+        with freeze_time("2024-09-24T12:00:00-00:00"):
+            # identical timestamps must not cause skipped or duplicated records
+            oldest, older = PublicationFactory.create_batch(2)
+        with freeze_time("2024-09-25T12:00:00-00:00"):
+            newest = PublicationFactory.create()
+        list_url = reverse("api:publication-list")
+
+        with self.subTest("first page"):
+            # token, publications and categories - no count query
+            with self.assertNumQueries(3):
+                response = self.client.get(
+                    list_url, {"cursor": "", "pageSize": 2}, headers=AUDIT_HEADERS
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]],
+                [str(newest.uuid), str(older.uuid)],
+            )
+            self.assertIsNotNone(data["next"])
+            next_url = data["next"]
+
+        with self.subTest("last page"):
+            response = self.client.get(next_url, headers=AUDIT_HEADERS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]], [str(oldest.uuid)]
+            )
+            self.assertIsNone(data["next"])
+
+        with self.subTest("records created while paging"):
+            PublicationFactory.create()
+
+            response = self.client.get(next_url, headers=AUDIT_HEADERS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]], [str(oldest.uuid)]
+            )
+
+        with self.subTest("filters are applied"):
+            response = self.client.get(
+                list_url,
+                {"cursor": "", "registratiedatumTot": "2024-09-25T00:00:00Z"},
+                headers=AUDIT_HEADERS,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(
+                [item["uuid"] for item in data["results"]],
+                [str(older.uuid), str(oldest.uuid)],
+            )
+            self.assertIsNone(data["next"])
+
+    def test_list_publications_invalid_cursor(self):
+        PublicationFactory.create()
+        list_url = reverse("api:publication-list")
+
+        for cursor in ("foo", "WzFd", "WyJmb28iLCAxXQ=="):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    list_url, {"cursor": cursor}, headers=AUDIT_HEADERS
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_list_publications_filter_order(self):
         ic, ic2 = InformationCategoryFactory.create_batch(
             2, oorsprong=InformationCategoryOrigins.value_list
@@ -721,6 +802,113 @@ class PublicationApiTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
             self.assertEqual(data["results"][0], expected_second_item_data)
             self.assertEqual(data["results"][1], expected_first_item_data)
 
+    def test_list_publications_filter_owner_not_backfilled(self):
+        publication, publication2 = PublicationFactory.create_batch(2)
+        for _publication, identifier in ((publication, "123"), (publication2, 456)):
+            # audit logs written before the owner was recorded on the publication
+            TimelineLogProxy.objects.create(
+                content_object=_publication,
+                extra_data={
+                    "event": Events.create,
+                    "acting_user": {
+                        "identifier": identifier,
+                        "display_name": "buurman",
+                    },
+                },
+            )
+        PublicationFactory.create(owner_identifier="123", owner_display_name="buurman")
+
+        with self.subTest("string identifier"):
+            response = self.client.get(
+                reverse("api:publication-list"),
+                {"eigenaar": "123"},
+                headers=AUDIT_HEADERS,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(data["count"], 2)
+            self.assertItemInResults(data["results"], "uuid", str(publication.uuid), 1)
+
+        with self.subTest("numeric identifier"):
+            response = self.client.get(
+                reverse("api:publication-list"),
+                {"eigenaar": "456"},
+                headers=AUDIT_HEADERS,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual(data["count"], 1)
+            self.assertEqual(data["results"][0]["uuid"], str(publication2.uuid))
+            self.assertEqual(
+                data["results"][0]["eigenaar"],
+                {"weergaveNaam": "buurman", "identifier": "456"},
+            )
+
+    def test_list_publications_owner_resolved_in_bulk(self):
+        def _create_publications(amount: int) -> None:
+            for publication in PublicationFactory.create_batch(amount):
+                audit_api_create(
+                    content_object=publication,
+                    user_id="123",
+                    user_display="buurman",
+                    object_data=serialize_instance(publication),
+                    remarks="test",
+                )
+
+        def _count_audit_log_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(
+                    reverse("api:publication-list"),
+                    {"page_size": 100},
+                    headers=AUDIT_HEADERS,
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            for result in response.json()["results"]:
+                self.assertEqual(
+                    result["eigenaar"], {"weergaveNaam": "buurman", "identifier": "123"}
+                )
+            return sum(
+                "timeline_logger_timelinelog" in query["sql"]
+                for query in context.captured_queries
+            )
+
+        _create_publications(1)
+        num_queries_single = _count_audit_log_queries()
+        _create_publications(9)
+        num_queries_multiple = _count_audit_log_queries()
+
+        self.assertEqual(num_queries_single, num_queries_multiple)
+
+    def test_list_publications_constant_number_of_queries(self):
+        custom_ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.custom_entry
+        )
+        value_list_ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list
+        )
+
+        def _create_publications(amount: int) -> None:
+            for publication in PublicationFactory.create_batch(
+                amount,
+                verantwoordelijke=factory.SubFactory(OrganisationFactory),
+                opsteller=factory.SubFactory(OrganisationFactory),
+                informatie_categorieen=[custom_ic, value_list_ic],
+            ):
+                audit_api_create(
+                    content_object=publication,
+                    user_id="123",
+                    user_display="buurman",
+                    object_data=serialize_instance(publication),
+                    remarks="test",
+                )
+
+        self.assertListQueryCountIsConstant(
+            reverse("api:publication-list"), _create_publications
+        )
+
     def test_list_publication_filter_publication_status(self):
         published = PublicationFactory.create(
             publicatiestatus=PublicationStatusOptions.published
@@ -883,6 +1071,34 @@ class PublicationApiTestsCase(TokenAuthMixin, APITestCaseMixin, APITestCase):
                 [str(self.inspannings_verplichting.uuid)],
             )
 
+    def test_list_publications_diwoo_informatie_categories_query_count(self):
+        custom_ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.custom_entry
+        )
+        value_list_ic = InformationCategoryFactory.create(
+            oorsprong=InformationCategoryOrigins.value_list
+        )
+        list_url = reverse("api:publication-list")
+
+        def count_category_queries() -> int:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(list_url, headers=AUDIT_HEADERS)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return sum(
+                "metadata_informationcategory" in query["sql"]
+                for query in context.captured_queries
+            )
+
+        PublicationFactory.create(informatie_categorieen=[custom_ic, value_list_ic])
+        num_queries_single = count_category_queries()
+
+        PublicationFactory.create_batch(
+            9, informatie_categorieen=[custom_ic, value_list_ic]
+        )
+        num_queries_multiple = count_category_queries()
+
+        self.assertEqual(num_queries_single, num_queries_multiple)
+
     @freeze_time("2024-09-24T12:00:00-00:00")
     def test_create_publication(self):
         ic, ic2 = InformationCategoryFactory.create_batch(
@@ -5,4 +5,11 @@ class UtilsConfig(AppConfig):
     name = "woo_publications.utils"
 
     def ready(self):
+        from django.core.checks import registry
+
+        from maykin_2fa.checks import check_middleware
+
         from . import checks  # noqa
+
+        # replaced by checks.check_otp_middleware
+        registry.registry.registered_checks.discard(check_middleware)
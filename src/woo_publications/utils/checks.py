@@ -5,7 +5,10 @@ from django.conf import settings
 from django.contrib.admin import ModelAdmin
 from django.core.checks import Error, Warning, register
 from django.forms import ModelForm
+from django.utils.module_loading import import_string
 
+from maykin_2fa.checks import check_middleware as check_maykin_2fa_middleware
+from maykin_2fa.middleware import OTPMiddleware
 from treebeard.forms import MoveNodeForm
 
 from woo_publications.config.admin import GlobalConfigurationAdmin
@@ -154,3 +157,21 @@ def check_model_admin_includes_logging_mixin(app_configs, **kwargs):  # pragma:
         )
 
     return errors
+
+
+@register()
+def check_otp_middleware(app_configs, **kwargs):
+    """
+    Check the OTP middleware like maykin_2fa, but accept subclasses of its middleware.
+
+    Under ASGI, the maykin_2fa OTP middleware is replaced by an async-capable
+    subclass, which the maykin_2fa check (replaced by this one, see
+    :meth:`woo_publications.utils.apps.UtilsConfig.ready`) doesn't accept.
+    """
+    errors = check_maykin_2fa_middleware(app_configs, **kwargs)
+    if any(
+        isinstance(middleware, type) and issubclass(middleware, OTPMiddleware)
+        for middleware in map(import_string, settings.MIDDLEWARE)
+    ):
+        errors = [error for error in errors if error.id != "maykin_2fa.E003"]
+    return errors
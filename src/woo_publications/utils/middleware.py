@@ -0,0 +1,127 @@
+"""
+Async-capable equivalents of third party middleware.
+
+Served by an ASGI server, Django runs synchronous-only middleware in a (shared)
+thread, which is then occupied until the rest of the middleware chain and the view
+have produced the response. Async views behind such a middleware hold a thread for
+their entire duration anyway. The middleware below behave like the originals, both
+in synchronous and asynchronous mode.
+
+They're only installed when the application is served by an ASGI server, see the
+``ASYNC_FILE_TRANSFERS`` setting.
+"""
+
+import functools
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.functional import SimpleLazyObject
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django_otp import DEVICE_ID_SESSION_KEY
+from django_otp.models import Device
+from djangorestframework_camel_case.middleware import (
+    CamelCaseMiddleWare as _CamelCaseMiddleware,
+)
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+from maykin_2fa.middleware import AnyUser, OTPMiddleware as _OTPMiddleware, is_verified
+from sessionprofile.middleware import (
+    SessionProfileMiddleware as _SessionProfileMiddleware,
+)
+
+__all__ = ["SessionProfileMiddleware", "OTPMiddleware", "CamelCaseMiddleware"]
+
+type GetResponse = Callable[[HttpRequest], HttpResponseBase]
+type AsyncGetResponse = Callable[[HttpRequest], Awaitable[HttpResponseBase]]
+
+
+class AsyncCapableMiddlewareMixin(ABC):
+    """
+    Run the middleware in async mode if the rest of the chain is async.
+
+    Implement :meth:`acall` for the async mode, the synchronous ``__call__`` of the
+    middleware is used otherwise.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse | AsyncGetResponse):
+        super().__init__(get_response)  # pyright: ignore[reportCallIssue]
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.acall(request)
+        return super().__call__(request)  # pyright: ignore[reportAttributeAccessIssue]
+
+    @abstractmethod
+    async def acall(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handle the request in async mode.
+        """
+        ...
+
+
+class SessionProfileMiddleware(AsyncCapableMiddlewareMixin, _SessionProfileMiddleware):
+    async def acall(self, request: HttpRequest) -> HttpResponseBase:
+        response = await self.get_response(request)
+        if hasattr(request, "session"):
+            await sync_to_async(self.store.save_session)(request)
+        return response
+
+
+def _verify_user(request: HttpRequest, user: AnyUser) -> AnyUser:
+    # Equivalent of the (private) maykin_2fa OTPMiddleware._verify_user, with the
+    # public API of django-otp and maykin-2fa.
+    user.otp_device = None  # pyright: ignore[reportAttributeAccessIssue]
+    user.backend = request.session.get(  # pyright: ignore[reportAttributeAccessIssue]
+        BACKEND_SESSION_KEY
+    )
+    user.is_verified = functools.partial(  # pyright: ignore[reportAttributeAccessIssue]
+        is_verified, user
+    )
+    if user.is_authenticated:
+        persistent_id = request.session.get(DEVICE_ID_SESSION_KEY)
+        device = Device.from_persistent_id(persistent_id) if persistent_id else None
+        if device is not None and device.user_id != user.pk:
+            device = None
+        if device is None and DEVICE_ID_SESSION_KEY in request.session:
+            del request.session[DEVICE_ID_SESSION_KEY]
+        user.otp_device = device  # pyright: ignore[reportAttributeAccessIssue]
+    return user
+
+
+class OTPMiddleware(AsyncCapableMiddlewareMixin, _OTPMiddleware):
+    async def acall(self, request: HttpRequest) -> HttpResponseBase:
+        # like the synchronous __call__, the user is verified lazily - no queries are
+        # performed here
+        if (user := getattr(request, "user", None)) is not None:
+            request.user = SimpleLazyObject(
+                functools.partial(_verify_user, request, user)
+            )
+        return await self.get_response(request)
+
+
+class CamelCaseMiddleware(AsyncCapableMiddlewareMixin, _CamelCaseMiddleware):
+    """
+    Underscoreize the query parameters, like
+    :class:`djangorestframework_camel_case.middleware.CamelCaseMiddleWare`.
+
+    drf-spectacular doesn't detect subclasses of the original middleware (its
+    ``issubclass`` check has the arguments the wrong way around), the query parameters
+    in the API schema are camelized by
+    :func:`woo_publications.api.drf_spectacular.hooks.camelize_parameters` instead.
+    """
+
+    async def acall(self, request: HttpRequest) -> HttpResponseBase:
+        request.GET = underscoreize(  # pyright: ignore[reportAttributeAccessIssue]
+            request.GET, **api_settings.JSON_UNDERSCOREIZE
+        )
+        return await self.get_response(request)
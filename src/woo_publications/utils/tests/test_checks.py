@@ -1,6 +1,10 @@
-from django.test import SimpleTestCase
+from django.conf import settings
+from django.core.checks.registry import registry
+from django.test import SimpleTestCase, override_settings
 
-from ..checks import check_docker_hostname_dns
+from maykin_2fa.checks import check_middleware
+
+from ..checks import check_docker_hostname_dns, check_otp_middleware
 
 
 class DockerHostNameCheckTests(SimpleTestCase):
@@ -10,3 +14,47 @@ class DockerHostNameCheckTests(SimpleTestCase):
         warnings = check_docker_hostname_dns(None)
 
         self.assertEqual(warnings, [])
+
+
+class OTPMiddlewareCheckTests(SimpleTestCase):
+    def _replace_middleware(self, original: str, replacement: str | None) -> list[str]:
+        middleware = list(settings.MIDDLEWARE)
+        index = middleware.index(original)
+        if replacement is None:
+            del middleware[index]
+        else:
+            middleware[index] = replacement
+        return middleware
+
+    def test_maykin_2fa_middleware(self):
+        self.assertEqual(check_otp_middleware(None), [])
+
+    def test_async_capable_subclass(self):
+        middleware = self._replace_middleware(
+            "maykin_2fa.middleware.OTPMiddleware",
+            "woo_publications.utils.middleware.OTPMiddleware",
+        )
+
+        with override_settings(MIDDLEWARE=middleware):
+            errors = check_otp_middleware(None)
+
+        self.assertEqual(errors, [])
+
+    def test_missing_middleware(self):
+        middleware = self._replace_middleware(
+            "maykin_2fa.middleware.OTPMiddleware", None
+        )
+
+        with override_settings(MIDDLEWARE=middleware):
+            errors = check_otp_middleware(None)
+
+        self.assertEqual(
+            [error.id for error in errors if error.id.startswith("maykin_2fa")],
+            ["maykin_2fa.E003"],
+        )
+
+    def test_replaces_maykin_2fa_check(self):
+        checks = registry.get_checks()
+
+        self.assertIn(check_otp_middleware, checks)
+        self.assertNotIn(check_middleware, checks)
@@ -0,0 +1,141 @@
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.base import SessionBase
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django_otp import DEVICE_ID_SESSION_KEY
+from djangorestframework_camel_case.middleware import CamelCaseMiddleWare
+from maykin_2fa.middleware import OTPMiddleware as Maykin2FAOTPMiddleware
+
+from woo_publications.accounts.tests.factories import UserFactory
+
+from ..middleware import CamelCaseMiddleware, OTPMiddleware, SessionProfileMiddleware
+
+
+def get_response(request: HttpRequest) -> HttpResponse:
+    return HttpResponse()
+
+
+async def aget_response(request: HttpRequest) -> HttpResponse:
+    return HttpResponse()
+
+
+class AsyncCapableMiddlewareTests(SimpleTestCase):
+    def test_sync_mode(self):
+        for middleware_class in (
+            SessionProfileMiddleware,
+            OTPMiddleware,
+            CamelCaseMiddleware,
+        ):
+            with self.subTest(middleware_class=middleware_class):
+                middleware = middleware_class(get_response)
+
+                self.assertFalse(iscoroutinefunction(middleware))
+
+    def test_async_mode(self):
+        for middleware_class in (
+            SessionProfileMiddleware,
+            OTPMiddleware,
+            CamelCaseMiddleware,
+        ):
+            with self.subTest(middleware_class=middleware_class):
+                middleware = middleware_class(aget_response)
+
+                self.assertTrue(iscoroutinefunction(middleware))
+
+    async def test_otp_middleware_verifies_user_lazily(self):
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        request.session = SessionBase()
+
+        await OTPMiddleware(aget_response)(request)
+
+        self.assertIsNone(request.user.otp_device)  # pyright: ignore
+        self.assertFalse(request.user.is_verified())  # pyright: ignore
+
+    async def test_camel_case_middleware_underscoreizes_query_parameters(self):
+        request = RequestFactory().get("/", {"informatieCategorieen": "abc"})
+
+        await CamelCaseMiddleware(aget_response)(request)
+
+        self.assertEqual(request.GET["informatie_categorieen"], "abc")
+
+    def test_camel_case_middleware_underscoreizes_query_parameters_sync(self):
+        request = RequestFactory().get("/", {"informatieCategorieen": "abc"})
+
+        CamelCaseMiddleware(get_response)(request)
+
+        self.assertEqual(request.GET["informatie_categorieen"], "abc")
+
+    def test_replacements_subclass_the_originals(self):
+        self.assertTrue(issubclass(CamelCaseMiddleware, CamelCaseMiddleWare))
+
+
+@override_settings(
+    MAYKIN_2FA_ALLOW_MFA_BYPASS_BACKENDS=[
+        "django.contrib.auth.backends.RemoteUserBackend"
+    ]
+)
+class OTPMiddlewareParityTests(TestCase):
+    """
+    The async mode verifies the user like the maykin_2fa middleware does.
+    """
+
+    def _verify(self, middleware_class, user, session_data: dict):
+        request = RequestFactory().get("/")
+        request.user = user
+        request.session = SessionBase()
+        request.session.update(session_data)
+
+        if middleware_class is OTPMiddleware:
+            async_to_sync(middleware_class(aget_response))(request)
+        else:
+            middleware_class(get_response)(request)
+
+        verified_user = request.user
+        return (
+            verified_user.otp_device,  # pyright: ignore[reportAttributeAccessIssue]
+            verified_user.is_verified(),  # pyright: ignore[reportAttributeAccessIssue]
+            verified_user.backend,  # pyright: ignore[reportAttributeAccessIssue]
+            DEVICE_ID_SESSION_KEY in request.session,
+        )
+
+    def test_same_verification_as_maykin_2fa(self):
+        user, other_user = UserFactory.create_batch(2)
+        device = user.totpdevice_set.create()
+        other_device = other_user.totpdevice_set.create()
+        backend = "django.contrib.auth.backends.ModelBackend"
+        bypass_backend = "django.contrib.auth.backends.RemoteUserBackend"
+
+        cases = (
+            ("anonymous", lambda: AnonymousUser(), {}),
+            ("without device", lambda: user, {BACKEND_SESSION_KEY: backend}),
+            (
+                "verified",
+                lambda: user,
+                {
+                    BACKEND_SESSION_KEY: backend,
+                    DEVICE_ID_SESSION_KEY: device.persistent_id,
+                },
+            ),
+            (
+                "device of other user",
+                lambda: user,
+                {
+                    BACKEND_SESSION_KEY: backend,
+                    DEVICE_ID_SESSION_KEY: other_device.persistent_id,
+                },
+            ),
+            ("bypassed", lambda: user, {BACKEND_SESSION_KEY: bypass_backend}),
+        )
+        for description, get_user, session_data in cases:
+            with self.subTest(description):
+                expected = self._verify(
+                    Maykin2FAOTPMiddleware, get_user(), session_data
+                )
+
+                result = self._verify(OTPMiddleware, get_user(), session_data)
+
+                self.assertEqual(result, expected)
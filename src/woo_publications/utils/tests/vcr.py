@@ -1,9 +1,13 @@
 import inspect
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from vcr.unittest import VCRMixin as _VCRMixin
 
+from woo_publications.contrib.documents_api.client import client_pool
+from woo_publications.metadata import value_list_client
+
 RECORD_MODE = os.environ.get("VCR_RECORD_MODE", "none")
 
 
@@ -16,6 +20,17 @@ class VCRMixin(_VCRMixin):
 
     _testMethodName: str
 
+    def setUp(self):
+        super().setUp()
+        # connections kept alive by pooled clients may not be used outside the cassette
+        self.addCleanup(client_pool.clear)
+        self.addCleanup(value_list_client.session.close)
+        # vcrpy temporarily unpatches the connection classes while it creates a
+        # connection, which lets concurrent requests through to the network
+        patcher = patch.object(value_list_client, "MAX_WORKERS", 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _get_cassette_library_dir(self):
         class_name = self.__class__.__qualname__
         path = Path(inspect.getfile(self.__class__))